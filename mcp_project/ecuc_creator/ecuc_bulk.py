@@ -0,0 +1,103 @@
+"""
+@author GUU8HC
+Bulk ECUC container creation
+"""
+
+from time import perf_counter
+
+from mcp_project.utils.generic_utils import export2json, unique_output_path
+from mcp_project.utils.logging_utils import get_logger
+from mcp_project.ecuc_creator.ecuc_configurator import ECUCConfiguratorV2
+from mcp_project.ecuc_creator.ecuc_settings import ECUC_OUTPUT_DIR
+from mcp_project.paramdef_handler.paramdef_validator import (
+    ParamDefValidator,
+    get_paramdef_validator,
+)
+
+logger = get_logger(__name__)
+
+
+def _validate_entry(idx: int, entry, validator) -> tuple:
+    """
+    Validate one bulk entry against the ParamDef.
+
+    Returns (normalized_entry, errors). The normalized entry uses the
+    canonical definition path, parameter names and coerced values; without
+    a `validator` only the shape of the entry is checked.
+    """
+    if not isinstance(entry, dict):
+        return None, [{"entry": idx, "error": "Entry must be an object with 'path', 'names' and 'parameters'"}]
+
+    path = entry.get("path")
+    names = entry.get("names") or {}
+    parameters = entry.get("parameters") or {}
+    if not isinstance(path, str) or not path.strip("/"):
+        return None, [{"entry": idx, "error": "Missing definition 'path'"}]
+    if not isinstance(names, dict) or not isinstance(parameters, dict):
+        return None, [{"entry": idx, "path": path, "error": "'names' and 'parameters' must be objects"}]
+
+    if validator is None:
+        return {"path": path, "names": {k.lower(): v for k, v in names.items()}, "parameters": parameters}, []
+
+    result = validator.validate(path, parameters)
+    errors = [{"entry": idx, **err} for err in result["errors"]]
+    normalized = {
+        "path": result["definition_path"],
+        "names": {k.lower(): v for k, v in names.items()},
+        "parameters": result["parameters"],
+    }
+    return normalized, errors
+
+
+def validate_entries(entries: list, index=None) -> tuple:
+    """
+    Validate all bulk entries in one pass; returns (normalized_entries, errors).
+
+    Like `create_ecuc_container_with_parameters`, entries are taken as
+    given when no ParamDef module is indexed.
+    """
+    validator = ParamDefValidator(index) if index is not None else get_paramdef_validator()
+    if not validator.index.modules():
+        logger.debug("No ParamDef modules indexed, skipping validation of %d entries", len(entries))
+        validator = None
+    normalized, errors = [], []
+    for idx, entry in enumerate(entries):
+        result, entry_errors = _validate_entry(idx, entry, validator)
+        errors.extend(entry_errors)
+        if result is not None and not entry_errors:
+            normalized.append(result)
+    return normalized, errors
+
+
+def create_ecuc_containers_bulk(entries: list, index=None, out_dir: str = ECUC_OUTPUT_DIR) -> dict:
+    """
+    Validate and create many ECUC containers, writing one consolidated file.
+
+    Nothing is written if any entry fails validation; all errors are reported
+    together so the caller can fix them in a single retry.
+    """
+    start = perf_counter()
+    normalized, errors = validate_entries(entries, index)
+    if errors:
+        return {
+            "created": 0,
+            "errors": errors,
+            "elapsed_seconds": perf_counter() - start,
+        }
+
+    configurator = ECUCConfiguratorV2()
+    configurator.create_containers(normalized)
+    data = configurator.get_data()
+
+    filename = unique_output_path(out_dir, "ecuc_containers_")
+    export2json(str(filename), data)
+
+    elapsed = perf_counter() - start
+    throughput = len(data) / elapsed if elapsed > 0 else float(len(data))
+    logger.info("Created %d containers in %.3fs (%.1f containers/s)", len(data), elapsed, throughput)
+    return {
+        "created": len(data),
+        "file": str(filename),
+        "elapsed_seconds": elapsed,
+        "containers_per_second": throughput,
+    }
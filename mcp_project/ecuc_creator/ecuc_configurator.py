@@ -5,15 +5,21 @@
 import json
 from pathlib import Path
 
-from mcp_project.utils.generic_utils import info, debug, error, export2json
-from mcp_project.mcp_settings import DEBUG
+from mcp_project.utils.generic_utils import export2json, deep_merge
+from mcp_project.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
 
 class ECUCConfigurator:
     """
     A generator class for ECUC configuration generation in JSON format.
+
+    With a `completer` (`PathCompleter`), `configure` checks every segment
+    of the path against the ParamDef (case-insensitively) and raises
+    ValueError for an unknown one. The output keeps the caller's spelling.
     """
-    def __init__(self):
-        pass
+    def __init__(self, completer=None):
+        self._completer = completer
 
     def __decide_name(self, part: str, names: dict) -> str:
         """
@@ -23,15 +29,25 @@ class ECUCConfigurator:
         """
         if part.lower() in names.keys():
             name = names[part.lower()]
-            if DEBUG:
-                debug(f"Found name '{name}' for part '{part}'")
+            logger.debug("Found name '%s' for part '%s'", name, part)
         else:
             name = part
-            if DEBUG:
-                debug(f"No name found for part '{part}', using default '{name}'")
+            logger.debug("No name found for part '%s', using default '%s'", part, name)
         return name
 
+    def __check_path(self, path: str):
+        checked = self._completer.check_path(path)
+        if not checked["valid"]:
+            parent = checked.get("parent") or "the ParamDef modules"
+            message = f"Unknown definition path '{path}': no '{checked.get('invalid_segment', '')}' under {parent}"
+            if checked.get("suggestions"):
+                message += f", did you mean: {', '.join(checked['suggestions'])}?"
+            raise ValueError(message)
+        logger.debug("Path '%s' exists as '%s'", path, checked["definition_path"])
+
     def configure(self, path: str, names: dict):
+        if self._completer is not None:
+            self.__check_path(path)
         parts = list(filter(None, path.split('/')))[::-1]
         dict = {}
 
@@ -67,21 +83,20 @@ class ECUCConfigurator:
         - if both values are dicts, merge recursively
         - otherwise, b's value overwrites a's
         """
-        for k, v in b.items():
-            if k in a and isinstance(a[k], dict) and isinstance(v, dict):
-                self._deep_merge(a[k], v)
-            else:
-                a[k] = v
-        return a
+        return deep_merge(a, b)
 
     def save_or_merge(self, filename: str, config: dict) -> None:
-        """Save `config` to `filename`. If the file exists, load and merge first."""
+        """Save `config` to `filename`. If the file exists, load and merge first.
+
+        This rewrites the whole file on every call; for repeated creations use
+        `ECUCConfigStore` which appends to an operation log instead.
+        """
         out_path = Path(filename)
         if out_path.exists():
             try:
                 existing = json.loads(out_path.read_text())
             except Exception as e:
-                error(f"Failed to read existing JSON '{out_path}': {e}")
+                logger.error("Failed to read existing JSON '%s': %s", out_path, e)
                 existing = {}
 
             merged = self._deep_merge(existing, config)
@@ -127,6 +142,23 @@ class ECUCConfiguratorV2:
             "parameters": param_dict
         }
 
+    def create_containers(self, entries: list):
+        """
+        Build one container per entry in a single pass.
+
+        Each entry is a dict with `path`, `names` and optional `parameters`;
+        the resulting list of containers replaces the configurator data.
+        """
+        containers = []
+        for entry in entries:
+            self.create_container_with_parameter(
+                entry["path"],
+                entry.get("names", {}),
+                entry.get("parameters") or {}
+            )
+            containers.append(self._data)
+        self._data = containers
+
     def get_data(self):
         return self._data
 
@@ -0,0 +1,11 @@
+# Output directory for generated ECUC containers
+ECUC_OUTPUT_DIR = "_out"
+
+# ECUC configuration store
+ECUC_CONFIG_FILE = "_out/ecuc_config.json"
+ECUC_OPLOG_SUFFIX = ".oplog.jsonl"
+ECUC_LOCK_SUFFIX = ".lock"
+ECUC_LOCK_TIMEOUT = 10.0
+
+# Compact the operation log into the merged JSON after this many appends
+ECUC_COMPACT_THRESHOLD = 500
@@ -0,0 +1,133 @@
+"""
+@author GUU8HC
+Append-only ECUC configuration store
+"""
+
+import os
+import json
+from pathlib import Path
+
+from mcp_project.utils.generic_utils import export2json, deep_merge
+from mcp_project.utils.logging_utils import get_logger
+from mcp_project.utils.file_lock import FileLock
+from mcp_project.ecuc_creator.ecuc_settings import (
+    ECUC_OPLOG_SUFFIX,
+    ECUC_LOCK_SUFFIX,
+    ECUC_LOCK_TIMEOUT,
+    ECUC_COMPACT_THRESHOLD,
+)
+
+logger = get_logger(__name__)
+
+class ECUCConfigStore:
+    """
+    ECUC configuration store backed by an append-only operation log.
+
+    Every created configuration is appended as one JSON line to
+    `<filename>.oplog.jsonl`, which costs O(size of the entry) regardless of
+    how many containers were created before. The merged JSON at `filename`
+    is only rebuilt by `compact()`, either on demand, at batch end, or
+    automatically once `compact_threshold` entries have been appended.
+
+    All file access happens under a lock file so concurrent tool calls
+    (threads or server processes) cannot corrupt the log or the output.
+    """
+    def __init__(self, filename, compact_threshold: int = ECUC_COMPACT_THRESHOLD):
+        self._out_path = Path(filename)
+        self._log_path = Path(str(self._out_path) + ECUC_OPLOG_SUFFIX)
+        self._lock = FileLock(str(self._out_path) + ECUC_LOCK_SUFFIX, timeout=ECUC_LOCK_TIMEOUT)
+        self._compact_threshold = compact_threshold
+        self._appended = 0
+
+    @property
+    def path(self) -> Path:
+        return self._out_path
+
+    @property
+    def log_path(self) -> Path:
+        return self._log_path
+
+    def append(self, config: dict) -> None:
+        """Record `config` in the operation log without touching the merged file."""
+        self.extend([config])
+
+    def extend(self, configs: list) -> None:
+        """Record several configurations with a single locked write."""
+        if not configs:
+            return
+        lines = "".join(json.dumps(c, separators=(",", ":")) + "\n" for c in configs)
+        with self._lock:
+            self._out_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._log_path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            self._appended += len(configs)
+            if self._compact_threshold and self._appended >= self._compact_threshold:
+                self.compact()
+
+    def _read_log(self) -> list:
+        if not self._log_path.exists():
+            return []
+        entries = []
+        with open(self._log_path, "r", encoding="utf-8") as f:
+            for lineno, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    # A torn trailing line from a crashed writer must not
+                    # invalidate the entries recorded before it
+                    logger.error("Skipping corrupt entry %d in '%s': %s", lineno, self._log_path, e)
+        return entries
+
+    def _read_merged(self) -> dict:
+        if not self._out_path.exists():
+            return {}
+        try:
+            return json.loads(self._out_path.read_text())
+        except Exception as e:
+            logger.error("Failed to read existing JSON '%s': %s", self._out_path, e)
+            return {}
+
+    def pending(self) -> int:
+        """Number of log entries not yet compacted into the merged file."""
+        with self._lock:
+            return len(self._read_log())
+
+    def load(self) -> dict:
+        """Return the merged configuration (file + pending log) without writing."""
+        with self._lock:
+            merged = self._read_merged()
+            for entry in self._read_log():
+                deep_merge(merged, entry)
+            return merged
+
+    def compact(self) -> dict:
+        """
+        Replay the operation log into the merged JSON file and truncate the log.
+
+        The merged file is written to a temporary sibling and atomically
+        renamed, so readers never observe a half-written file.
+        """
+        with self._lock:
+            entries = self._read_log()
+            merged = self._read_merged()
+            if not entries:
+                self._appended = 0
+                return merged
+
+            for entry in entries:
+                deep_merge(merged, entry)
+
+            self._out_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._out_path.with_name(self._out_path.name + ".tmp")
+            export2json(str(tmp_path), merged, use_tabs=True)
+            os.replace(tmp_path, self._out_path)
+            if self._log_path.exists():
+                self._log_path.unlink()
+            self._appended = 0
+            logger.info("Compacted %d entries into %s", len(entries), self._out_path)
+            return merged
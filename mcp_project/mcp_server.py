@@ -4,48 +4,55 @@ MCP Server
 """
 
 # Standard imports
+import atexit
 from fastmcp import FastMCP
-from datetime import datetime
 
 # Import MCP settings
-from mcp_transport_configurator import configure_mcp
-from mcp_settings import SETTINGS, PROTOCOL, STDIO, SSE, PORT, DESCRIPTION, DOCSTRING
+from mcp_settings import SETTINGS, PROTOCOL, STDIO, SSE, PORT, METRICS_FILE
 
 # Import tools
-from utils.generic_utils import get_precise_time, export2json, load_json
-from paramdef_handler.paramdef_arxml2json import convert_paramdef_to_json
-from paramdef_handler .paramdef_utils import (
-    get_definition_files,
-    get_definition_path_difflib,
-    get_definition_path_rapidfuzz
-)
+# Heavy modules (rapidfuzz, difflib, the ARXML converter, the ECUC model)
+# are imported inside the tools on first use to keep startup fast
+from mcp_project.utils.tool_descriptions import tool_description
+from mcp_project.utils.metrics import METRICS, timed
+from mcp_project.utils.profiler import profiled, profile_next_call
+from mcp_project.utils.scheduler import scheduled, CHEAP, HEAVY
+from mcp_project.utils.logging_utils import configure_logging
+from mcp_project.utils.session_recorder import SessionRecorder, record_file
+from mcp_project.ecuc_creator.ecuc_store import ECUCConfigStore
+from mcp_project.ecuc_creator.ecuc_settings import ECUC_CONFIG_FILE, ECUC_OUTPUT_DIR
 
 
+# Package logs go to stderr (or LOG_FILE); stdout carries the STDIO protocol
+configure_logging()
+
 # create application
 app = FastMCP()
 
+# Tool calls are logged for replay only when a record file is configured
+if record_file():
+    app.add_middleware(SessionRecorder(record_file()))
+
+# ECUC configurations are appended to an operation log and compacted into
+# ECUC_CONFIG_FILE on demand, at batch end and on shutdown
+ecuc_store = ECUCConfigStore(ECUC_CONFIG_FILE)
+
 
 # Tool listing
-@app.tool(
-    description=f"{
-        load_json(
-            'mcp_project/mcp_function_descriptions/get_precise_time.json'
-            )[DESCRIPTION]
-        }"
-)
+@app.tool(description=tool_description("get_precise_time"))
+@timed("tool.get_precise_time")
+@profiled("get_precise_time")
 def get_precise_time():
     """
     Get the precise time up to microsecond precision.
     """
-    return get_precise_time()
+    from mcp_project.utils.generic_utils import get_precise_time as precise_time
+
+    return precise_time()
 
-@app.tool(
-    description=f"{
-        load_json(
-            'mcp_project/mcp_function_descriptions/get_response_instructions.json'
-            )[DESCRIPTION]
-        }"
-)
+@app.tool(description=tool_description("get_response_instructions"))
+@timed("tool.get_response_instructions")
+@profiled("get_response_instructions")
 def get_response_instructions():
     """
     Get response instructions for CoPilot from a given prompt.
@@ -69,13 +76,9 @@ def get_response_instructions():
     """
     return instructions
 
-@app.tool(
-    description=f"{
-        load_json(
-            'mcp_project/mcp_function_descriptions/get_task_instructions.json'
-            )[DESCRIPTION]
-        }"
-)
+@app.tool(description=tool_description("get_task_instructions"))
+@timed("tool.get_task_instructions")
+@profiled("get_task_instructions")
 def get_task_instructions():
     """
     Get instructions for some specific common tasks.
@@ -93,53 +96,134 @@ def get_task_instructions():
             If parameters are provided, ensure they are included in the creation process.
             If no parameters are specified, proceed with default settings.
             The user may provide parameters with incorrect names.
-            Therefore those parameters must be validated using mcp tools such as
+            Use `correct_definition_name` first to fix typos in a name;
+            otherwise those parameters must be validated using mcp tools such as
             `get_precise_definition_path_using_rapidfuzz` to get the correct definition path,
             or `get_definition_file_from_keyword` to get the definition file
             and use `parse_paramdef_to_json` to read its content
             to retrieve the correct parameter names before proceeding.
+            When the user gives only a value (e.g. 'IMMEDIATE processing'),
+            use `find_parameters_by_value` to find the parameter it belongs to.
+            To build a definition path, use `complete_definition_path`
+            one segment at a time instead of guessing it.
+            To learn which containers, parameters or enumerations a module has,
+            use `get_paramdef_summary` instead of parsing the whole module.
             To avoid multiple files, create all related containers in a single request.
+            When more than one container is needed, use `create_ecuc_containers_bulk`
+            with one entry per container instead of calling
+            `create_ecuc_container_with_parameters` repeatedly.
             """
         ),
     }
     return instructions
 
-@app.tool(
-    description=f"{
-        load_json(
-            'mcp_project/mcp_function_descriptions/get_definition_file_from_keyword.json'
-            )[DESCRIPTION]
-        }"
-)
+@app.tool(description=tool_description("get_definition_file_from_keyword"))
+@timed("tool.get_definition_file_from_keyword")
+@scheduled(HEAVY)
+@profiled("get_definition_file_from_keyword")
 def get_definition_file_from_keyword(keyword: str):
     """
     Get the file contains generic knowledge
     such as parameter definition, definition path, multiplicity, etc.
     for a given keyword from param definition JSON files.
     """
+    from mcp_project.paramdef_handler.paramdef_utils import get_definition_files
+
     return get_definition_files(keyword)
 
-@app.tool(
-    description=f"{
-        load_json(
-            'mcp_project/mcp_function_descriptions/parse_paramdef_to_json.json'
-            )[DESCRIPTION]
-        }"
-)
+@app.tool(description=tool_description("parse_paramdef_to_json"))
+@timed("tool.parse_paramdef_to_json")
+@scheduled(HEAVY)
+@profiled("parse_paramdef_to_json")
 def parse_paramdef_to_json(file_path: str):
     """
     Parse Parameter Defnition (ParamDef) from ARXML file to JSON.
     """
-    json_data = convert_paramdef_to_json(file_path)
+    from mcp_project.paramdef_handler.paramdef_module_cache import get_module_cache
+
+    json_data = get_module_cache().get(file_path)
     return json_data
 
-@app.tool(
-    description=f"{
-        load_json(
-            'mcp_project/mcp_function_descriptions/get_precise_definition_path_using_difflib.json'
-            )[DESCRIPTION]
-        }"
-)
+@app.tool(description=tool_description("get_paramdef_summary"))
+@timed("tool.get_paramdef_summary")
+@scheduled(CHEAP, cold=HEAVY)
+@profiled("get_paramdef_summary")
+def get_paramdef_summary(module_name: str = ""):
+    """
+    Get precomputed shape facts of a ParamDef module: definition counts per
+    type, depth, containers with multiplicities, enumeration literal counts.
+    Without `module_name`, get an overview of all modules.
+    """
+    from mcp_project.paramdef_handler.paramdef_utils import get_all_paramdef_files
+    from mcp_project.paramdef_handler.paramdef_summary import get_summary_cache, corpus_summary
+
+    summaries = get_summary_cache().summaries(get_all_paramdef_files())
+    if not module_name:
+        return corpus_summary(summaries)
+    for name, summary in summaries.items():
+        if name.lower() == module_name.lower():
+            return summary
+    return {"error": f"Unknown module '{module_name}'", "modules": sorted(summaries)}
+
+@app.tool(description=tool_description("diff_paramdef_versions"))
+@timed("tool.diff_paramdef_versions")
+@scheduled(HEAVY)
+@profiled("diff_paramdef_versions")
+def diff_paramdef_versions(old_path: str, new_path: str):
+    """
+    Diff two versions of the ParamDef definitions (files, directories or
+    globs) and report added, removed and changed definitions by definition path.
+    """
+    from mcp_project.paramdef_handler.paramdef_diff import diff_paramdefs
+
+    try:
+        return diff_paramdefs([old_path], [new_path])
+    except FileNotFoundError as e:
+        return {"error": str(e)}
+
+@app.tool(description=tool_description("correct_definition_name"))
+@timed("tool.correct_definition_name")
+@scheduled(CHEAP, cold=HEAVY)
+@profiled("correct_definition_name")
+def correct_definition_name(name: str):
+    """
+    Spell-correct a mistyped container, parameter or reference name: names
+    within two edits with their definition paths, plus the RapidFuzz ranking.
+    """
+    from mcp_project.paramdef_handler.paramdef_spelling import get_paramdef_speller
+
+    return get_paramdef_speller().correct(name)
+
+@app.tool(description=tool_description("complete_definition_path"))
+@timed("tool.complete_definition_path")
+@scheduled(CHEAP, cold=HEAVY)
+@profiled("complete_definition_path")
+def complete_definition_path(prefix: str = ""):
+    """
+    Complete a partial definition path: the children of its parent whose
+    name starts with the last segment, with type and multiplicity.
+    """
+    from mcp_project.paramdef_handler.paramdef_completion import get_path_completer
+
+    return get_path_completer().complete(prefix)
+
+@app.tool(description=tool_description("find_parameters_by_value"))
+@timed("tool.find_parameters_by_value")
+@scheduled(CHEAP, cold=HEAVY)
+@profiled("find_parameters_by_value")
+def find_parameters_by_value(values: list[str]):
+    """
+    Find the parameters whose enumeration literals or default values match
+    the given values, ranked by how many of the values they accept.
+    """
+    from mcp_project.paramdef_handler.paramdef_values import get_value_lookup
+
+    return get_value_lookup().find(values)
+
+@app.tool(description=tool_description("get_precise_definition_path_using_difflib"))
+@timed("tool.get_precise_definition_path_using_difflib")
+@scheduled(HEAVY)
+@profiled("get_precise_definition_path_using_difflib")
 def get_precise_definition_path_using_difflib(keyword: str):
     """
     Retrieve definition paths and metadata for a given keyword using difflib fuzzy matching.
@@ -160,15 +244,14 @@ def get_precise_definition_path_using_difflib(keyword: str):
         with sensible defaults for MCP tool integration. Adjust number_of_results
         and cutoff parameters based on your use case requirements for precision vs recall.
     """
+    from mcp_project.paramdef_handler.paramdef_utils import get_definition_path_difflib
+
     return get_definition_path_difflib(keyword)
 
-@app.tool(
-    description=f"{
-        load_json(
-            'mcp_project/mcp_function_descriptions/get_precise_definition_path_using_rapidfuzz.json'
-            )[DESCRIPTION]
-        }"
-)
+@app.tool(description=tool_description("get_precise_definition_path_using_rapidfuzz"))
+@timed("tool.get_precise_definition_path_using_rapidfuzz")
+@scheduled(HEAVY)
+@profiled("get_precise_definition_path_using_rapidfuzz")
 def get_precise_definition_path_using_rapidfuzz(keyword: str):
     """
     Retrieve definition paths and metadata for a given keyword using RapidFuzz fuzzy matching.
@@ -184,15 +267,69 @@ def get_precise_definition_path_using_rapidfuzz(keyword: str):
         The return value from get_definition_path() containing definition paths and
         associated metadata for the matched keyword(s).
     """
+    from mcp_project.paramdef_handler.paramdef_utils import get_definition_path_rapidfuzz
+
     return get_definition_path_rapidfuzz(keyword)
 
-@app.tool(
-    description=f"{
-        load_json(
-            'mcp_project/mcp_function_descriptions/create_ecuc_configuration.json'
-            )[DESCRIPTION]
-        }"
-)
+@app.tool(description=tool_description("search_definition_paths"))
+@timed("tool.search_definition_paths")
+@scheduled(HEAVY)
+@profiled("search_definition_paths")
+def search_definition_paths(keyword: str, scorer: str = "wratio",
+                            number_of_results: int | None = None, cutoff: float | None = None):
+    """
+    Retrieve definition paths for a keyword with a selectable scorer
+    (wratio, token_set, qratio, jaro_winkler, difflib) and optional
+    number of results and cutoff (0..1) overrides.
+    """
+    from mcp_project.paramdef_handler.paramdef_utils import search_definition_paths as search
+
+    try:
+        return search(keyword, scorer, n=number_of_results, cutoff=cutoff)
+    except ValueError as e:
+        return {"error": str(e)}
+
+@app.tool(description=tool_description("get_definition_references"))
+@timed("tool.get_definition_references")
+@scheduled(CHEAP, cold=HEAVY)
+@profiled("get_definition_references")
+def get_definition_references(definition_path: str):
+    """
+    Get the reference relations of a definition path.
+
+    For a reference definition (e.g. 'Com/ComConfig/ComIPdu/ComPduIdRef') the
+    result lists its target definitions; for a container it lists the targets
+    of its reference children. `referenced_by` lists every reference
+    definition that points to `definition_path`.
+    """
+    from mcp_project.paramdef_handler.paramdef_index import get_paramdef_index, iter_children, REFERENCE
+
+    index = get_paramdef_index()
+    resolved = index.resolve(definition_path)
+    if resolved is None:
+        return None
+
+    canonical = resolved["definition_path"]
+    if resolved["node"].get("type") == REFERENCE:
+        references = [index.references_from(canonical)]
+    else:
+        references = [
+            index.references_from(f"{canonical}/{name}")
+            for name, child in iter_children(resolved["node"])
+            if child.get("type") == REFERENCE
+        ]
+    return {
+        "file": resolved["file"],
+        "definition_path": canonical,
+        "type": resolved["node"].get("type"),
+        "references": references,
+        "referenced_by": index.references_to(canonical),
+    }
+
+@app.tool(description=tool_description("create_ecuc_configuration"))
+@timed("tool.create_ecuc_configuration")
+@scheduled(HEAVY)
+@profiled("create_ecuc_configuration")
 def create_ecuc_configuration(path: str, names: dict):
     """
     Create ECUC configuration in JSON format for a given path and names mapping.
@@ -207,24 +344,39 @@ def create_ecuc_configuration(path: str, names: dict):
     Prompt: Create ComIPdu with the name ESP_19.
     Given path: "/com/comconfig/comipdu"
     And names: {"comipdu": "ESP_19"}
+
+    When ParamDef files are available every path segment is checked first
+    (see `complete_definition_path`).
     """
     from mcp_project.ecuc_creator.ecuc_configurator import ECUCConfigurator
+    from mcp_project.paramdef_handler.paramdef_completion import get_path_completer
 
     # Normalize names keys to lowercase for case-insensitive matching
     names = {k.lower(): v for k, v in names.items()}
 
-    configurator = ECUCConfigurator()
-    config = configurator.configure(path, names)
-    configurator.save_or_merge("_out/ecuc_config.json", config)
+    completer = get_path_completer()
+    configurator = ECUCConfigurator(completer if completer.index.modules() else None)
+    try:
+        config = configurator.configure(path, names)
+    except ValueError as e:
+        return {"error": str(e)}
+    ecuc_store.append(config)
     return config
 
-@app.tool(
-    description=f"{
-        load_json(
-            'mcp_project/mcp_function_descriptions/create_ecuc_container_with_parameters.json'
-            )[DESCRIPTION]
-        }"
-)
+@app.tool(description=tool_description("compact_ecuc_configuration"))
+@timed("tool.compact_ecuc_configuration")
+@profiled("compact_ecuc_configuration")
+def compact_ecuc_configuration():
+    """
+    Merge all ECUC configurations recorded by `create_ecuc_configuration`
+    into the configuration file and return the merged result.
+    """
+    return ecuc_store.compact()
+
+@app.tool(description=tool_description("create_ecuc_container_with_parameters"))
+@timed("tool.create_ecuc_container_with_parameters")
+@scheduled(HEAVY)
+@profiled("create_ecuc_container_with_parameters")
 def create_ecuc_container_with_parameters(path: str, names: dict, parameters: dict = {}):
     """
     Create an ECUC container JSON for a given `path` and `names` map.
@@ -244,40 +396,95 @@ def create_ecuc_container_with_parameters(path: str, names: dict, parameters: di
     The tool will treat keys case-insensitively and will write the created
     container to the `_out` directory. If any parents are missing from `names`,
     the caller should re-run discovery and provide explicit names.
+
+    Parameters are validated against the ParamDef (names, types, ranges,
+    enumeration literals and missing required parameters). On failure nothing is written and structured
+    errors with suggestions for mistyped names are returned instead.
     """
+    from mcp_project.utils.generic_utils import export2json, unique_output_path
     from mcp_project.ecuc_creator.ecuc_configurator import ECUCConfiguratorV2
+    from mcp_project.paramdef_handler.paramdef_validator import get_paramdef_validator
 
     # Normalize names keys to lowercase for case-insensitive matching
     names = {k.lower(): v for k, v in names.items()}
 
+    # Validate parameters against the ParamDef when one is available
+    validator = get_paramdef_validator()
+    if validator.index.modules():
+        result = validator.validate(path, parameters)
+        if result["errors"]:
+            return {"errors": result["errors"]}
+        path, parameters = result["definition_path"], result["parameters"]
+
     configurator = ECUCConfiguratorV2()
     container = configurator.create_container_with_parameter(path, names, parameters)
 
-    filename = "_out/ecuc_container_" + datetime.now().strftime("%Y%m%d_%H%M%S") + ".json"
+    filename = unique_output_path(ECUC_OUTPUT_DIR, "ecuc_container_")
     data = configurator.get_data()
-    export2json(filename, data)
+    export2json(str(filename), data)
     return data
 
-@app.tool(
-    description=f"{
-        load_json(
-            'mcp_project/mcp_function_descriptions/get_available_containers.json'
-            )[DESCRIPTION]
-            }"
-)
+@app.tool(description=tool_description("create_ecuc_containers_bulk"))
+@timed("tool.create_ecuc_containers_bulk")
+@scheduled(HEAVY)
+@profiled("create_ecuc_containers_bulk")
+def create_ecuc_containers_bulk(entries: list[dict]):
+    """
+    Create many ECUC containers in one call.
+
+    Each entry is {'path': ..., 'names': {...}, 'parameters': {...}} with the
+    same meaning as the arguments of `create_ecuc_container_with_parameters`.
+    All entries are validated against the ParamDef first; if any fails,
+    nothing is written and all errors are returned. Otherwise one file with
+    all containers is written to the `_out` directory.
+    """
+    from mcp_project.ecuc_creator.ecuc_bulk import create_ecuc_containers_bulk as create_bulk
+
+    return create_bulk(entries, out_dir=ECUC_OUTPUT_DIR)
+
+@app.tool(description=tool_description("get_available_containers"))
+@timed("tool.get_available_containers")
+@scheduled(CHEAP, cold=HEAVY)
+@profiled("get_available_containers")
 def get_available_containers(definition_path: str):
     """
     Get available ECUC containers.
     """
-    from mcp_project.model_mngr.mcp_dummy_data import ecuc, explore_tree
+    from mcp_project.model_mngr.ecuc_model import get_ecuc_model
+
+    return get_ecuc_model().explore(definition_path)
+
+
+@app.tool(description=tool_description("get_server_metrics"))
+def get_server_metrics():
+    """
+    Get latency histograms (per tool and per search phase) and counters.
+    The same data is written in Prometheus text format to METRICS_FILE.
+    """
+    METRICS.dump_prometheus(METRICS_FILE)
+    return METRICS.snapshot()
+
+
+@app.tool(description=tool_description("profile_next_tool_call"))
+def profile_next_tool_call(tool_name: str):
+    """
+    Profile the next call of `tool_name` ("all" for whichever tool runs next).
+    That call returns {"result": ..., "profile": <artifact path>}.
+    """
+    profile_next_call(tool_name)
+    return {"armed": tool_name}
 
-    return explore_tree(ecuc, definition_path)
-    
 
 if __name__ == "__main__":
+    from mcp_transport_configurator import configure_mcp
+
     # Reconfigure mcp.json
     configure_mcp()
 
+    # Flush pending ECUC configurations and metrics when the server stops
+    atexit.register(ecuc_store.compact)
+    atexit.register(METRICS.dump_prometheus, METRICS_FILE)
+
     # Run server
     if SETTINGS[PROTOCOL] == SSE:
         # SSE
@@ -17,4 +17,19 @@ SETTINGS = {
     PORT     : "5500"
 }
 
-DEBUG = True
+# Logging (overridden by PARAMDEF_LOG_LEVEL, PARAMDEF_LOG_FORMAT and PARAMDEF_LOG_FILE)
+LOG_LEVEL = "INFO"      # DEBUG, INFO, WARNING, ERROR
+LOG_FORMAT = "text"     # text or json
+LOG_FILE = None         # None logs to stderr
+
+# Admission control for the CPU-heavy tools (many SSE clients share one server)
+SCHEDULER_MAX_CONCURRENCY = 2   # requests running at once
+SCHEDULER_MAX_QUEUE = 16        # waiting requests before new ones are rejected
+SCHEDULER_QUEUE_TIMEOUT = 30.0  # seconds a request may wait for a slot
+
+# Prometheus text dump of the server metrics (written by get_server_metrics and on exit)
+METRICS_FILE = "_out/metrics.prom"
+
+# Opt-in JSONL log of every tool call (name, arguments, start, duration) for
+# `python -m mcp_project.utils.session_replay` (overridden by PARAMDEF_RECORD_FILE)
+RECORD_FILE = None
@@ -8,6 +8,9 @@ import os
 import json
 import platform
 from mcp_settings import SETTINGS, PROTOCOL, STDIO, SSE, PORT
+from mcp_project.utils.logging_utils import get_logger, configure_logging
+
+logger = get_logger(__name__)
 
 
 def configure_mcp():
@@ -30,7 +33,7 @@ def configure_mcp():
                 }
             }
         }
-        print(f"Configured MCP for SSE transport on port {PORT}")
+        logger.info("Configured MCP for SSE transport on port %s", SETTINGS[PORT])
     else:
         # SETTINGS[PROTOCOL] == STDIO
         python_parent_dir = "Scripts" if platform.system() == "Windows" else "bin"
@@ -45,13 +48,14 @@ def configure_mcp():
                 }
             }
         }
-        print(f"Configured MCP for STDIO transport")
+        logger.info("Configured MCP for STDIO transport")
     
     # Write to file with nice formatting
     with open(mcp_json_path, 'w') as f:
         json.dump(config, f, indent=4)
     
-    print(f"Updated {mcp_json_path} for {SETTINGS[PROTOCOL]} transport protocol")
+    logger.info("Updated %s for %s transport protocol", mcp_json_path, SETTINGS[PROTOCOL])
 
 if __name__ == "__main__":
+    configure_logging()
     configure_mcp()
@@ -0,0 +1,224 @@
+"""
+@author GUU8HC
+Indexed ECUC instance tree
+"""
+
+import json
+import threading
+
+from mcp_project.utils.prefix_trie import PrefixTrie
+
+ROOT = 0
+
+
+class ECUCModelIndex:
+    """
+    Index over ECUC container instances (module configurations, containers).
+
+    Instances are stored in flat arrays addressed by integer ids. Every
+    instance keeps a map from case-folded definition type to its child
+    instances of that type, and all known types are kept in a case-folded
+    prefix trie. Resolving `Com/ComConfig/ComIPdu` therefore touches only the
+    instances on the matching branches, never the whole tree.
+    """
+    def __init__(self):
+        self._names = [""]
+        self._types = [""]
+        self._parents = [-1]
+        self._definitions = [None]
+        self._parameters = [{}]
+        self._children = [[]]
+        self._children_by_type = [{}]
+        self._top_level_by_name = {}
+        self._types_trie = PrefixTrie()
+        self._known_types = set()
+
+    def add_instance(self, parent: int, name: str, type_: str, parameters: dict = None, definition: str = None) -> int:
+        """Add a container instance below `parent` and return its id."""
+        idx = len(self._names)
+        self._names.append(name)
+        self._types.append(type_)
+        self._parents.append(parent)
+        self._definitions.append(definition)
+        self._parameters.append(parameters or {})
+        self._children.append([])
+        self._children_by_type.append({})
+
+        type_key = type_.casefold()
+        self._children[parent].append(idx)
+        self._children_by_type[parent].setdefault(type_key, []).append(idx)
+        if type_key not in self._known_types:
+            self._known_types.add(type_key)
+            self._types_trie.insert(type_key)
+        if parent == ROOT:
+            self._top_level_by_name.setdefault(name.casefold(), []).append(idx)
+        return idx
+
+    def load_tree(self, tree: dict, parent: int = ROOT):
+        """
+        Load a nested ECUC dict such as `mcp_dummy_data.ecuc`, where each
+        instance is `{name: {"type": ..., "parameters": {...}, "containers": {...}}}`.
+        """
+        for name, node in tree.items():
+            if not isinstance(node, dict):
+                continue
+            idx = self.add_instance(
+                parent,
+                name,
+                node.get("type", name),
+                parameters=node.get("parameters"),
+                definition=node.get("definition")
+            )
+            containers = node.get("containers")
+            if isinstance(containers, dict):
+                self.load_tree(containers, idx)
+
+    def load_json_file(self, file_path: str):
+        """Load an ECUC JSON file in the `load_tree` format."""
+        with open(file_path, "r") as f:
+            self.load_tree(json.load(f))
+
+    def name(self, idx: int) -> str:
+        return self._names[idx]
+
+    def type(self, idx: int) -> str:
+        return self._types[idx]
+
+    def definition(self, idx: int) -> str:
+        return self._definitions[idx]
+
+    def parameters(self, idx: int) -> dict:
+        return self._parameters[idx]
+
+    def children(self, idx: int = ROOT) -> list:
+        return self._children[idx]
+
+    def find_children(self, parent: int, part: str) -> list:
+        """
+        Child instances of `parent` whose type matches `part`.
+
+        An exact (case-insensitive) type match wins; otherwise every type
+        starting with `part` is considered, resolved through the trie.
+        """
+        by_type = self._children_by_type[parent]
+        key = part.casefold()
+        if key in by_type:
+            return by_type[key]
+        matched = []
+        for type_key in self._types_trie.find_prefix(key):
+            matched.extend(by_type.get(type_key, ()))
+        if not matched and parent == ROOT:
+            matched = self._top_level_by_name.get(key, [])
+        return matched
+
+    def explore(self, definition_path: str = None) -> dict:
+        """
+        Return existing instances along `definition_path`.
+
+        For 'Com/ComConfig/ComIPdu' the result is
+        { 'Com': { 'ComConfig_0': { 'ComIPdu_ESP_10': {}, ... } } },
+        i.e. the first path part is the top key and the final-level instances
+        map to empty dicts. Without a path, the first module and two levels
+        of containers beneath it are returned.
+        """
+        if not definition_path:
+            return self._explore_default()
+
+        parts = [p for p in definition_path.strip("/").split("/") if p]
+        if not parts:
+            return {}
+
+        modules = self.find_children(ROOT, parts[0])
+        if not modules:
+            return {}
+
+        if len(parts) == 1:
+            out = {}
+            for module in modules:
+                for child in self._children[module]:
+                    out[self._names[child]] = {}
+            return {parts[0]: out}
+
+        def build_level(idx, level):
+            result = {}
+            for child in self.find_children(idx, parts[level]):
+                if level == len(parts) - 1:
+                    result[self._names[child]] = {}
+                else:
+                    result[self._names[child]] = build_level(child, level + 1)
+            return result
+
+        out = {}
+        for module in modules:
+            out.update(build_level(module, 1))
+        return {parts[0]: out}
+
+    def _explore_default(self) -> dict:
+        if not self._children[ROOT]:
+            return {}
+        top = self._children[ROOT][0]
+        level1 = {}
+        for child in self._children[top]:
+            level1[self._names[child]] = {self._names[c]: {} for c in self._children[child]}
+        return {self._names[top]: level1}
+
+    def to_snapshot(self) -> dict:
+        """Serializable form of the index; see `from_snapshot`."""
+        return {
+            "names": self._names[1:],
+            "types": self._types[1:],
+            "parents": self._parents[1:],
+            "definitions": self._definitions[1:],
+            "parameters": self._parameters[1:],
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict):
+        """Rebuild an index from `to_snapshot` output (parents precede children)."""
+        model = cls()
+        for name, type_, parent, definition, parameters in zip(
+            snapshot["names"],
+            snapshot["types"],
+            snapshot["parents"],
+            snapshot["definitions"],
+            snapshot["parameters"],
+        ):
+            model.add_instance(parent, name, type_, parameters=parameters, definition=definition)
+        return model
+
+    def __len__(self) -> int:
+        return len(self._names) - 1
+
+
+_default_model = None
+_default_fingerprint = None
+_default_model_lock = threading.Lock()
+
+
+def get_ecuc_model() -> ECUCModelIndex:
+    """
+    Process-wide ECUC model, loaded on first use and reloaded when the ECUC
+    value files change (fingerprint of their paths, sizes and modification
+    times).
+
+    ECUC value ARXML files in the workspace are loaded (through the snapshot
+    cache); without any, the dummy ECUC data is served.
+    """
+    global _default_model, _default_fingerprint
+    from mcp_project.utils.generic_utils import fingerprint_files
+    from mcp_project.model_mngr.ecuc_value_loader import get_all_ecuc_value_files, load_ecuc_model
+
+    files = get_all_ecuc_value_files()
+    fingerprint = fingerprint_files(files)
+    if _default_model is None or _default_fingerprint != fingerprint:
+        with _default_model_lock:
+            if _default_model is None or _default_fingerprint != fingerprint:
+                if files:
+                    model = load_ecuc_model(files)
+                else:
+                    from mcp_project.model_mngr.mcp_dummy_data import ecuc
+                    model = ECUCModelIndex()
+                    model.load_tree(ecuc)
+                _default_model = model
+                _default_fingerprint = fingerprint
+    return _default_model
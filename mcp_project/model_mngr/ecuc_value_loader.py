@@ -0,0 +1,182 @@
+"""
+@author GUU8HC
+Streaming loader for ECUC value ARXML files
+"""
+
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from mcp_project.utils.generic_utils import fingerprint_files
+from mcp_project.utils.logging_utils import get_logger
+from mcp_project.utils.metrics import span, increment
+from mcp_project.model_mngr.ecuc_model import ECUCModelIndex, ROOT
+from mcp_project.model_mngr.model_settings import (
+    ECUC_VALUE_FILE_PATTERNS,
+    ECUC_MODEL_CACHE_DIR,
+)
+
+logger = get_logger(__name__)
+
+# Bump when the snapshot layout or the loader semantics change
+SNAPSHOT_VERSION = 2
+
+INSTANCE_TAGS = {"ECUC-MODULE-CONFIGURATION-VALUES", "ECUC-CONTAINER-VALUE"}
+PARAMETER_TAGS = {
+    "ECUC-NUMERICAL-PARAM-VALUE",
+    "ECUC-TEXTUAL-PARAM-VALUE",
+    "ECUC-ADD-INFO-PARAM-VALUE",
+}
+REFERENCE_TAGS = {"ECUC-REFERENCE-VALUE", "ECUC-INSTANCE-REFERENCE-VALUE"}
+
+
+def local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def get_all_ecuc_value_files() -> list:
+    """
+    Get all ECUC value ARXML files in the workspace
+    """
+    workspace_root = Path(__file__).resolve().parents[0].parent.parent
+    files = set()
+    for pattern in ECUC_VALUE_FILE_PATTERNS:
+        files.update(workspace_root.glob(pattern))
+    return sorted(files)
+
+
+class _Frame:
+    """Container instance being parsed; materialized once its name is known."""
+    __slots__ = ("name", "definition", "parameters", "idx")
+
+    def __init__(self):
+        self.name = None
+        self.definition = None
+        self.parameters = {}
+        self.idx = None
+
+    def add_parameter(self, name: str, value):
+        """Set a parameter; repeated values of a multi-instance parameter are collected into a list."""
+        if name not in self.parameters:
+            self.parameters[name] = value
+        elif isinstance(self.parameters[name], list):
+            self.parameters[name].append(value)
+        else:
+            self.parameters[name] = [self.parameters[name], value]
+
+
+def load_ecuc_values(file_path, model: ECUCModelIndex) -> int:
+    """
+    Stream an ECUC value ARXML file into `model` and return the number of
+    container instances added.
+
+    The file is read with `iterparse`; every parameter and container element
+    is detached from its parent as soon as it has been consumed, so memory
+    stays bounded by the nesting depth rather than the file size. A
+    parameter or reference with several values (multiplicity above 1) maps to
+    the list of its values in document order.
+    """
+    frames = []
+    elements = []
+    tags = []
+    added = 0
+
+    def materialize(depth: int) -> int:
+        nonlocal added
+        frame = frames[depth]
+        if frame.idx is None:
+            parent = materialize(depth - 1) if depth > 0 else ROOT
+            definition = frame.definition or ""
+            type_ = definition.rsplit("/", 1)[-1] or frame.name
+            frame.idx = model.add_instance(
+                parent,
+                frame.name or type_,
+                type_,
+                parameters=frame.parameters,
+                definition=frame.definition
+            )
+            added += 1
+        return frame.idx
+
+    local_names = {}
+    for event, elem in ET.iterparse(str(file_path), events=("start", "end")):
+        tag = local_names.get(elem.tag)
+        if tag is None:
+            tag = local_names[elem.tag] = local_name(elem.tag)
+        if event == "start":
+            elements.append(elem)
+            tags.append(tag)
+            if tag in INSTANCE_TAGS:
+                frames.append(_Frame())
+            elif tag == "SUB-CONTAINERS" and frames:
+                # Children need their parent's id, which needs the parent's name
+                materialize(len(frames) - 1)
+            continue
+
+        elements.pop()
+        tags.pop()
+        parent_tag = tags[-1] if tags else None
+
+        if tag == "SHORT-NAME" and parent_tag in INSTANCE_TAGS and frames:
+            frames[-1].name = (elem.text or "").strip()
+        elif tag == "DEFINITION-REF" and parent_tag in INSTANCE_TAGS and frames:
+            frames[-1].definition = (elem.text or "").strip()
+        elif tag in PARAMETER_TAGS or tag in REFERENCE_TAGS:
+            definition = value = None
+            for child in elem:
+                child_tag = local_names.get(child.tag) or local_name(child.tag)
+                if child_tag == "DEFINITION-REF":
+                    definition = (child.text or "").strip()
+                elif child_tag in ("VALUE", "VALUE-REF"):
+                    value = (child.text or "").strip()
+                elif child_tag == "VALUE-IREF":
+                    value = "/".join((c.text or "").strip() for c in child)
+            if definition and frames:
+                frames[-1].add_parameter(definition.rsplit("/", 1)[-1], value)
+            if elements:
+                elements[-1].remove(elem)
+        elif tag in INSTANCE_TAGS:
+            materialize(len(frames) - 1)
+            frames.pop()
+            if elements:
+                elements[-1].remove(elem)
+
+    return added
+
+
+def _cache_key(files: list) -> str:
+    return fingerprint_files(files, salt=f"v{SNAPSHOT_VERSION}")
+
+
+def load_ecuc_model(files: list, cache_dir: str = ECUC_MODEL_CACHE_DIR) -> ECUCModelIndex:
+    """
+    Load ECUC value files into a new model, reusing a cached snapshot when
+    none of the files changed (same paths, sizes and modification times).
+    """
+    snapshot_path = Path(cache_dir) / f"{_cache_key(files)}.json" if cache_dir else None
+    if snapshot_path is not None and snapshot_path.exists():
+        try:
+            with open(snapshot_path, "r", encoding="utf-8") as f:
+                model = ECUCModelIndex.from_snapshot(json.load(f))
+            logger.info("Loaded ECUC model snapshot %s (%d instances)", snapshot_path, len(model))
+            increment("ecuc_model_snapshot_hits")
+            return model
+        except Exception as e:
+            logger.error("Ignoring unreadable ECUC model snapshot '%s': %s", snapshot_path, e)
+
+    model = ECUCModelIndex()
+    for file in files:
+        try:
+            with span("phase.ecuc_values_parse"):
+                added = load_ecuc_values(file, model)
+            logger.info("Loaded %d ECUC instances from %s", added, file)
+        except ET.ParseError as e:
+            logger.error("Failed to parse ECUC values '%s': %s", file, e)
+
+    if snapshot_path is not None:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(model.to_snapshot(), f, separators=(",", ":"))
+        tmp_path.replace(snapshot_path)
+    return model
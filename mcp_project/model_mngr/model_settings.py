@@ -0,0 +1,7 @@
+# ECUC value files discovered below the workspace root
+ECUC_VALUE_FILE_PATTERNS = [
+    "**/*[Ee]cuc[Vv]alue*.arxml",
+]
+
+# Snapshots of loaded ECUC models, reused between server runs
+ECUC_MODEL_CACHE_DIR = "_out/.cache/ecuc_model"
@@ -1,18 +1,30 @@
 #!/usr/bin/env python3
-"""
+r"""
 Simple ARXML parameter definition to JSON converter.
 
 Generates a JSON structure similar to `_out/com_paramdef.json` but
 includes explicit `type` fields for Module, Container and Parameter levels.
 
 Usage: .venv\Scripts\python .\paramdef_arxml2json.py <arxml-file> [-o out.json]
+Batch: .venv\Scripts\python .\paramdef_arxml2json.py <dir|glob|file>... --out-dir <dir> [-j N] [--force]
 """
 import argparse
+import glob
+import hashlib
 import json
+import os
 import sys
+import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
 from typing import Dict
 
+from mcp_project.utils.logging_utils import get_logger, configure_logging
+
+logger = get_logger(__name__)
+
 
 NS = {'ar': 'http://autosar.org/schema/r4.0'}
 
@@ -83,10 +95,53 @@ def parse_parameter(param_elem) -> Dict:
     return name, param
 
 
+def parse_reference(ref_elem) -> Dict:
+    tag = ref_elem.tag.split('}')[-1]
+    type_map = {
+        'ECUC-REFERENCE-DEF': 'REFERENCE',
+        'ECUC-CHOICE-REFERENCE-DEF': 'CHOICE_REFERENCE',
+        'ECUC-FOREIGN-REFERENCE-DEF': 'FOREIGN_REFERENCE',
+        'ECUC-SYMBOLIC-NAME-REFERENCE-DEF': 'SYMBOLIC_NAME_REFERENCE',
+        'ECUC-INSTANCE-REFERENCE-DEF': 'INSTANCE_REFERENCE',
+        'ECUC-URI-REFERENCE-DEF': 'URI_REFERENCE',
+    }
+
+    name = text(ref_elem.find('ar:SHORT-NAME', NS))
+    desc = text(ref_elem.find('ar:DESC/ar:L-2[@L="EN"]', NS))
+    ref = {
+        'type': 'REFERENCE',
+        'ref_type': type_map.get(tag, tag),
+    }
+
+    mult = multiplicity(ref_elem)
+    if mult and mult != '1':
+        ref['multiplicity'] = mult
+    if desc:
+        ref['description'] = desc
+
+    # Destination definitions (plain and symbolic references have one,
+    # choice references list several under DESTINATION-REFS)
+    dests = [text(d) for d in ref_elem.findall('ar:DESTINATION-REF', NS)]
+    dests += [text(d) for d in ref_elem.findall('ar:DESTINATION-REFS/ar:DESTINATION-REF', NS)]
+    dests = [d for d in dests if d]
+    if dests:
+        ref['destinations'] = dests
+
+    # Foreign and instance references point to a meta-class instead
+    dest_type = text(ref_elem.find('ar:DESTINATION-TYPE', NS))
+    if dest_type:
+        ref['destinationType'] = dest_type
+
+    return name, ref
+
+
 def parse_container(cont_elem) -> Dict:
     name = text(cont_elem.find('ar:SHORT-NAME', NS))
     desc = text(cont_elem.find('ar:DESC/ar:L-2[@L="EN"]', NS))
     container: Dict = {'type': 'CONTAINER'}
+    mult = multiplicity(cont_elem)
+    if mult and mult != '1':
+        container['multiplicity'] = mult
     if desc:
         container['description'] = desc
 
@@ -98,6 +153,14 @@ def parse_container(cont_elem) -> Dict:
             pname, pjson = parse_parameter(p)
             params[pname] = pjson
 
+    # References
+    refs = {}
+    refs_parent = cont_elem.find('ar:REFERENCES', NS)
+    if refs_parent is not None:
+        for r in refs_parent:
+            rname, rjson = parse_reference(r)
+            refs[rname] = rjson
+
     # Sub-containers
     subs = {}
     subs_parent = cont_elem.find('ar:SUB-CONTAINERS', NS)
@@ -114,9 +177,11 @@ def parse_container(cont_elem) -> Dict:
             subs[cname] = cjson
 
     # Merge parameters and sub-containers into a single dict to mimic com_paramdef.json
-    # Put parameters first
+    # Put parameters first, then references
     for k, v in params.items():
         container[k] = v
+    for k, v in refs.items():
+        container[k] = v
     for k, v in subs.items():
         container[k] = v
 
@@ -159,13 +224,175 @@ def convert_paramdef_to_json(arxml_path: str) -> Dict:
     return {mod_name: mod_json}
 
 
+MANIFEST_VERSION = 1
+PARAMDEF_GLOB = '**/*[Pp]aram[Dd]ef*.arxml'
+
+
+def file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def expand_inputs(inputs) -> list:
+    """
+    Resolve files, directories (searched for ParamDef files) and glob patterns.
+
+    Raises FileNotFoundError naming every explicit input that is neither an
+    existing file nor a directory.
+    """
+    files, missing = set(), []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            files.update(path.glob(PARAMDEF_GLOB))
+        elif any(c in str(item) for c in '*?['):
+            files.update(Path(p) for p in glob.glob(str(item), recursive=True) if Path(p).is_file())
+        elif path.is_file():
+            files.add(path)
+        else:
+            missing.append(str(item))
+    if missing:
+        raise FileNotFoundError(f"No such ParamDef file or directory: {', '.join(missing)}")
+    return sorted({f.resolve() for f in files})
+
+
+def output_names(files: list) -> dict:
+    """`<stem>.json` per input; inputs sharing a stem get a path hash suffix."""
+    stems = {}
+    for f in files:
+        stems.setdefault(f.stem, []).append(f)
+    names = {}
+    for stem, group in stems.items():
+        for f in group:
+            if len(group) == 1:
+                names[f] = f'{stem}.json'
+            else:
+                names[f] = f'{stem}_{hashlib.sha1(str(f).encode()).hexdigest()[:8]}.json'
+    return names
+
+
+def _convert_to_file(arxml_path: str, output_path: str) -> dict:
+    """Worker: convert one file, write its JSON and return timing and module names."""
+    start = time.perf_counter()
+    try:
+        out = convert_paramdef_to_json(arxml_path)
+    except SystemExit as e:
+        # find_module exits when there is no ECUC-MODULE-DEF
+        raise ValueError(str(e)) from None
+    tmp_path = f'{output_path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(out, f, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, output_path)
+    return {'modules': list(out), 'seconds': round(time.perf_counter() - start, 6)}
+
+
+def convert_batch(inputs, out_dir, workers: int = None, manifest_path=None, force: bool = False) -> dict:
+    """
+    Convert many ParamDef files into `out_dir` with a pool of worker processes.
+
+    Writes `manifest.json` (or `manifest_path`) mapping each input to its
+    sha256, output file, module names and conversion time. Inputs whose hash
+    matches the previous manifest and whose output still exists are skipped
+    unless `force` is set. Returns the manifest. Raises FileNotFoundError
+    before converting anything if an explicit input does not exist.
+    """
+    files = expand_inputs(inputs)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = Path(manifest_path) if manifest_path else out_dir / 'manifest.json'
+
+    previous = {}
+    if manifest_path.exists():
+        try:
+            previous = json.loads(manifest_path.read_text(encoding='utf-8')).get('files', {})
+        except (OSError, ValueError) as e:
+            logger.warning('Ignoring unreadable manifest %s: %s', manifest_path, e)
+
+    names = output_names(files)
+    entries, jobs = {}, []
+    for f in files:
+        key = str(f)
+        sha = file_sha256(f)
+        entry = {'sha256': sha, 'output': names[f]}
+        old = previous.get(key)
+        if (not force and old and old.get('sha256') == sha and old.get('output') == names[f]
+                and 'error' not in old and (out_dir / names[f]).exists()):
+            entries[key] = {**old, 'skipped': True}
+            continue
+        entries[key] = entry
+        jobs.append(f)
+
+    start = time.perf_counter()
+    if jobs:
+        def record(f, result=None, error=None):
+            if error is None:
+                entries[str(f)].update(result)
+            else:
+                entries[str(f)]['error'] = error
+                logger.error('Failed to convert %s: %s', f, error)
+
+        if workers == 1 or len(jobs) == 1:
+            for f in jobs:
+                try:
+                    record(f, _convert_to_file(str(f), str(out_dir / names[f])))
+                except Exception as e:
+                    record(f, error=f'{type(e).__name__}: {e}')
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {f: pool.submit(_convert_to_file, str(f), str(out_dir / names[f])) for f in jobs}
+                for f, future in futures.items():
+                    try:
+                        record(f, future.result())
+                    except Exception as e:
+                        record(f, error=f'{type(e).__name__}: {e}')
+
+    failed = sum(1 for e in entries.values() if 'error' in e)
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'summary': {
+            'files': len(files),
+            'converted': len(jobs) - failed,
+            'skipped': len(files) - len(jobs),
+            'failed': failed,
+            'seconds': round(time.perf_counter() - start, 6),
+        },
+        'files': entries,
+    }
+    tmp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+    tmp_path.write_text(json.dumps(manifest, indent=4), encoding='utf-8')
+    os.replace(tmp_path, manifest_path)
+    return manifest
+
+
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument('arxml', help='ARXML paramdef file')
-    parser.add_argument('-o', '--output', help='Output JSON file (default stdout)')
+    parser.add_argument('arxml', nargs='+', help='ARXML paramdef file(s), directories or glob patterns')
+    parser.add_argument('-o', '--output', help='Output JSON file (default stdout, single file only)')
+    parser.add_argument('--out-dir', help='Batch mode: write one JSON per input and a manifest here')
+    parser.add_argument('-j', '--workers', type=int, help='Batch mode: worker processes (default: CPU count)')
+    parser.add_argument('--manifest', help='Batch mode: manifest path (default: <out-dir>/manifest.json)')
+    parser.add_argument('--force', action='store_true', help='Batch mode: convert unchanged files too')
     args = parser.parse_args()
 
-    out = convert_paramdef_to_json(args.arxml)
+    if args.out_dir:
+        configure_logging(level='INFO')
+        try:
+            manifest = convert_batch(args.arxml, args.out_dir, args.workers, args.manifest, args.force)
+        except FileNotFoundError as e:
+            parser.error(str(e))
+        summary = manifest['summary']
+        logger.info('%d converted, %d unchanged, %d failed in %.2fs',
+                    summary['converted'], summary['skipped'], summary['failed'], summary['seconds'])
+        sys.exit(1 if summary['failed'] else 0)
+
+    if len(args.arxml) != 1 or not Path(args.arxml[0]).is_file():
+        parser.error('several inputs, directories or globs need --out-dir')
+
+    out = convert_paramdef_to_json(args.arxml[0])
     s = json.dumps(out, indent=4, ensure_ascii=False)
     if args.output:
         with open(args.output, 'w', encoding='utf-8') as f:
@@ -0,0 +1,262 @@
+"""
+@author: GUU8HC
+Accuracy and latency of the definition searches on a labeled query set
+
+    python -m mcp_project.paramdef_handler.paramdef_benchmark <queries.json> <paramdef>...
+        [--function NAME]... [--baseline baseline.json [--check-latency]] [--write-baseline baseline.json] [--json]
+        [--scaling 1,2,4,8 [--scorer NAME] [--replicate N]]
+
+The query file is a JSON list of {"query": ..., "expected": <definition path>}
+objects (an optional "kind" such as misspelled or abbreviated is ignored).
+The ParamDef inputs (files, directories or globs) are converted once and
+every search function of `paramdef_utils` runs over the same corpus, so the
+timings compare the matching alone.
+
+With --baseline the run fails (exit status 1) when a quality metric drops
+below the baseline by more than its tolerance; with --check-latency also when
+a latency exceeds its budget. Latency budgets only mean something on the
+machine that wrote the baseline, so they are not checked by default.
+
+With --scaling the matcher's latency is measured instead for each number of
+scoring threads, over the corpus replicated N times to reach the sizes where
+parallel scoring pays off.
+"""
+
+import sys
+import json
+import time
+import argparse
+
+from mcp_project.paramdef_handler.paramdef_arxml2json import expand_inputs
+from mcp_project.paramdef_handler.paramdef_matcher import SCORERS, match
+from mcp_project.utils.logging_utils import configure_logging
+
+RECALL_AT = (1, 5, 10)
+QUALITY_METRICS = tuple(f"recall@{k}" for k in RECALL_AT) + ("mrr",)
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+# Default allowed drop of a quality metric below its baseline
+QUALITY_TOLERANCE = 0.02
+# Default latency budget as a multiple of the baseline latency, at least
+# LATENCY_FLOOR_MS so that small corpora do not fail on scheduling noise
+LATENCY_FACTOR = 3.0
+LATENCY_FLOOR_MS = 5.0
+
+
+def search_functions(paramdefs: list, source) -> dict:
+    """
+    {name: (search, label)} for every search of `paramdef_utils`, where
+    `search(query)` returns ranked labels and `label(expected_path)` is the
+    label a correct result carries. `get_definition_files` returns keys, so
+    its label is the last part of the expected path.
+    """
+    from mcp_project.paramdef_handler import paramdef_utils
+
+    def paths(results):
+        return [r["definition_path"] for r in results]
+
+    def same(path):
+        return path
+
+    functions = {
+        "get_definition_files": (
+            lambda q: [key for _, key, _ in paramdef_utils.get_definition_files(q, paramdefs, source) or []],
+            lambda path: path.rsplit("/", 1)[-1],
+        ),
+        "get_definition_path_difflib": (
+            lambda q: paths(paramdef_utils.get_definition_path_difflib(q, paramdefs, source)), same
+        ),
+        "get_definition_path_rapidfuzz": (
+            lambda q: paths(paramdef_utils.get_definition_path_rapidfuzz(q, paramdefs, source)), same
+        ),
+    }
+    for scorer in SCORERS:
+        functions[f"search_definition_paths[{scorer}]"] = (
+            lambda q, s=scorer: paths(paramdef_utils.search_definition_paths(q, s, paramdefs=paramdefs, source=source)),
+            same,
+        )
+    return functions
+
+
+def _percentile(values: list, fraction: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+
+def evaluate(queries: list, search, label=lambda path: path, repeat: int = 3) -> dict:
+    """
+    Recall@k, mean reciprocal rank and latency percentiles of one search.
+
+    Latencies are per query in milliseconds, the fastest of `repeat` runs.
+    """
+    hits = {k: 0 for k in RECALL_AT}
+    reciprocal_ranks, latencies = [], []
+    for labeled in queries:
+        best = None
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            results = search(labeled["query"])
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        latencies.append(best * 1000)
+
+        expected = label(labeled["expected"])
+        rank = results.index(expected) + 1 if expected in results else None
+        for k in RECALL_AT:
+            hits[k] += rank is not None and rank <= k
+        reciprocal_ranks.append(1.0 / rank if rank else 0.0)
+
+    count = max(1, len(queries))
+    metrics = {f"recall@{k}": hits[k] / count for k in RECALL_AT}
+    metrics["mrr"] = sum(reciprocal_ranks) / count
+    for name, fraction in zip(LATENCY_METRICS, (0.50, 0.95, 0.99)):
+        metrics[name] = _percentile(latencies, fraction) if latencies else 0.0
+    return metrics
+
+
+def run_benchmark(queries: list, paramdefs: list, functions=None, repeat: int = 3) -> dict:
+    """{function name: metrics} over one corpus built from `paramdefs`."""
+    from mcp_project.paramdef_handler.paramdef_utils import _iter_file_keys
+
+    corpus = list(_iter_file_keys(paramdefs))
+    available = search_functions(paramdefs, lambda _: corpus)
+    results = {}
+    for name in functions or list(available):
+        if name not in available:
+            raise ValueError(f"Unknown search function '{name}', expected one of: {', '.join(available)}")
+        search, label = available[name]
+        results[name] = evaluate(queries, search, label, repeat)
+    return results
+
+
+def replicate_corpus(corpus: list, copies: int) -> list:
+    """`corpus` with the keys of every file repeated `copies` times, suffixed by the copy number."""
+    if copies <= 1:
+        return corpus
+    return [
+        (paramdef, list(keys) + [f"{key}{copy}" for copy in range(1, copies) for key in keys], lookup)
+        for paramdef, keys, lookup in corpus
+    ]
+
+
+def scaling_benchmark(queries: list, paramdefs: list, workers=(1, 2, 4, 8), scorer: str = "wratio",
+                      replicate: int = 1, repeat: int = 3) -> dict:
+    """
+    Latency of `paramdef_matcher.match` for each number of scoring threads.
+
+    Returns {workers: {"keys", "p50_ms", "p95_ms", "speedup"}}, where speedup
+    is the p50 latency of the first entry of `workers` over this one's.
+    """
+    from mcp_project.paramdef_handler.paramdef_utils import _iter_file_keys
+
+    corpus = replicate_corpus(list(_iter_file_keys(paramdefs)), replicate)
+    key_count = sum(len(keys) for _, keys, _ in corpus)
+    results = {}
+    for count in workers:
+        metrics = evaluate(
+            queries,
+            lambda q, w=count: [key for _, key, _ in match(q, corpus, lambda lookup, key: key, scorer, workers=w)],
+            lambda path: path.rsplit("/", 1)[-1],
+            repeat,
+        )
+        results[count] = {"keys": key_count, "p50_ms": metrics["p50_ms"], "p95_ms": metrics["p95_ms"]}
+    reference = next(iter(results.values()), None)
+    for metrics in results.values():
+        metrics["speedup"] = reference["p50_ms"] / metrics["p50_ms"] if metrics["p50_ms"] else 0.0
+    return results
+
+
+def make_baseline(results: dict, latency_factor: float = LATENCY_FACTOR) -> dict:
+    """
+    Baseline from a run: its quality metrics, and latency budgets of
+    `latency_factor` times its latencies (at least LATENCY_FLOOR_MS).
+    """
+    return {
+        name: {
+            **{m: round(metrics[m], 4) for m in QUALITY_METRICS},
+            **{m: round(max(metrics[m] * latency_factor, LATENCY_FLOOR_MS), 3) for m in LATENCY_METRICS},
+        }
+        for name, metrics in results.items()
+    }
+
+
+def check_regressions(results: dict, baseline: dict, tolerance: float = QUALITY_TOLERANCE,
+                      latency: bool = False) -> list:
+    """
+    Compare a run with a baseline. Returns one message per quality metric
+    more than `tolerance` below its baseline and, with `latency`, per
+    latency above its budget.
+    """
+    failures = []
+    for name, expected in baseline.items():
+        metrics = results.get(name)
+        if metrics is None:
+            continue
+        for metric in QUALITY_METRICS:
+            if metric in expected and metrics[metric] < expected[metric] - tolerance:
+                failures.append(f"{name}: {metric} {metrics[metric]:.3f} < baseline {expected[metric]:.3f}")
+        for metric in LATENCY_METRICS if latency else ():
+            if metric in expected and metrics[metric] > expected[metric]:
+                failures.append(f"{name}: {metric} {metrics[metric]:.3f} ms > budget {expected[metric]:.3f} ms")
+    return failures
+
+
+def format_results(results: dict) -> str:
+    columns = QUALITY_METRICS + LATENCY_METRICS
+    width = max([len("function")] + [len(name) for name in results]) + 2
+    lines = [f"{'function':<{width}}" + "".join(f"{c:>10}" for c in columns)]
+    for name, metrics in results.items():
+        lines.append(f"{name:<{width}}" + "".join(f"{metrics[c]:>10.3f}" for c in columns))
+    return "\n".join(lines)
+
+
+def format_scaling(results: dict) -> str:
+    columns = ("keys", "p50_ms", "p95_ms", "speedup")
+    lines = [f"{'workers':<10}" + "".join(f"{c:>12}" for c in columns)]
+    for workers, metrics in results.items():
+        lines.append(f"{workers:<10}{metrics['keys']:>12}" + "".join(f"{metrics[c]:>12.3f}" for c in columns[1:]))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ParamDef definition searches")
+    parser.add_argument("queries", help="JSON list of {query, expected} objects")
+    parser.add_argument("paramdef", nargs="+", help="ParamDef files, directories or globs")
+    parser.add_argument("--function", action="append", help="Search function to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per query; the fastest counts")
+    parser.add_argument("--baseline", help="Fail when the run regresses against this baseline")
+    parser.add_argument("--tolerance", type=float, default=QUALITY_TOLERANCE, help="Allowed quality drop")
+    parser.add_argument("--check-latency", action="store_true", help="Also fail when a latency exceeds its budget")
+    parser.add_argument("--write-baseline", help="Write a baseline from this run")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    parser.add_argument("--scaling", help="Comma-separated scoring thread counts to compare, e.g. 1,2,4,8")
+    parser.add_argument("--scorer", default="wratio", choices=list(SCORERS), help="Scorer of the --scaling run")
+    parser.add_argument("--replicate", type=int, default=1, help="Copies of the corpus keys for --scaling")
+    args = parser.parse_args()
+
+    configure_logging()
+    with open(args.queries, "r", encoding="utf-8") as f:
+        queries = json.load(f)
+    if args.scaling:
+        workers = [int(count) for count in args.scaling.split(",")]
+        results = scaling_benchmark(queries, expand_inputs(args.paramdef), workers, args.scorer,
+                                    args.replicate, args.repeat)
+        print(json.dumps(results, indent=4) if args.json else format_scaling(results))
+        return
+    results = run_benchmark(queries, expand_inputs(args.paramdef), args.function, args.repeat)
+    print(json.dumps(results, indent=4) if args.json else format_results(results))
+
+    if args.write_baseline:
+        with open(args.write_baseline, "w", encoding="utf-8") as f:
+            json.dump(make_baseline(results), f, indent=4)
+            f.write("\n")
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            failures = check_regressions(results, json.load(f), args.tolerance, args.check_latency)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+@author: GUU8HC
+Completion and segment-wise validation of partial definition paths
+"""
+
+import threading
+
+from mcp_project.paramdef_handler.paramdef_index import path_key, iter_children, get_paramdef_index
+from mcp_project.paramdef_handler.paramdef_settings import COMPLETION_MAX_RESULTS
+from mcp_project.utils.prefix_trie import PrefixTrie
+from mcp_project.utils.metrics import span, increment
+
+
+class PathCompleter:
+    """
+    Complete partial definition paths against a `ParamDefIndex`.
+
+    Every definition path is stored in a prefix trie of its parent's child
+    names (modules under the empty parent), built on first use. Completing
+    `Com/ComC` resolves `Com` in the index and walks `comc` in Com's trie,
+    so the cost depends on the prefix and the number of completions, not on
+    the size of the ParamDef.
+    """
+    def __init__(self, index=None):
+        self._index = index if index is not None else get_paramdef_index()
+        self._children = None
+        self._lock = threading.Lock()
+
+    def _ensure_built(self):
+        if self._children is not None:
+            return
+        with self._lock:
+            if self._children is not None:
+                return
+            children = {}
+            with span("phase.path_trie"):
+                for path in self._index.definition_paths():
+                    parent, _, name = path.rpartition("/")
+                    children.setdefault(path_key(parent), PrefixTrie()).insert(name, path)
+            self._children = children
+
+    @property
+    def index(self):
+        return self._index
+
+    def _describe(self, definition_path: str) -> dict:
+        node = self._index.resolve(definition_path)["node"]
+        entry = {
+            "name": definition_path.rsplit("/", 1)[-1],
+            "definition_path": definition_path,
+            "type": node.get("type"),
+            "multiplicity": node.get("multiplicity", "1"),
+        }
+        if "param_type" in node:
+            entry["param_type"] = node["param_type"]
+        entry["has_children"] = any(True for _ in iter_children(node))
+        return entry
+
+    def _child_names(self, parent: str) -> list:
+        trie = self._children.get(path_key(parent))
+        return sorted((p.rsplit("/", 1)[-1] for p in trie.find_prefix("")), key=str.casefold) if trie else []
+
+    def check_path(self, path: str) -> dict:
+        """
+        Check a definition path segment by segment.
+
+        Returns {'definition_path': canonical spelling, 'valid': True} or, at
+        the first segment that does not exist under its parent,
+        {'definition_path': None, 'valid': False, 'invalid_segment',
+        'parent', 'suggestions'} where suggestions are the closest child names.
+        """
+        from mcp_project.paramdef_handler.paramdef_validator import suggest
+
+        self._ensure_built()
+        canonical = ""
+        for segment in (p for p in path.split("/") if p):
+            trie = self._children.get(path_key(canonical))
+            found = trie.get(segment) if trie else []
+            if not found:
+                return {
+                    "definition_path": None,
+                    "valid": False,
+                    "invalid_segment": segment,
+                    "parent": canonical or None,
+                    "suggestions": suggest(segment, self._child_names(canonical)),
+                }
+            canonical = found[0]
+        return {"definition_path": canonical or None, "valid": bool(canonical)}
+
+    def complete(self, prefix: str, limit: int = COMPLETION_MAX_RESULTS) -> dict:
+        """
+        Children of the parent of `prefix` whose name starts with its last
+        segment (case-insensitive), by name, with their type and multiplicity.
+        `Com/ComC` completes to ComConfig; `Com/ComConfig/` lists all of
+        ComConfig's children; an empty prefix lists the modules.
+        """
+        self._ensure_built()
+        increment("path_completions")
+        parent, _, partial = prefix.rpartition("/")
+        result = {"prefix": prefix, "parent": None, "completions": []}
+        if parent.strip("/"):
+            checked = self.check_path(parent)
+            if not checked["valid"]:
+                checked.pop("definition_path")
+                checked.pop("valid")
+                return {**result, **checked}
+            result["parent"] = parent = checked["definition_path"]
+
+        trie = self._children.get(path_key(parent))
+        with span("phase.path_completion"):
+            paths = sorted(trie.find_prefix(partial), key=str.casefold) if trie else []
+        result["completions"] = [self._describe(p) for p in paths[:limit]]
+        result["truncated"] = len(paths) > limit
+        return result
+
+
+_default_completer = None
+_default_completer_lock = threading.Lock()
+
+
+def get_path_completer() -> PathCompleter:
+    """Process-wide completer over the workspace ParamDef index, rebuilt when the index is."""
+    global _default_completer
+    index = get_paramdef_index()
+    if _default_completer is None or _default_completer.index is not index:
+        with _default_completer_lock:
+            if _default_completer is None or _default_completer.index is not index:
+                _default_completer = PathCompleter(index)
+    return _default_completer
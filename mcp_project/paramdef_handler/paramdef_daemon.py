@@ -0,0 +1,286 @@
+"""
+@author: GUU8HC
+Long-lived local search daemon and its Unix-socket client
+
+The daemon is opt-in. Choose a socket path, set PARAMDEF_DAEMON_SOCKET (or
+DAEMON_SOCKET) to it for the server processes, and start the daemon once per
+machine:
+
+    python -m mcp_project.paramdef_handler.paramdef_daemon [--socket PATH]
+
+The daemon keeps the key-to-path map of every ParamDef file it has seen in
+memory (keyed by path, size and modification time) and answers the
+paramdef_utils searches. Short-lived server processes then skip the cold
+start.
+"""
+
+import os
+import math
+import socket
+import struct
+import argparse
+import threading
+import socketserver
+from pathlib import Path
+
+from mcp_project.paramdef_handler.paramdef_settings import DAEMON_SOCKET, DAEMON_TIMEOUT
+from mcp_project.utils.logging_utils import get_logger, configure_logging
+from mcp_project.utils.metrics import span, increment
+
+logger = get_logger(__name__)
+
+# Operations
+OP_PING = 0
+OP_DEFINITION_FILES = 1
+OP_PATH_DIFFLIB = 2
+OP_PATH_RAPIDFUZZ = 3
+
+# Response status
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+MAGIC = b"PDD1"
+# magic, operation, keyword length, length of the NUL separated file list
+REQUEST = struct.Struct("<4sBHI")
+# status, entry count (or error message length)
+RESPONSE = struct.Struct("<BI")
+# index into the request's file list, text length, score (NaN when absent)
+ENTRY = struct.Struct("<IHd")
+
+
+def daemon_socket():
+    """Socket path from PARAMDEF_DAEMON_SOCKET or DAEMON_SOCKET; None if disabled."""
+    path = os.environ.get("PARAMDEF_DAEMON_SOCKET", DAEMON_SOCKET)
+    if not path or not hasattr(socket, "AF_UNIX"):
+        return None
+    return os.path.expanduser(path)
+
+
+def _recv_exactly(sock, size: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("Connection closed mid-message")
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+def encode_request(op: int, keyword: str, files: list) -> bytes:
+    keyword_bytes = keyword.encode("utf-8")
+    files_bytes = "\0".join(str(f) for f in files).encode("utf-8")
+    return REQUEST.pack(MAGIC, op, len(keyword_bytes), len(files_bytes)) + keyword_bytes + files_bytes
+
+
+def encode_entries(entries: list) -> bytes:
+    """Entries are (file_idx, text, score_or_None) tuples."""
+    out = [RESPONSE.pack(STATUS_OK, len(entries))]
+    for file_idx, text, score in entries:
+        text_bytes = text.encode("utf-8")
+        out.append(ENTRY.pack(file_idx, len(text_bytes), math.nan if score is None else score))
+        out.append(text_bytes)
+    return b"".join(out)
+
+
+def encode_error(message: str) -> bytes:
+    message_bytes = message.encode("utf-8")
+    return RESPONSE.pack(STATUS_ERROR, len(message_bytes)) + message_bytes
+
+
+def _read_entries(sock) -> list:
+    status, count = RESPONSE.unpack(_recv_exactly(sock, RESPONSE.size))
+    if status != STATUS_OK:
+        raise RuntimeError(_recv_exactly(sock, count).decode("utf-8"))
+    entries = []
+    for _ in range(count):
+        file_idx, text_len, score = ENTRY.unpack(_recv_exactly(sock, ENTRY.size))
+        text = _recv_exactly(sock, text_len).decode("utf-8")
+        entries.append((file_idx, text, None if math.isnan(score) else score))
+    return entries
+
+
+def query_daemon(op: int, keyword: str, files: list, socket_path=None):
+    """
+    Run one search on the daemon.
+
+    Returns the decoded (file_idx, text, score) entries, or None when no
+    daemon is listening so the caller can search in-process instead.
+    """
+    socket_path = socket_path or daemon_socket()
+    if socket_path is None:
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(DAEMON_TIMEOUT)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    try:
+        with span("phase.daemon_query"):
+            sock.sendall(encode_request(op, keyword, files))
+            entries = _read_entries(sock)
+        increment("daemon_requests")
+        return entries
+    except (OSError, ConnectionError, RuntimeError, struct.error) as e:
+        logger.error("Daemon query failed, searching in-process: %s", e)
+        increment("daemon_errors")
+        return None
+    finally:
+        sock.close()
+
+
+class CorpusCache:
+    """
+    Key-to-path maps of ParamDef files kept in memory for the daemon's
+    lifetime.
+
+    Entries are keyed by path and revalidated by size and modification
+    time, so edited files are converted again on their next search. Only
+    the maps are kept: files are converted directly, without the module
+    cache and its snapshots.
+    """
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _load(self, paramdef, stamp):
+        from mcp_project.paramdef_handler.paramdef_arxml2json import convert_paramdef_to_json
+        from mcp_project.paramdef_handler.paramdef_shared_index import key_paths
+        from mcp_project.paramdef_handler.paramdef_matcher import FileKeys
+
+        try:
+            data = convert_paramdef_to_json(str(paramdef))
+        except SystemExit as e:
+            # find_module exits when there is no ECUC-MODULE-DEF
+            raise ValueError(str(e)) from None
+        paths = key_paths(data)
+        return stamp, FileKeys(sorted(paths)), paths
+
+    def iter_file_keys(self, paramdefs):
+        """Same contract as `paramdef_utils._iter_file_keys`."""
+        for paramdef in paramdefs:
+            try:
+                stat = os.stat(paramdef)
+            except OSError:
+                continue
+            stamp = (stat.st_size, stat.st_mtime_ns)
+            key = str(paramdef)
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != stamp:
+                with self._lock:
+                    entry = self._entries.get(key)
+                    if entry is None or entry[0] != stamp:
+                        try:
+                            entry = self._load(paramdef, stamp)
+                        except Exception as e:
+                            logger.error("Failed to convert '%s': %s", paramdef, e)
+                            continue
+                        self._entries[key] = entry
+                        increment("daemon_corpus_loads")
+            _, keys, paths = entry
+            yield paramdef, keys, paths.get
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _search(op: int, keyword: str, files: list, corpus: CorpusCache) -> list:
+    """Run a search over `files` and flatten the results into entries."""
+    from mcp_project.paramdef_handler import paramdef_utils
+
+    file_idx = {f: i for i, f in enumerate(files)}
+    source = corpus.iter_file_keys
+    if op == OP_PING:
+        return []
+    if op == OP_DEFINITION_FILES:
+        matches = paramdef_utils.get_definition_files(keyword, paramdefs=files, source=source) or []
+        return [(file_idx[f], match, score) for f, match, score in matches]
+    if op == OP_PATH_DIFFLIB:
+        paths = paramdef_utils.get_definition_path_difflib(keyword, paramdefs=files, source=source)
+        return [(file_idx[p["file"]], p["definition_path"], None) for p in paths]
+    if op == OP_PATH_RAPIDFUZZ:
+        paths = paramdef_utils.get_definition_path_rapidfuzz(keyword, paramdefs=files, source=source)
+        return [(file_idx[p["file"]], p["definition_path"], p["similarity_score"]) for p in paths]
+    raise ValueError(f"Unknown operation {op}")
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        sock = self.request
+        try:
+            magic, op, keyword_len, files_len = REQUEST.unpack(_recv_exactly(sock, REQUEST.size))
+            if magic != MAGIC:
+                raise ValueError("Bad request magic")
+            keyword = _recv_exactly(sock, keyword_len).decode("utf-8")
+            files_blob = _recv_exactly(sock, files_len).decode("utf-8")
+            files = files_blob.split("\0") if files_blob else []
+        except (ConnectionError, struct.error, ValueError, UnicodeDecodeError) as e:
+            logger.error("Rejected malformed request: %s", e)
+            return
+        try:
+            with span("daemon.request"):
+                response = encode_entries(_search(op, keyword, files, self.server.corpus))
+        except Exception as e:
+            logger.exception("Search failed")
+            response = encode_error(f"{type(e).__name__}: {e}")
+        sock.sendall(response)
+
+
+class ParamDefDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix-socket server owning one `CorpusCache`."""
+    daemon_threads = True
+
+    def __init__(self, socket_path):
+        self.corpus = CorpusCache()
+        self.socket_path = socket_path
+        super().__init__(socket_path, _RequestHandler)
+        os.chmod(socket_path, 0o600)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def start_daemon(socket_path=None) -> ParamDefDaemon:
+    """
+    Bind the daemon socket (removing a stale one) and return the server;
+    call `serve_forever()` on it. Raises RuntimeError if a daemon is
+    already listening.
+    """
+    socket_path = socket_path or daemon_socket()
+    if socket_path is None:
+        raise RuntimeError("No daemon socket configured or Unix sockets are unavailable")
+    if query_daemon(OP_PING, "", [], socket_path) is not None:
+        raise RuntimeError(f"A daemon is already listening on {socket_path}")
+    Path(socket_path).parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+    return ParamDefDaemon(socket_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ParamDef search daemon")
+    parser.add_argument("--socket", help="Unix socket path (default: PARAMDEF_DAEMON_SOCKET or DAEMON_SOCKET)")
+    args = parser.parse_args()
+    if not (args.socket or daemon_socket()):
+        parser.error("no socket configured: pass --socket or set PARAMDEF_DAEMON_SOCKET")
+
+    configure_logging()
+    server = start_daemon(args.socket)
+    logger.info("ParamDef daemon listening on %s", server.socket_path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+@author: GUU8HC
+Schema diff between two versions of the ParamDef definitions
+
+    python -m mcp_project.paramdef_handler.paramdef_diff <old> <new> [--json]
+
+`old` and `new` are ParamDef files, directories or globs (e.g. the R4.3 and
+R4.4 ParamDef folders). Every converted node gets a Merkle hash over its own
+attributes and the hashes of its children, so subtrees that did not change
+between the versions are skipped with a single comparison. Hashed trees are
+kept per file until the file changes, so repeated diffs only hash edited files.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+
+from mcp_project.paramdef_handler.paramdef_arxml2json import expand_inputs
+from mcp_project.paramdef_handler.paramdef_module_cache import get_module_cache
+from mcp_project.utils.logging_utils import get_logger, configure_logging
+from mcp_project.utils.metrics import span, increment
+
+logger = get_logger(__name__)
+
+
+class HashedNode:
+    """A converted ParamDef node with its Merkle hash."""
+    __slots__ = ("digest", "attributes", "children")
+
+    def __init__(self, digest: bytes, attributes: dict, children: dict):
+        self.digest = digest
+        self.attributes = attributes
+        self.children = children
+
+    @property
+    def type(self):
+        return self.attributes.get("type")
+
+
+def hash_tree(node: dict) -> HashedNode:
+    """
+    Hash a converted node bottom-up.
+
+    Scalar and list values are the node's own attributes; dict values are
+    sub-definitions. The hash covers the attributes and the (name, hash)
+    pairs of the children sorted by name, so reordering definitions in the
+    ARXML does not count as a change.
+    """
+    attributes, children = {}, {}
+    for key, value in node.items():
+        if isinstance(value, dict):
+            children[key] = hash_tree(value)
+        else:
+            attributes[key] = value
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json.dumps(attributes, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    for name in sorted(children):
+        h.update(b"\0" + name.encode("utf-8") + b"\0" + children[name].digest)
+    return HashedNode(h.digest(), attributes, children)
+
+
+# (size, mtime) stamp and {module name: HashedNode} per ParamDef file, see `_hashed_modules`
+_hashed_cache = {}
+
+
+def _hashed_modules(paramdef) -> dict:
+    """
+    Hashed modules of one file, computed once per version of the file (same
+    size and modification time) rather than per diff.
+    """
+    stat = os.stat(paramdef)
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    cached = _hashed_cache.get(str(paramdef))
+    if cached is not None and cached[0] == stamp:
+        increment("diff_hash_cache_hits")
+        return cached[1]
+    data = get_module_cache().get(paramdef)
+    with span("phase.hash"):
+        hashed = {module_name: hash_tree(module) for module_name, module in data.items()}
+    _hashed_cache[str(paramdef)] = (stamp, hashed)
+    return hashed
+
+
+def hash_paramdefs(inputs) -> dict:
+    """
+    Convert the ParamDef files behind `inputs` (through the module cache)
+    and hash every module, reusing the hashes of unchanged files.
+
+    Returns {module name: HashedNode}; files that fail to convert are
+    logged and left out. Raises FileNotFoundError when `inputs` match no file.
+    """
+    files = [f for f in expand_inputs(inputs) if f.is_file()]
+    if not files:
+        raise FileNotFoundError(f"No ParamDef files found in {', '.join(map(str, inputs))}")
+    modules = {}
+    for paramdef in files:
+        try:
+            hashed = _hashed_modules(paramdef)
+        except Exception as e:
+            logger.error("Failed to convert '%s': %s", paramdef, e)
+            continue
+        for module_name, module in hashed.items():
+            if module_name in modules:
+                logger.error("Module '%s' is defined twice, keeping the first one", module_name)
+                continue
+            modules[module_name] = module
+    return modules
+
+
+def _diff_nodes(path: str, old: HashedNode, new: HashedNode, changes: dict):
+    if old.digest == new.digest:
+        increment("diff_subtrees_skipped")
+        return
+
+    if old.attributes != new.attributes:
+        attributes = {}
+        for key in sorted(old.attributes.keys() | new.attributes.keys()):
+            before, after = old.attributes.get(key), new.attributes.get(key)
+            if before != after:
+                attributes[key] = {"old": before, "new": after}
+        changes["changed"].append({"definition_path": path, "type": new.type, "attributes": attributes})
+
+    for name, child in old.children.items():
+        if name not in new.children:
+            changes["removed"].append({"definition_path": f"{path}/{name}", "type": child.type})
+    for name, child in new.children.items():
+        if name not in old.children:
+            changes["added"].append({"definition_path": f"{path}/{name}", "type": child.type})
+        else:
+            _diff_nodes(f"{path}/{name}", old.children[name], child, changes)
+
+
+def diff_hashed(old: dict, new: dict) -> dict:
+    """
+    Diff two {module name: HashedNode} mappings.
+
+    Added and removed definitions are reported at the root of the subtree
+    that appeared or disappeared; changed definitions list their attributes
+    with the old and new values.
+    """
+    changes = {"added": [], "removed": [], "changed": []}
+    with span("phase.diff"):
+        for name, module in old.items():
+            if name not in new:
+                changes["removed"].append({"definition_path": name, "type": module.type})
+        for name, module in new.items():
+            if name not in old:
+                changes["added"].append({"definition_path": name, "type": module.type})
+            else:
+                _diff_nodes(name, old[name], module, changes)
+
+    for entries in changes.values():
+        entries.sort(key=lambda entry: entry["definition_path"])
+    return {"summary": {kind: len(entries) for kind, entries in changes.items()}, **changes}
+
+
+def diff_paramdefs(old_inputs, new_inputs) -> dict:
+    """Diff the ParamDef definitions behind two sets of files, directories or globs."""
+    return diff_hashed(hash_paramdefs(old_inputs), hash_paramdefs(new_inputs))
+
+
+def format_diff(diff: dict) -> str:
+    """One line per change: `+` added, `-` removed, `~` changed."""
+    lines = []
+    for sign, kind in (("-", "removed"), ("+", "added")):
+        for entry in diff[kind]:
+            lines.append(f"{sign} {entry['definition_path']} ({entry['type']})")
+    for entry in diff["changed"]:
+        lines.append(f"~ {entry['definition_path']} ({entry['type']})")
+        for key, values in entry["attributes"].items():
+            lines.append(f"    {key}: {values['old']!r} -> {values['new']!r}")
+    summary = diff["summary"]
+    lines.append(f"{summary['added']} added, {summary['removed']} removed, {summary['changed']} changed")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two versions of the ParamDef definitions")
+    parser.add_argument("old", help="Old ParamDef file, directory or glob")
+    parser.add_argument("new", help="New ParamDef file, directory or glob")
+    parser.add_argument("--json", action="store_true", help="Print the diff as JSON")
+    args = parser.parse_args()
+
+    configure_logging()
+    try:
+        diff = diff_paramdefs([args.old], [args.new])
+    except FileNotFoundError as e:
+        parser.error(str(e))
+    print(json.dumps(diff, indent=4) if args.json else format_diff(diff))
+    # Same convention as diff(1): 1 when the definitions differ
+    sys.exit(1 if any(diff["summary"].values()) else 0)
+
+
+if __name__ == "__main__":
+    main()
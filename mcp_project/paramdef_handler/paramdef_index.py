@@ -0,0 +1,283 @@
+"""
+@author: GUU8HC
+In-memory index over converted ParamDef modules
+"""
+
+import threading
+
+from mcp_project.paramdef_handler.paramdef_module_cache import get_module_cache
+from mcp_project.utils.generic_utils import fingerprint_files
+from mcp_project.utils.metrics import span, increment
+from mcp_project.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Node types emitted by the converter
+MODULE = "MODULE"
+CONTAINER = "CONTAINER"
+PARAMETER = "PARAMETER"
+REFERENCE = "REFERENCE"
+
+
+def path_key(definition_path: str) -> str:
+    """Normalized lookup key: no empty parts, lower case."""
+    return "/".join(p for p in definition_path.split("/") if p).lower()
+
+
+def value_key(value, param_type: str = None) -> str:
+    """Normalized value: stripped, case-folded; boolean 1/0 become true/false."""
+    key = str(value).strip().casefold()
+    if param_type == "BOOLEAN":
+        key = {"1": "true", "0": "false"}.get(key, key)
+    return key
+
+
+def iter_children(node: dict):
+    """Yield (name, child) for the sub-definitions of a converted ParamDef node."""
+    for key, value in node.items():
+        if isinstance(value, dict):
+            yield key, value
+
+
+class ParamDefIndex:
+    """
+    Index of every definition path in a set of ParamDef ARXML files.
+
+    Files are loaded through the module cache; afterwards definition paths
+    such as `com/comconfig/comipdu` resolve case-insensitively in O(1) to
+    their canonical spelling (`Com/ComConfig/ComIPdu`), source file and node.
+    The index itself keeps only paths, types and the reference and value
+    metadata; nodes are taken from the module cache when a path is resolved.
+    If `files` is None, the workspace ParamDef files are discovered on first use.
+    Files are read in path order; a module already indexed from an earlier
+    file is skipped with a warning.
+    """
+    def __init__(self, files=None):
+        self._files = files
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._modules = {}
+        self._paths = {}
+        self._references = []
+        self._ref_targets = {}
+        self._ref_referrers = {}
+        self._values = {}
+
+    def _discover(self) -> list:
+        from mcp_project.paramdef_handler.paramdef_utils import get_all_paramdef_files
+        return get_all_paramdef_files()
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            files = self._files if self._files is not None else self._discover()
+            for paramdef in sorted(files, key=str):
+                try:
+                    data = get_module_cache().get(paramdef)
+                except Exception as e:
+                    logger.error("Failed to convert '%s': %s", paramdef, e)
+                    continue
+                for module_name, module in data.items():
+                    self._add_module(str(paramdef), module_name, module)
+            with span("phase.reference_graph"):
+                self._build_reference_graph()
+            self._loaded = True
+
+    def _add_module(self, file: str, module_name: str, module: dict):
+        existing = self._modules.get(module_name.lower())
+        if existing is not None:
+            logger.warning("Module '%s' in '%s' is already indexed from '%s'; ignoring it",
+                           module_name, file, existing["file"])
+            increment("module_collisions")
+            return
+        self._modules[module_name.lower()] = {
+            "name": module_name,
+            "file": file,
+        }
+        stack = [(module_name, module)]
+        while stack:
+            path, node = stack.pop()
+            self._paths[path.lower()] = {
+                "file": file,
+                "definition_path": path,
+                "type": node.get("type"),
+            }
+            if node.get("type") == REFERENCE:
+                self._references.append({
+                    "path": path,
+                    "ref_type": node.get("ref_type"),
+                    "multiplicity": node.get("multiplicity", "1"),
+                    "destinations": node.get("destinations", []),
+                    "destinationType": node.get("destinationType"),
+                })
+            elif node.get("type") == PARAMETER:
+                self._add_values(path, node)
+            for name, child in iter_children(node):
+                stack.append((f"{path}/{name}", child))
+
+    def _add_values(self, path: str, node: dict):
+        """Record the enumeration literals and the default value of a parameter."""
+        for literal in node.get("literals", []):
+            self._values.setdefault(value_key(literal), []).append({
+                "definition_path": path,
+                "kind": "literal",
+                "value": literal,
+            })
+        if "defaultValue" in node:
+            self._values.setdefault(value_key(node["defaultValue"], node.get("param_type")), []).append({
+                "definition_path": path,
+                "kind": "default",
+                "value": node["defaultValue"],
+            })
+
+    def _resolve_destination(self, destination: str):
+        """
+        Map an AUTOSAR destination reference such as
+        `/AUTOSAR/EcucDefs/EcuC/EcucConfigSet/EcucPduCollection/Pdu` to an
+        indexed definition path by dropping leading package parts.
+        """
+        parts = [p for p in destination.split("/") if p]
+        for i in range(len(parts)):
+            entry = self._paths.get("/".join(parts[i:]).lower())
+            if entry is not None:
+                return entry["definition_path"]
+        return None
+
+    def _build_reference_graph(self):
+        """Precompute referrer -> targets and target -> referrers maps."""
+        for ref in self._references:
+            path = ref["path"]
+            targets = []
+            for destination in ref["destinations"]:
+                target = self._resolve_destination(destination)
+                targets.append({
+                    "destination": destination,
+                    "definition_path": target,
+                })
+                if target is not None:
+                    self._ref_referrers.setdefault(target.lower(), []).append({
+                        "reference": path,
+                        "ref_type": ref["ref_type"],
+                    })
+            if not targets and ref["destinationType"]:
+                targets.append({
+                    "destinationType": ref["destinationType"],
+                    "definition_path": None,
+                })
+            self._ref_targets[path.lower()] = {
+                "reference": path,
+                "ref_type": ref["ref_type"],
+                "multiplicity": ref["multiplicity"],
+                "targets": targets,
+            }
+        # Only needed to build the maps
+        self._references = []
+
+    def references_from(self, definition_path: str):
+        """Targets of a reference definition, or None if it is not a reference."""
+        self._ensure_loaded()
+        return self._ref_targets.get(path_key(definition_path))
+
+    def references_to(self, definition_path: str) -> list:
+        """Reference definitions whose destination is `definition_path`."""
+        self._ensure_loaded()
+        return self._ref_referrers.get(path_key(definition_path), [])
+
+    @property
+    def files(self) -> list:
+        self._ensure_loaded()
+        return sorted({m["file"] for m in self._modules.values()})
+
+    def modules(self) -> list:
+        """Canonical names of all indexed modules."""
+        self._ensure_loaded()
+        return [m["name"] for m in self._modules.values()]
+
+    def definition_paths(self) -> list:
+        """Canonical spelling of every indexed definition path."""
+        self._ensure_loaded()
+        return [entry["definition_path"] for entry in self._paths.values()]
+
+    def values(self) -> list:
+        """Every normalized enumeration literal and default value."""
+        self._ensure_loaded()
+        return list(self._values)
+
+    def parameters_with_value(self, value) -> list:
+        """
+        Parameters having `value` (compared by `value_key`) as an enumeration
+        literal or default, as {'definition_path', 'kind', 'value'} where
+        kind is 'literal' or 'default' and value is the ParamDef spelling.
+        """
+        self._ensure_loaded()
+        return self._values.get(value_key(value), [])
+
+    def _node(self, file: str, definition_path: str):
+        """Converted node of `definition_path` from the module cache, or None if it is gone."""
+        try:
+            node = get_module_cache().get(file)
+            for part in definition_path.split("/"):
+                node = node[part]
+            return node
+        except Exception as e:
+            logger.warning("Cannot load '%s' from '%s': %s", definition_path, file, e)
+            return None
+
+    def get_module(self, name: str):
+        """Return {'name', 'file', 'data'} for a module (case-insensitive) or None."""
+        self._ensure_loaded()
+        module = self._modules.get(name.lower())
+        if module is None:
+            return None
+        data = self._node(module["file"], module["name"])
+        return None if data is None else {**module, "data": data}
+
+    def resolve(self, definition_path: str):
+        """
+        Resolve a '/' separated definition path case-insensitively.
+
+        Returns {'file', 'definition_path', 'type', 'node'} or None if the
+        path does not exist in any indexed module.
+        """
+        self._ensure_loaded()
+        entry = self._paths.get(path_key(definition_path))
+        if entry is None:
+            return None
+        node = self._node(entry["file"], entry["definition_path"])
+        return None if node is None else {**entry, "node": node}
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._paths)
+
+
+_default_index = None
+_default_fingerprint = None
+_default_index_lock = threading.Lock()
+
+
+def get_paramdef_index() -> ParamDefIndex:
+    """
+    Process-wide index over the workspace ParamDef files.
+
+    The files are discovered on every call and a new index is built when
+    their fingerprint (paths, sizes and modification times) changes. The
+    process-wide completer, speller, validator and value lookup are rebuilt
+    when they see a new index.
+    """
+    global _default_index, _default_fingerprint
+    from mcp_project.paramdef_handler.paramdef_utils import get_all_paramdef_files
+
+    files = sorted(get_all_paramdef_files(), key=str)
+    fingerprint = fingerprint_files(files)
+    if _default_index is None or _default_fingerprint != fingerprint:
+        with _default_index_lock:
+            if _default_index is None or _default_fingerprint != fingerprint:
+                if _default_index is not None:
+                    logger.info("ParamDef files changed, rebuilding the index over %d files", len(files))
+                _default_index = ParamDefIndex(files)
+                _default_fingerprint = fingerprint
+    return _default_index
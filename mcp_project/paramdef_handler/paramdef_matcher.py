@@ -0,0 +1,284 @@
+"""
+@author: GUU8HC
+Fuzzy matching of keywords against ParamDef keys with pluggable scorers
+
+Every scorer runs through the same pipeline: the (paramdef, keys, lookup)
+corpus from `paramdef_utils._iter_file_keys` (or the daemon's corpus), a
+per-file candidate limit, a global top-n merge and a score cutoff that can be
+overridden per call. Scores are normalized to 0..100.
+
+Large corpora are scored with one `process.cdist` call over the keys of all
+files, which RapidFuzz shards across worker threads outside the GIL.
+"""
+
+import os
+import heapq
+from itertools import islice
+from difflib import SequenceMatcher
+
+from rapidfuzz import process, fuzz, utils
+from rapidfuzz.distance import JaroWinkler
+
+from mcp_project.paramdef_handler.paramdef_settings import (
+    DIFFLIB_NUMBER_OF_RESULTS,
+    DIFFLIB_CUTOFF,
+    RAPIDFUZZ_NUMBER_OF_RESULTS,
+    RAPIDFUZZ_CUTOFF,
+    RAPIDFUZZ_MAX_RESULTS,
+    MATCHER_WORKERS,
+    MATCHER_PARALLEL_MIN_KEYS,
+)
+from mcp_project.utils.metrics import span, increment
+from mcp_project.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Score margin (0..100) below the running n-th best score still fetched per file
+THRESHOLD_MARGIN = 0.01
+
+
+def max_possible_score(query_length: int, key_lengths) -> float:
+    """
+    Upper bound of `fuzz.WRatio` between a query and any key, from lengths only.
+
+    WRatio takes the plain ratio (and token ratios) when the longer string is
+    less than 1.5 times the shorter, otherwise it scales partial ratios by 0.9
+    (up to 8 times longer) or 0.6, and the plain ratio can then be at most 80.
+    """
+    best = 0.0
+    for length in key_lengths:
+        if not length or not query_length:
+            continue
+        longer, shorter = max(query_length, length), min(query_length, length)
+        if longer < 1.5 * shorter:
+            return 100.0
+        best = max(best, 90.0 if longer <= 8 * shorter else 60.0)
+    return best
+
+
+class FileKeys(list):
+    """
+    Keys of one file with the set of their lengths, computed once when the
+    corpus is built so that `Scorer.bound` does not scan the keys per query.
+    """
+    def __init__(self, keys=()):
+        super().__init__(keys)
+        self.lengths = frozenset(len(key) for key in self)
+
+
+def key_lengths(keys) -> set:
+    """Lengths of `keys`, precomputed for `FileKeys` and read from the shared index file for its keys."""
+    lengths = getattr(keys, "lengths", None)
+    return lengths if lengths is not None else {len(key) for key in keys}
+
+
+def _rapidfuzz_matcher(scorer, processor=None, scale=1.0):
+    def match(keyword: str, keys: list, n: int, cutoff: float) -> list:
+        matches = process.extract(
+            keyword,
+            keys,
+            scorer=scorer,
+            processor=processor,
+            limit=n,
+            score_cutoff=cutoff / scale
+        )
+        return [(key, score * scale) for key, score, _ in matches]
+    match.cdist = (scorer, processor, scale)
+    return match
+
+
+def _difflib_match(keyword: str, keys: list, n: int, cutoff: float) -> list:
+    """
+    Same results as `difflib.get_close_matches`, without running
+    SequenceMatcher on most keys: the Indel ratio (`fuzz.ratio`) is an
+    upper bound of `SequenceMatcher.ratio`, so RapidFuzz discards every key
+    below the cutoff first.
+    """
+    candidates = process.extract(keyword, keys, scorer=fuzz.ratio, score_cutoff=cutoff, limit=None)
+    s = SequenceMatcher()
+    s.set_seq2(keyword)
+    result = []
+    for key, _, _ in candidates:
+        s.set_seq1(key)
+        ratio = s.ratio() * 100
+        if ratio >= cutoff:
+            result.append((ratio, key))
+    return [(key, score) for score, key in heapq.nlargest(n, result)]
+
+
+class Scorer:
+    """
+    A named similarity measure with its default limits.
+
+    `match(keyword, keys, n, cutoff)` returns up to `n` (key, score) pairs
+    with score >= cutoff (0..100). `bound(query_length, key_lengths)`, if
+    given, is an upper bound of the score over a file, used to skip files
+    that cannot reach the current n-th best score. `cdist` is the
+    (scorer, processor, scale) of RapidFuzz scorers, which can be run in
+    parallel; None for the others.
+    """
+    def __init__(self, name, match, per_file, n, cutoff, bound=None):
+        self.name = name
+        self.match = match
+        self.per_file = per_file
+        self.n = n
+        self.cutoff = cutoff
+        self.bound = bound
+        self.cdist = getattr(match, "cdist", None)
+
+
+SCORERS = {
+    scorer.name: scorer for scorer in (
+        Scorer("wratio", _rapidfuzz_matcher(fuzz.WRatio),
+               RAPIDFUZZ_NUMBER_OF_RESULTS, RAPIDFUZZ_MAX_RESULTS, RAPIDFUZZ_CUTOFF, bound=max_possible_score),
+        Scorer("token_set", _rapidfuzz_matcher(fuzz.token_set_ratio, utils.default_process),
+               RAPIDFUZZ_NUMBER_OF_RESULTS, RAPIDFUZZ_MAX_RESULTS, RAPIDFUZZ_CUTOFF),
+        Scorer("qratio", _rapidfuzz_matcher(fuzz.QRatio, utils.default_process),
+               RAPIDFUZZ_NUMBER_OF_RESULTS, RAPIDFUZZ_MAX_RESULTS, RAPIDFUZZ_CUTOFF),
+        Scorer("jaro_winkler", _rapidfuzz_matcher(JaroWinkler.normalized_similarity, utils.default_process, 100.0),
+               RAPIDFUZZ_NUMBER_OF_RESULTS, RAPIDFUZZ_MAX_RESULTS, RAPIDFUZZ_CUTOFF),
+        Scorer("difflib", _difflib_match,
+               DIFFLIB_NUMBER_OF_RESULTS, None, DIFFLIB_CUTOFF),
+    )
+}
+
+
+def get_scorer(name: str) -> Scorer:
+    scorer = SCORERS.get(name)
+    if scorer is None:
+        raise ValueError(f"Unknown scorer '{name}', expected one of: {', '.join(SCORERS)}")
+    return scorer
+
+
+def close_matches(keyword: str, keys: list, scorer: Scorer, n: int, cutoff: float) -> list:
+    """Best `n` keys of one file as (key, score) pairs, best first, ties by key."""
+    increment("candidates_scored", len(keys))
+    with span("phase.fuzzy_scoring"):
+        matches = scorer.match(keyword, keys, n, cutoff)
+    return sorted(matches, key=lambda m: (-m[1], m[0]))
+
+
+def matcher_workers() -> int:
+    """Scoring threads: PARAMDEF_MATCHER_WORKERS or MATCHER_WORKERS (-1: all cores)."""
+    return int(os.environ.get("PARAMDEF_MATCHER_WORKERS", MATCHER_WORKERS))
+
+
+def close_matches_parallel(keyword: str, files: list, scorer: Scorer, n: int, cutoff: float, workers: int) -> list:
+    """
+    `close_matches` of every file, scored in one `process.cdist` call over
+    the keys of all files on `workers` threads. Returns one list per file.
+    """
+    import numpy as np
+
+    rf_scorer, processor, scale = scorer.cdist
+    keys = [key for _, file_keys, _ in files for key in file_keys]
+    increment("candidates_scored", len(keys))
+    with span("phase.fuzzy_scoring"):
+        scores = process.cdist(
+            [keyword],
+            keys,
+            scorer=rf_scorer,
+            processor=processor,
+            score_cutoff=cutoff / scale,
+            dtype=np.float64,
+            workers=workers
+        )[0]
+
+    per_file, start = [], 0
+    for _, file_keys, _ in files:
+        file_scores = scores[start:start + len(file_keys)]
+        start += len(file_keys)
+        idx = np.flatnonzero(file_scores >= cutoff / scale)
+        if n is not None and len(idx) > n:
+            # Same keys as `process.extract`: best scores, ties by position in the file
+            idx = idx[np.argsort(-file_scores[idx], kind="stable")[:n]]
+        per_file.append(sorted(((file_keys[i], float(file_scores[i]) * scale) for i in idx), key=lambda m: (-m[1], m[0])))
+    return per_file
+
+
+def match(keyword: str, files, resolve, scorer="wratio", n=None, cutoff=None, per_file=None, workers=None) -> list:
+    """
+    Best matches of `keyword` over all `files` as (score, value, paramdef)
+    tuples, best first.
+
+    `files` yields (paramdef, keys, lookup) tuples and `resolve(lookup, key)`
+    turns a matched key into the reported value (None drops the match).
+    `n`, `cutoff` (0..1) and `per_file` default to the scorer's settings;
+    `n=None` keeps every per-file match. Ties are ordered by value, then
+    file order. An `n` below 1 or a `cutoff` outside 0..1 raises ValueError.
+
+    RapidFuzz scorers run on `workers` threads (-1: all cores) through
+    `close_matches_parallel`. By default (`workers=None`) that happens with
+    `matcher_workers()` threads once the corpus has MATCHER_PARALLEL_MIN_KEYS
+    keys. Otherwise files are scored one by one; when the scorer has a
+    bound, in order of their bound, with the per-file cutoff raised to the
+    current n-th best score, stopping once no remaining file can reach it.
+    """
+    scorer = scorer if isinstance(scorer, Scorer) else get_scorer(scorer)
+    if n is not None and n < 1:
+        raise ValueError(f"Number of results must be at least 1, got {n}")
+    if cutoff is not None and not 0 <= cutoff <= 1:
+        raise ValueError(f"Cutoff must be between 0 and 1, got {cutoff}")
+    n = scorer.n if n is None else n
+    cutoff = (scorer.cutoff if cutoff is None else cutoff) * 100
+    per_file = scorer.per_file if per_file is None else per_file
+
+    files = list(files)
+    if workers is None:
+        workers = matcher_workers() if sum(len(keys) for _, keys, _ in files) >= MATCHER_PARALLEL_MIN_KEYS else 1
+    if workers != 1 and scorer.cdist is not None:
+        increment("parallel_searches")
+        per_file_entries = [
+            _entries(file_idx, files[file_idx], matches, resolve)
+            for file_idx, matches in enumerate(close_matches_parallel(keyword, files, scorer, per_file, cutoff, workers))
+        ]
+        return _merge(per_file_entries, n)
+
+    if scorer.bound is not None:
+        bounds = [scorer.bound(len(keyword), key_lengths(keys)) for _, keys, _ in files]
+        order = sorted(range(len(files)), key=lambda i: -bounds[i])
+    else:
+        bounds = None
+        order = range(len(files))
+
+    kth_best = []
+    per_file_entries = []
+    for position, file_idx in enumerate(order):
+        threshold = kth_best[0] if n is not None and len(kth_best) == n else None
+        if threshold is not None and bounds is not None and bounds[file_idx] < threshold:
+            increment("files_pruned", len(order) - position)
+            break
+
+        paramdef, keys, _ = files[file_idx]
+        logger.debug("Searching %s", paramdef)
+        # RapidFuzz's batched scorers apply a cutoff with a small rounding error;
+        # the margin keeps keys tied with the threshold, the merge drops the rest
+        file_cutoff = cutoff if threshold is None else max(cutoff, threshold - THRESHOLD_MARGIN)
+        matches = close_matches(keyword, keys, scorer, per_file, file_cutoff)
+        entries = _entries(file_idx, files[file_idx], matches, resolve)
+        if n is not None:
+            for neg_score, *_ in entries:
+                heapq.heappush(kth_best, -neg_score)
+                if len(kth_best) > n:
+                    heapq.heappop(kth_best)
+        per_file_entries.append(entries)
+    return _merge(per_file_entries, n)
+
+
+def _entries(file_idx: int, file: tuple, matches: list, resolve) -> list:
+    """Sorted (-score, value, file_idx, rank, paramdef) entries of one file."""
+    paramdef, _, lookup = file
+    entries = []
+    for rank, (key, score) in enumerate(matches):
+        with span("phase.find_path"):
+            value = resolve(lookup, key)
+        if value is not None:
+            entries.append((-score, value, file_idx, rank, paramdef))
+    return sorted(entries)
+
+
+def _merge(per_file_entries: list, n) -> list:
+    merged = heapq.merge(*per_file_entries)
+    if n is not None:
+        merged = islice(merged, n)
+    return [(-neg_score, value, paramdef) for neg_score, value, _, _, paramdef in merged]
@@ -0,0 +1,224 @@
+"""
+@author: GUU8HC
+Memory-bounded cache of converted ParamDef files
+"""
+
+import os
+import sys
+import json
+import hashlib
+import threading
+from pathlib import Path
+from collections import OrderedDict
+
+from mcp_project.paramdef_handler.paramdef_arxml2json import convert_paramdef_to_json
+from mcp_project.paramdef_handler.paramdef_settings import (
+    MODULE_CACHE_BUDGET_MB,
+    MODULE_CACHE_POLICY,
+    MODULE_CACHE_DIR,
+    MODULE_CACHE_PINNED,
+)
+from mcp_project.utils.generic_utils import fingerprint_files
+from mcp_project.utils.logging_utils import get_logger
+from mcp_project.utils.metrics import METRICS, span, increment
+
+logger = get_logger(__name__)
+
+# Bump when the snapshot layout changes
+SNAPSHOT_VERSION = 2
+LRU = "lru"
+LFU = "lfu"
+
+
+def estimate_size(data) -> int:
+    """
+    Approximate memory held by converted data: `sys.getsizeof` of every
+    dict, list and string reached from `data`, each object counted once.
+    """
+    seen = set()
+    total = 0
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+    return total
+
+
+def snapshot_prefix(paramdef) -> str:
+    """Per-file part of snapshot names: a hash of the resolved path."""
+    return hashlib.sha1(str(Path(paramdef).resolve()).encode("utf-8")).hexdigest()[:16]
+
+
+def prune_snapshots(directory: Path, prefix: str, keep: Path) -> int:
+    """Remove the `<prefix>-*.json` snapshots in `directory` except `keep`; returns how many."""
+    removed = 0
+    for stale in Path(directory).glob(f"{prefix}-*.json"):
+        if stale != keep:
+            try:
+                stale.unlink()
+                removed += 1
+            except OSError as e:
+                logger.debug("Could not remove stale snapshot '%s': %s", stale, e)
+    return removed
+
+
+class _Entry:
+    __slots__ = ("stamp", "data", "size", "hits", "pinned")
+
+    def __init__(self, stamp, data, size, pinned):
+        self.stamp = stamp
+        self.data = data
+        self.size = size
+        self.hits = 1
+        self.pinned = pinned
+
+
+class ModuleCache:
+    """
+    Converted ParamDef files kept in memory within a byte budget.
+
+    `get(paramdef)` returns `convert_paramdef_to_json(paramdef)`, served from
+    memory while the file is unchanged (same size and modification time).
+    Each entry is charged its `estimate_size`; when the total exceeds
+    `budget_bytes` entries are evicted least recently used first (`lru`)
+    or least frequently used first, oldest first among equals (`lfu`).
+    Files defining one of the `pinned` modules are never evicted.
+
+    Evicted files are reloaded from a JSON snapshot in `snapshot_dir`
+    instead of parsing the ARXML again; `snapshot_dir=None` disables
+    snapshots. Snapshots are named `<path hash>-<fingerprint>.json`, and
+    the snapshots of earlier versions of a file are removed when a new one
+    is written. The returned data is shared and must not be modified.
+    """
+    def __init__(self, budget_bytes: int, policy: str = LFU, snapshot_dir=None, pinned=()):
+        if policy not in (LRU, LFU):
+            raise ValueError(f"Unknown eviction policy '{policy}', expected '{LRU}' or '{LFU}'")
+        self.budget_bytes = budget_bytes
+        self.policy = policy
+        self._snapshot_dir = Path(snapshot_dir) if snapshot_dir else None
+        self._pinned = {name.lower() for name in pinned}
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Bytes currently charged to cached entries."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, paramdef) -> bool:
+        return str(paramdef) in self._entries
+
+    def _load(self, paramdef, stamp) -> dict:
+        snapshot_path = None
+        if self._snapshot_dir is not None:
+            prefix = snapshot_prefix(paramdef)
+            key = fingerprint_files([paramdef], salt=f"v{SNAPSHOT_VERSION}")
+            snapshot_path = self._snapshot_dir / f"{prefix}-{key}.json"
+            if snapshot_path.exists():
+                try:
+                    with span("phase.module_snapshot_load"):
+                        data = json.loads(snapshot_path.read_text(encoding="utf-8"))
+                    increment("module_cache_snapshot_loads")
+                    return data
+                except Exception as e:
+                    logger.error("Ignoring unreadable module snapshot '%s': %s", snapshot_path, e)
+
+        try:
+            with span("phase.parse"):
+                data = convert_paramdef_to_json(paramdef)
+        except SystemExit as e:
+            # find_module exits when there is no ECUC-MODULE-DEF
+            raise ValueError(str(e)) from None
+        increment("files_parsed")
+        if snapshot_path is not None:
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            tmp_path.replace(snapshot_path)
+            increment("module_cache_snapshots_pruned", prune_snapshots(self._snapshot_dir, prefix, snapshot_path))
+        return data
+
+    def get(self, paramdef) -> dict:
+        stat = os.stat(paramdef)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        key = str(paramdef)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp == stamp:
+                entry.hits += 1
+                self._entries.move_to_end(key)
+                increment("module_cache_hits")
+                return entry.data
+
+        increment("module_cache_misses")
+        data = self._load(paramdef, stamp)
+        size = estimate_size(data)
+        pinned = any(name.lower() in self._pinned for name in data)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old.size
+            if pinned or size <= self.budget_bytes:
+                self._entries[key] = _Entry(stamp, data, size, pinned)
+                self._size += size
+                self._evict()
+            METRICS.set_gauge("module_cache_bytes", self._size)
+            METRICS.set_gauge("module_cache_entries", len(self._entries))
+        return data
+
+    def _victim(self):
+        candidates = [(key, entry) for key, entry in self._entries.items() if not entry.pinned]
+        if not candidates:
+            return None
+        if self.policy == LRU:
+            return candidates[0][0]
+        # Entries are in recency order, so min() keeps the oldest among equal counts
+        return min(candidates, key=lambda item: item[1].hits)[0]
+
+    def _evict(self):
+        while self._size > self.budget_bytes:
+            key = self._victim()
+            if key is None:
+                return
+            entry = self._entries.pop(key)
+            self._size -= entry.size
+            increment("module_cache_evictions")
+            logger.debug("Evicted %s (%d bytes, %d hits)", key, entry.size, entry.hits)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+def module_cache_budget() -> int:
+    """Budget in bytes: PARAMDEF_MODULE_CACHE_MB or MODULE_CACHE_BUDGET_MB."""
+    return int(float(os.environ.get("PARAMDEF_MODULE_CACHE_MB", MODULE_CACHE_BUDGET_MB)) * 1024 * 1024)
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_module_cache() -> ModuleCache:
+    """Process-wide module cache."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = ModuleCache(
+                    module_cache_budget(), MODULE_CACHE_POLICY, MODULE_CACHE_DIR, MODULE_CACHE_PINNED
+                )
+    return _default_cache
@@ -2,12 +2,70 @@ TEXT_OUTPUT = False
 TREE_SIMPLE = False
 TREE_DETAILED = True
 
-DEBUG = True
-
 # DIFFLIB
 DIFFLIB_NUMBER_OF_RESULTS = 10
 DIFFLIB_CUTOFF = 0.6
 
 # RAPIDFUZZ
 RAPIDFUZZ_NUMBER_OF_RESULTS = 2
-RAPIDFUZZ_CUTOFF = 0.6
\ No newline at end of file
+RAPIDFUZZ_CUTOFF = 0.6
+RAPIDFUZZ_MAX_RESULTS = 10   # results over all files
+
+# MATCHER
+# RapidFuzz scorers run on MATCHER_WORKERS threads (-1: all cores) once the
+# corpus has MATCHER_PARALLEL_MIN_KEYS keys; smaller corpora are scored file
+# by file. Overridden by PARAMDEF_MATCHER_WORKERS.
+MATCHER_WORKERS = -1
+MATCHER_PARALLEL_MIN_KEYS = 50000
+
+# PARAMETER VALIDATION
+VALIDATOR_SUGGESTIONS = 3
+VALIDATOR_SUGGESTION_CUTOFF = 60
+
+# SHARED KEY/PATH INDEX
+# Directory for the memory-mapped index shared by all server processes on a
+# host (e.g. "/dev/shm/paramdef"); None converts the files on every search.
+# Overridden by the PARAMDEF_SHARED_INDEX_DIR environment variable.
+SHARED_INDEX_DIR = None
+SHARED_INDEX_LOCK_TIMEOUT = 120.0
+
+# LOCAL SEARCH DAEMON
+# Unix socket of the optional daemon
+# (python -m mcp_project.paramdef_handler.paramdef_daemon), opt-in: set it
+# here or in PARAMDEF_DAEMON_SOCKET, e.g. ~/.cache/paramdef_search/daemon.sock.
+# Searches then go to the daemon when it is running and fall back to
+# in-process search otherwise; empty disables the client.
+DAEMON_SOCKET = ""
+DAEMON_TIMEOUT = 30.0
+
+# MODULE SUMMARIES
+# Cache of per-module statistics served by get_paramdef_summary
+SUMMARY_CACHE_DIR = "_out/.cache/paramdef_summary"
+
+# SPELL CORRECTION
+# Short-names within SPELL_MAX_DISTANCE edits (insertions, deletions,
+# substitutions, adjacent transpositions) are offered as corrections
+SPELL_MAX_DISTANCE = 2
+SPELL_PREFIX_LENGTH = 7
+SPELL_MAX_RESULTS = 5
+
+# MODULE CACHE
+# Converted ParamDef files kept in memory by searches and parse_paramdef_to_json.
+# Above the budget the least frequently ("lfu") or least recently ("lru")
+# used files are evicted and later reloaded from their JSON snapshot in
+# MODULE_CACHE_DIR (None: parsed again). Files defining a pinned module stay
+# resident. The budget is overridden by PARAMDEF_MODULE_CACHE_MB.
+MODULE_CACHE_BUDGET_MB = 256
+MODULE_CACHE_POLICY = "lfu"
+MODULE_CACHE_DIR = "_out/.cache/paramdef_modules"
+MODULE_CACHE_PINNED = ("Com", "PduR", "CanIf")
+
+# PATH COMPLETION
+# Children offered per completion of a partial definition path
+COMPLETION_MAX_RESULTS = 50
+
+# VALUE LOOKUP
+# Enumeration literals and default values matched by find_parameters_by_value
+# (QRatio on case-folded values, 0..1)
+VALUE_LOOKUP_CUTOFF = 0.8
+VALUE_LOOKUP_MAX_RESULTS = 10
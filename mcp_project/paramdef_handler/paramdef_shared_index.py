@@ -0,0 +1,327 @@
+"""
+@author: GUU8HC
+Read-only key/path index shared by all server processes through mmap
+"""
+
+import os
+import mmap
+import struct
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from collections.abc import Sequence
+
+from mcp_project.paramdef_handler.paramdef_module_cache import get_module_cache
+from mcp_project.paramdef_handler.paramdef_settings import (
+    SHARED_INDEX_DIR,
+    SHARED_INDEX_LOCK_TIMEOUT,
+)
+from mcp_project.utils.file_lock import FileLock
+from mcp_project.utils.generic_utils import fingerprint_files
+from mcp_project.utils.logging_utils import get_logger
+from mcp_project.utils.metrics import span, increment
+
+logger = get_logger(__name__)
+
+# Bump when the binary layout or the key/path semantics change
+INDEX_VERSION = 3
+MAGIC = b"PDKIDX02"
+
+# magic, file count, record count, offsets of the file table, records, key lengths and strings
+HEADER = struct.Struct("<8sIIQQQQ")
+# path offset, path length, first record, record count, first key length, key length count
+FILE_ENTRY = struct.Struct("<QIIIII")
+# key offset, key length, definition path offset, definition path length
+RECORD = struct.Struct("<QIQI")
+# distinct key length in characters, for `Scorer.bound`
+KEY_LENGTH = struct.Struct("<I")
+
+
+def key_paths(data: dict) -> dict:
+    """
+    Map every key of converted ParamDef data to its first path.
+
+    Equivalent to `find_path(data, key)` for each key of `get_keys(data)`:
+    keys are visited depth-first in document order and the first path whose
+    last part equals the key case-insensitively wins.
+    """
+    first = {}
+    keys = set()
+    stack = [(iter(data.items()), [])]
+    while stack:
+        items, path = stack[-1]
+        item = next(items, None)
+        if item is None:
+            stack.pop()
+            continue
+        key, value = item
+        new_path = path + [key]
+        keys.add(key)
+        first.setdefault(key.lower(), new_path)
+        if isinstance(value, dict):
+            stack.append((iter(value.items()), new_path))
+    return {key: "/".join(first[key.lower()]) for key in keys}
+
+
+def build_shared_index(files, out_path) -> Path:
+    """
+    Convert `files` (through the module cache) and write their key/path
+    index to `out_path`.
+
+    The file is written next to its final name and renamed into place, so
+    processes attaching concurrently only ever see complete indexes.
+    """
+    strings = bytearray()
+
+    def add_string(text: str) -> tuple:
+        encoded = text.encode("utf-8")
+        offset = len(strings)
+        strings.extend(encoded)
+        return offset, len(encoded)
+
+    file_entries, records, lengths = [], [], []
+    for paramdef in files:
+        try:
+            data = get_module_cache().get(paramdef)
+        except Exception as e:
+            logger.error("Failed to convert '%s': %s", paramdef, e)
+            continue
+        paths = key_paths(data)
+        # Byte order of UTF-8 equals code point order, so readers can bisect
+        ordered = sorted(paths.items(), key=lambda item: item[0].encode("utf-8"))
+        file_lengths = sorted({len(key) for key in paths})
+        file_entries.append((*add_string(str(paramdef)), len(records), len(ordered), len(lengths), len(file_lengths)))
+        lengths.extend(file_lengths)
+        for key, definition_path in ordered:
+            records.append((*add_string(key), *add_string(definition_path)))
+
+    files_off = HEADER.size
+    records_off = files_off + FILE_ENTRY.size * len(file_entries)
+    lengths_off = records_off + RECORD.size * len(records)
+    strings_off = lengths_off + KEY_LENGTH.size * len(lengths)
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(f"{out_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(file_entries), len(records), files_off, records_off, lengths_off, strings_off))
+        for entry in file_entries:
+            f.write(FILE_ENTRY.pack(*entry))
+        for record in records:
+            f.write(RECORD.pack(*record))
+        for length in lengths:
+            f.write(KEY_LENGTH.pack(length))
+        f.write(strings)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+class MappedKeys(Sequence):
+    """
+    Sorted keys of one file in a `SharedPathIndex`, decoded from the mapped
+    string table on access and never cached. `lengths` comes from the index
+    file, so `Scorer.bound` can prune the file without decoding any key.
+    """
+    __slots__ = ("_index", "_start", "_count", "_lengths")
+
+    def __init__(self, index, start: int, count: int, lengths: tuple):
+        self._index = index
+        self._start = start
+        self._count = count
+        self._lengths = lengths
+
+    @property
+    def lengths(self) -> frozenset:
+        first, count = self._lengths
+        return frozenset(length for length, in KEY_LENGTH.iter_unpack(self._index.key_lengths_table(first, count)))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return self._index.key(self._start + i)
+
+    def __iter__(self):
+        for record_idx in range(self._start, self._start + self._count):
+            yield self._index.key(record_idx)
+
+
+class SharedPathIndex:
+    """
+    Key/path index attached read-only from a memory-mapped file.
+
+    All processes mapping the same file share its pages through the page
+    cache, and keys are decoded per query without being cached, so
+    attaching another server process adds no memory for the index.
+
+    An index replaced by a newer corpus is retired: it is closed as soon as
+    no query holds it any more (see `shared_path_index`).
+    """
+    def __init__(self, path):
+        self._path = Path(path)
+        with open(self._path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, self._n_files, self._n_records, self._files_off, self._records_off, self._lengths_off,
+         self._strings_off) = HEADER.unpack_from(self._mm, 0)
+        self._lock = threading.Lock()
+        self._users = 0
+        self._retired = False
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"'{self._path}' is not a shared ParamDef index")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        return self._mm.closed
+
+    def close(self):
+        self._mm.close()
+
+    def acquire(self) -> bool:
+        """Hold the index for a query; False if it has already been closed."""
+        with self._lock:
+            if self._mm.closed:
+                return False
+            self._users += 1
+            return True
+
+    def release(self):
+        with self._lock:
+            self._users -= 1
+            if self._retired and self._users == 0:
+                self._mm.close()
+                increment("shared_index_closes")
+
+    def retire(self):
+        """Close the index once the queries holding it have released it."""
+        with self._lock:
+            self._retired = True
+            if self._users == 0 and not self._mm.closed:
+                self._mm.close()
+                increment("shared_index_closes")
+
+    def __len__(self) -> int:
+        return self._n_records
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_off + offset
+        return self._mm[start:start + length].decode("utf-8")
+
+    def _file_entry(self, file_idx: int) -> tuple:
+        return FILE_ENTRY.unpack_from(self._mm, self._files_off + file_idx * FILE_ENTRY.size)
+
+    def _record(self, record_idx: int) -> tuple:
+        return RECORD.unpack_from(self._mm, self._records_off + record_idx * RECORD.size)
+
+    def key(self, record_idx: int) -> str:
+        return self._string(*self._record(record_idx)[:2])
+
+    def key_lengths_table(self, first: int, count: int) -> bytes:
+        start = self._lengths_off + first * KEY_LENGTH.size
+        return self._mm[start:start + count * KEY_LENGTH.size]
+
+    @property
+    def files(self) -> list:
+        """Indexed ParamDef files, in index order."""
+        return [self._string(*self._file_entry(i)[:2]) for i in range(self._n_files)]
+
+    def keys(self, file_idx: int) -> MappedKeys:
+        """All keys of one file, sorted, as a view on the mapped file."""
+        _, _, start, count, first_length, length_count = self._file_entry(file_idx)
+        return MappedKeys(self, start, count, (first_length, length_count))
+
+    def find_path(self, file_idx: int, key: str):
+        """Definition path of `key` in one file (binary search), or None."""
+        _, _, low, count, _, _ = self._file_entry(file_idx)
+        high = low + count
+        target = key.encode("utf-8")
+        while low < high:
+            mid = (low + high) // 2
+            key_off, key_len, path_off, path_len = self._record(mid)
+            start = self._strings_off + key_off
+            candidate = self._mm[start:start + key_len]
+            if candidate < target:
+                low = mid + 1
+            elif candidate > target:
+                high = mid
+            else:
+                return self._string(path_off, path_len)
+        return None
+
+
+def shared_index_dir():
+    """Directory of the shared index: PARAMDEF_SHARED_INDEX_DIR or SHARED_INDEX_DIR."""
+    return os.environ.get("PARAMDEF_SHARED_INDEX_DIR") or SHARED_INDEX_DIR
+
+
+_attached = {}
+_attached_lock = threading.Lock()
+
+
+def get_shared_path_index(files, directory=None):
+    """
+    Attach to the shared index for `files`, publishing it first if needed.
+
+    The index file is named after a fingerprint of the files, so a changed
+    corpus gets a new index and the previous one is retired. The first
+    process builds it under a file lock while the others wait and then
+    attach. Returns None when no shared index directory is configured.
+    Queries should hold the index through `shared_path_index`.
+    """
+    directory = directory or shared_index_dir()
+    if not directory or not files:
+        return None
+
+    out_path = Path(directory) / f"{fingerprint_files(files, salt=f'v{INDEX_VERSION}')}.idx"
+    index = _attached.get(out_path)
+    if index is not None:
+        return index
+
+    with _attached_lock:
+        index = _attached.get(out_path)
+        if index is not None:
+            return index
+        if not out_path.exists():
+            with FileLock(out_path.with_suffix(".lock"), timeout=SHARED_INDEX_LOCK_TIMEOUT):
+                if not out_path.exists():
+                    with span("phase.shared_index_build"):
+                        build_shared_index(files, out_path)
+                    increment("shared_index_builds")
+                    logger.info("Published shared ParamDef index %s", out_path)
+        index = SharedPathIndex(out_path)
+        increment("shared_index_attaches")
+        # Indexes of an older corpus are closed once their in-flight queries finish
+        for old in _attached.values():
+            old.retire()
+        _attached.clear()
+        _attached[out_path] = index
+        return index
+
+
+@contextmanager
+def shared_path_index(files, directory=None):
+    """
+    `get_shared_path_index` held for the duration of a query: the index
+    stays open until the block exits, even if a newer corpus replaces it
+    meanwhile. Yields None when no shared index is configured.
+    """
+    while True:
+        index = get_shared_path_index(files, directory)
+        # A retired index may close between the lookup and acquire; attach again
+        if index is None or index.acquire():
+            break
+    try:
+        yield index
+    finally:
+        if index is not None:
+            index.release()
@@ -0,0 +1,109 @@
+"""
+@author: GUU8HC
+Spell correction of mistyped ParamDef short-names
+"""
+
+import threading
+
+from rapidfuzz import process, fuzz, utils
+
+from mcp_project.paramdef_handler.paramdef_index import get_paramdef_index
+from mcp_project.paramdef_handler.paramdef_settings import (
+    RAPIDFUZZ_CUTOFF,
+    SPELL_MAX_DISTANCE,
+    SPELL_PREFIX_LENGTH,
+    SPELL_MAX_RESULTS,
+)
+from mcp_project.utils.spell_index import SymSpellIndex
+from mcp_project.utils.metrics import span, increment
+
+
+class ParamDefSpeller:
+    """
+    Correct mistyped definition names against a `ParamDefIndex`.
+
+    The spelling index over every short-name (module, container, parameter
+    and reference names) is built on first use; afterwards a correction
+    only touches the names sharing a delete variant with the query.
+    """
+    def __init__(self, index=None):
+        self._index = index if index is not None else get_paramdef_index()
+        self._spell_index = None
+        self._names = None
+        self._lock = threading.Lock()
+
+    @property
+    def index(self):
+        return self._index
+
+    def _ensure_built(self):
+        if self._spell_index is not None:
+            return
+        with self._lock:
+            if self._spell_index is not None:
+                return
+            spell_index = SymSpellIndex(SPELL_MAX_DISTANCE, SPELL_PREFIX_LENGTH)
+            names = {}
+            with span("phase.spell_index"):
+                for path in sorted(self._index.definition_paths()):
+                    name = path.rsplit("/", 1)[-1]
+                    spell_index.add(name, path)
+                    names.setdefault(name.casefold(), name)
+            self._names = names
+            self._spell_index = spell_index
+
+    def correct(self, name: str, limit: int = SPELL_MAX_RESULTS) -> dict:
+        """
+        Corrections of `name` within SPELL_MAX_DISTANCE edits, closest first
+        (ties by RapidFuzz score), next to the RapidFuzz ranking over all
+        short-names for typos beyond that distance.
+        """
+        self._ensure_built()
+        increment("spell_corrections")
+        with span("phase.spell_lookup"):
+            found = self._spell_index.lookup(name)
+
+        corrections = []
+        for term, distance, paths in found:
+            canonical = self._names[term]
+            corrections.append({
+                "name": canonical,
+                "distance": distance,
+                "similarity_score": fuzz.WRatio(name, canonical, processor=utils.default_process) / 100.0,
+                "definition_paths": paths,
+            })
+        corrections.sort(key=lambda c: (c["distance"], -c["similarity_score"], c["name"]))
+
+        with span("phase.fuzzy_scoring"):
+            ranked = process.extract(
+                name,
+                list(self._names.values()),
+                scorer=fuzz.WRatio,
+                processor=utils.default_process,
+                limit=limit,
+                score_cutoff=int(RAPIDFUZZ_CUTOFF * 100)
+            )
+        return {
+            "name": name,
+            "exact": name in self._spell_index,
+            "corrections": corrections[:limit],
+            "rapidfuzz": [
+                {"name": match, "similarity_score": score / 100.0}
+                for match, score, _ in sorted(ranked, key=lambda m: (-m[1], m[0]))
+            ],
+        }
+
+
+_default_speller = None
+_default_speller_lock = threading.Lock()
+
+
+def get_paramdef_speller() -> ParamDefSpeller:
+    """Process-wide speller over the workspace ParamDef index, rebuilt when the index is."""
+    global _default_speller
+    index = get_paramdef_index()
+    if _default_speller is None or _default_speller.index is not index:
+        with _default_speller_lock:
+            if _default_speller is None or _default_speller.index is not index:
+                _default_speller = ParamDefSpeller(index)
+    return _default_speller
@@ -0,0 +1,183 @@
+"""
+@author: GUU8HC
+Per-module ParamDef statistics, persisted next to the other caches
+"""
+
+import json
+import threading
+from pathlib import Path
+from collections import Counter
+
+from mcp_project.paramdef_handler.paramdef_module_cache import get_module_cache, prune_snapshots, snapshot_prefix
+from mcp_project.paramdef_handler.paramdef_index import (
+    CONTAINER,
+    PARAMETER,
+    REFERENCE,
+    iter_children,
+)
+from mcp_project.paramdef_handler.paramdef_settings import SUMMARY_CACHE_DIR
+from mcp_project.utils.generic_utils import fingerprint_files
+from mcp_project.utils.logging_utils import get_logger
+from mcp_project.utils.metrics import span, increment
+
+logger = get_logger(__name__)
+
+# Bump when the summary layout changes
+SUMMARY_VERSION = 1
+
+
+def summarize_module(module_name: str, module: dict) -> dict:
+    """
+    Shape facts of one converted module in a single traversal.
+
+    Returns definition counts per type, parameter and reference type counts,
+    the maximum depth, every container with its multiplicity and direct
+    children counts, the literal count of every enumeration parameter and
+    the multiplicities used per definition type.
+    """
+    counts = Counter()
+    parameter_types = Counter()
+    reference_types = Counter()
+    multiplicities = {CONTAINER: Counter(), PARAMETER: Counter(), REFERENCE: Counter()}
+    containers = []
+    enumerations = {}
+    max_depth = 0
+
+    stack = [(module_name, module, 0)]
+    while stack:
+        path, node, depth = stack.pop()
+        node_type = node.get("type")
+        if node_type in multiplicities:
+            counts[node_type] += 1
+            multiplicities[node_type][node.get("multiplicity", "1")] += 1
+            max_depth = max(max_depth, depth)
+
+        if node_type == PARAMETER:
+            parameter_types[node.get("param_type")] += 1
+            if "literals" in node:
+                enumerations[path] = len(node["literals"])
+        elif node_type == REFERENCE:
+            reference_types[node.get("ref_type")] += 1
+
+        children = Counter()
+        for name, child in iter_children(node):
+            children[child.get("type")] += 1
+            stack.append((f"{path}/{name}", child, depth + 1))
+
+        if node_type == CONTAINER:
+            containers.append({
+                "path": path,
+                "multiplicity": node.get("multiplicity", "1"),
+                "parameters": children[PARAMETER],
+                "references": children[REFERENCE],
+                "sub_containers": children[CONTAINER],
+            })
+
+    containers.sort(key=lambda c: c["path"])
+    return {
+        "module": module_name,
+        "description": module.get("description", ""),
+        "counts": dict(sorted(counts.items())),
+        "parameter_types": dict(sorted(parameter_types.items())),
+        "reference_types": dict(sorted(reference_types.items())),
+        "max_depth": max_depth,
+        "containers": containers,
+        "enumerations": dict(sorted(enumerations.items())),
+        "multiplicities": {t: dict(sorted(c.items())) for t, c in multiplicities.items()},
+    }
+
+
+def summarize_file(paramdef) -> dict:
+    """Summarize each module of one ParamDef file, converted through the module cache."""
+    data = get_module_cache().get(paramdef)
+    with span("phase.summary"):
+        return {name: summarize_module(name, module) for name, module in data.items()}
+
+
+class ParamDefSummaryCache:
+    """
+    Module summaries per ParamDef file, cached in memory and on disk.
+
+    Summaries are built from the module cache, so a file the server has
+    already loaded is not converted again. They are kept per file for its
+    current fingerprint (path, size and modification time) and written to
+    `cache_dir` as `<path hash>-<fingerprint>.json`, so a cold start serves
+    them without loading whole modules; summaries of earlier versions of a
+    file are replaced in memory and removed from disk. With `cache_dir=None`
+    summaries are only kept in memory.
+    """
+    def __init__(self, cache_dir=SUMMARY_CACHE_DIR):
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._memory = {}
+        self._lock = threading.Lock()
+
+    def _load_or_build(self, paramdef) -> dict:
+        key = fingerprint_files([paramdef], salt=f"v{SUMMARY_VERSION}")
+        prefix = snapshot_prefix(paramdef)
+        cached = self._memory.get(prefix)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        summaries = None
+        cache_path = self._cache_dir / f"{prefix}-{key}.json" if self._cache_dir else None
+        if cache_path is not None and cache_path.exists():
+            try:
+                summaries = json.loads(cache_path.read_text(encoding="utf-8"))
+                increment("summary_cache_hits")
+            except Exception as e:
+                logger.error("Ignoring unreadable summary '%s': %s", cache_path, e)
+
+        if summaries is None:
+            summaries = summarize_file(paramdef)
+            for summary in summaries.values():
+                summary["file"] = str(paramdef)
+            if cache_path is not None:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+                tmp_path.write_text(json.dumps(summaries), encoding="utf-8")
+                tmp_path.replace(cache_path)
+                increment("summary_cache_pruned", prune_snapshots(self._cache_dir, prefix, cache_path))
+
+        with self._lock:
+            self._memory[prefix] = (key, summaries)
+        return summaries
+
+    def summaries(self, files) -> dict:
+        """{module name: summary} over all `files`; unreadable files are skipped."""
+        result = {}
+        for paramdef in files:
+            try:
+                result.update(self._load_or_build(paramdef))
+            except Exception as e:
+                logger.error("Failed to summarize '%s': %s", paramdef, e)
+        return result
+
+
+def corpus_summary(summaries: dict) -> dict:
+    """Compact overview: per-module totals without the container lists."""
+    return {
+        "modules": [
+            {
+                "module": s["module"],
+                "file": s.get("file"),
+                "counts": s["counts"],
+                "max_depth": s["max_depth"],
+                "enumerations": len(s["enumerations"]),
+            }
+            for s in sorted(summaries.values(), key=lambda s: s["module"])
+        ]
+    }
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_summary_cache() -> ParamDefSummaryCache:
+    """Process-wide summary cache."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = ParamDefSummaryCache()
+    return _default_cache
@@ -9,80 +9,141 @@ import json
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pathlib import Path
-from rapidfuzz import process, fuzz
-from difflib import get_close_matches
-
-from paramdef_handler.paramdef_arxml2json import convert_paramdef_to_json
-from paramdef_handler.paramdef_settings import (
-    DIFFLIB_NUMBER_OF_RESULTS,
-    DIFFLIB_CUTOFF,
-    RAPIDFUZZ_NUMBER_OF_RESULTS,
-    RAPIDFUZZ_CUTOFF
+from contextlib import contextmanager
+
+from utils.generic_utils import get_keys
+from mcp_project.utils.metrics import span, increment
+from mcp_project.paramdef_handler.paramdef_matcher import match, FileKeys
+from mcp_project.paramdef_handler.paramdef_shared_index import get_shared_path_index, shared_path_index
+from mcp_project.paramdef_handler.paramdef_module_cache import get_module_cache
+from mcp_project.paramdef_handler.paramdef_daemon import (
+    OP_DEFINITION_FILES,
+    OP_PATH_DIFFLIB,
+    OP_PATH_RAPIDFUZZ,
+    query_daemon,
 )
-from utils.generic_utils import (
-    info,
-    debug,
-    error,
-    get_keys,
-    )
+from mcp_project.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
 
 def get_all_paramdef_files():
     """
     Get all param definition JSON files in the workspace
     """
     workspace_root = Path(__file__).resolve().parents[0].parent.parent
-    info(f"Searching for param definition files in workspace: {workspace_root}")
-    files = list(workspace_root.glob("**/*[Pp]aram[Dd]ef*.arxml"))
+    logger.info("Searching for param definition files in workspace: %s", workspace_root)
+    with span("phase.discovery"):
+        files = list(workspace_root.glob("**/*[Pp]aram[Dd]ef*.arxml"))
+    increment("files_discovered", len(files))
     return files
 
-def get_close_matches_rapidfuzz(keyword: str, keys: list, n: int, cutoff: float):
-    close_matches = process.extract(
-            keyword,
-            keys,
-            scorer=fuzz.WRatio,
-            limit=n,
-            score_cutoff=int(cutoff * 100)
-        )
-    
-    # Sorting from highest to lowest score
-    return sorted(close_matches, key=lambda x: (-x[1], x[0]))
+def _parse_paramdef(paramdef):
+    """Converted ParamDef file from the module cache (do not modify it)."""
+    return get_module_cache().get(paramdef)
 
-def get_definition_files(keyword: str):
+def _extract_keys(data) -> list:
     """
-    Search all param definition JSON files in the workspace for a given key.
+    Collect all keys of converted data, timed as the 'key extraction' phase.
+    Sorted so that ties in fuzzy scoring resolve the same way on every run
+    and in the shared index.
+    """
+    with span("phase.key_extraction"):
+        return sorted(get_keys(data))
 
-    If return_path is True, returns the path to the first file that contains the key (searching keys, not values) as a string.
-    If return_path is False, returns the data object.
-    If nothing is found returns None.
+# (size, mtime) stamp and FileKeys per ParamDef file, see `_file_keys`
+_file_keys_cache = {}
+
+def _file_keys(paramdef, data) -> FileKeys:
+    """
+    Keys of a converted file with their lengths, extracted once per version
+    of the file (same size and modification time) rather than per search.
     """
-    paramdefs = get_all_paramdef_files()
+    stat = os.stat(paramdef)
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    cached = _file_keys_cache.get(str(paramdef))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    keys = FileKeys(_extract_keys(data))
+    _file_keys_cache[str(paramdef)] = (stamp, keys)
+    return keys
+
+def _join(path):
+    return "/".join(path) if path else None
+
+def _iter_file_keys(paramdefs, shared=None):
+    """
+    Yield (paramdef, keys, lookup) for every ParamDef file, where
+    `lookup(key)` returns the '/' joined definition path of a key or None.
 
-    if not paramdefs:
-        return None
-    
-    matches = []
+    Keys and paths come from the shared key/path index (`shared`, by
+    default the one for `paramdefs`) when one is configured, otherwise each
+    file is converted.
+    """
+    shared = get_shared_path_index(paramdefs) if shared is None else shared
+    if shared is not None:
+        for file_idx, paramdef in enumerate(shared.files):
+            with span("phase.key_extraction"):
+                keys = shared.keys(file_idx)
+            yield paramdef, keys, lambda key, i=file_idx: shared.find_path(i, key)
+        return
 
     for paramdef in paramdefs:
-        print("=" * 30, f" {str(paramdef).split('/')[-1]} ")
         try:
-            data = convert_paramdef_to_json(paramdef)
+            data = _parse_paramdef(paramdef)
+            keys = _file_keys(paramdef, data)
         except Exception:
             continue
-        
-        # Get keys from JSON data
-        keys = list(get_keys(data))
-        close_matches = get_close_matches_rapidfuzz(
-            keyword,
-            keys,
-            n=RAPIDFUZZ_NUMBER_OF_RESULTS,
-            cutoff=RAPIDFUZZ_CUTOFF
-        )
+        yield paramdef, keys, lambda key, d=data: _join(find_path(d, key))
+
+@contextmanager
+def _search_corpus(paramdefs, source=None):
+    """
+    The (paramdef, keys, lookup) tuples of one search: from `source` if
+    given, else `_iter_file_keys`, holding the shared index until the
+    search is done.
+    """
+    if source is not None:
+        yield source(paramdefs)
+        return
+    with shared_path_index(paramdefs) as shared:
+        yield _iter_file_keys(paramdefs, shared)
+
+def _daemon_search(op: int, keyword: str, paramdefs: list):
+    """
+    Run a search on the local daemon if one is listening.
+
+    Returns (file, text, score) tuples, or None to search in-process.
+    """
+    entries = query_daemon(op, keyword, paramdefs)
+    if entries is None:
+        return None
+    return [(str(paramdefs[i]), text, score) for i, text, score in entries]
+
+def get_definition_files(keyword: str, paramdefs: list = None, source=None):
+    """
+    Search all param definition JSON files in the workspace for a given key.
 
-        matches.extend([[str(paramdef), match, score / 100.0] for match, score, _ in close_matches])
+    If return_path is True, returns the path to the first file that contains the key (searching keys, not values) as a string.
+    If return_path is False, returns the data object.
+    If nothing is found returns None.
+
+    `paramdefs` defaults to the workspace files. Without a `source` the
+    search goes to the local daemon when one is running; `source` replaces
+    `_iter_file_keys` (the daemon passes its in-memory corpus).
+    """
+    paramdefs = get_all_paramdef_files() if paramdefs is None else paramdefs
 
-    matches = sorted(matches, key=lambda x: (-x[2], x[1]))
+    if not paramdefs:
+        return None
 
-    return matches
+    if source is None:
+        remote = _daemon_search(OP_DEFINITION_FILES, keyword, paramdefs)
+        if remote is not None:
+            return [list(entry) for entry in remote]
+    
+    with _search_corpus(paramdefs, source) as files:
+        matches = match(keyword, files, lambda lookup, key: key)
+    return [[str(paramdef), key, score / 100.0] for score, key, paramdef in matches]
 
 def find_path(data, target_key, path=None):
     """Recursively search for the target key and return its full path as a list.
@@ -106,66 +167,69 @@ def find_path(data, target_key, path=None):
                 return result
     return None
 
-def get_definition_path_difflib(keyword: str):
+def search_definition_paths(keyword: str, scorer: str = "wratio", n: int = None, cutoff: float = None,
+                            paramdefs: list = None, source=None):
+    """
+    Get the paths of the definitions matching a keyword with any scorer of
+    `paramdef_matcher.SCORERS`, best first.
+
+    `n` (number of results over all files, None for every per-file match)
+    and `cutoff` (0..1) default to the scorer's settings. `paramdefs` and
+    `source` as in `get_definition_files`; this search always runs
+    in-process.
+    """
+    paramdefs = get_all_paramdef_files() if paramdefs is None else paramdefs
+    with _search_corpus(paramdefs, source) as files:
+        matches = match(
+            keyword,
+            files,
+            lambda lookup, key: lookup(key) or None,
+            scorer=scorer,
+            n=n,
+            cutoff=cutoff
+        )
+    return [
+        {
+            "file": str(paramdef),
+            "definition_path": path,
+            "similarity_score": score / 100.0
+        }
+        for score, path, paramdef in matches
+    ]
+
+def get_definition_path_difflib(keyword: str, paramdefs: list = None, source=None):
     """
     Get the path to the definition of a given keyword
     from param definition JSON files
     using difflib for fuzzy matching.
+    `paramdefs` and `source` as in `get_definition_files`.
     """
-    paths = []
-    paramdefs = get_all_paramdef_files()
-    for paramdef in paramdefs:
-        try:
-            data = convert_paramdef_to_json(paramdef)
-        except Exception:
-            continue
-        
-        # Get keys from JSON data
-        keys = get_keys(data)
-        close_matches = get_close_matches(keyword, keys, n=DIFFLIB_NUMBER_OF_RESULTS, cutoff=DIFFLIB_CUTOFF)
-
-        if close_matches:
-            for match in close_matches:
-                path = find_path(data, match)
-                if path:
-                    paths.append({
-                        "file": str(paramdef),
-                        "definition_path": "/".join(path)
-                    })
-    return paths
-
-def get_definition_path_rapidfuzz(keyword: str):
+    paramdefs = get_all_paramdef_files() if paramdefs is None else paramdefs
+    if source is None and paramdefs:
+        remote = _daemon_search(OP_PATH_DIFFLIB, keyword, paramdefs)
+        if remote is not None:
+            return [{"file": file, "definition_path": path} for file, path, _ in remote]
+
+    return [
+        {"file": entry["file"], "definition_path": entry["definition_path"]}
+        for entry in search_definition_paths(keyword, "difflib", paramdefs=paramdefs, source=source)
+    ]
+
+def get_definition_path_rapidfuzz(keyword: str, paramdefs: list = None, source=None):
     """
     Get the path to the definition of a given keyword
     from param definition JSON files
     using RapidFuzz for fuzzy matching.
+    `paramdefs` and `source` as in `get_definition_files`.
     """
-
-    paths = []
-    paramdefs = get_all_paramdef_files()
-    for paramdef in paramdefs:
-        try:
-            data = convert_paramdef_to_json(paramdef)
-        except Exception:
-            continue
-        
-        # Get keys from JSON data
-        keys = list(get_keys(data))
-        close_matches = get_close_matches_rapidfuzz(
-            keyword,
-            keys,
-            n=RAPIDFUZZ_NUMBER_OF_RESULTS,
-            cutoff=RAPIDFUZZ_CUTOFF
-        )
-
-        if close_matches:
-            for match, score, _ in close_matches:
-                path = find_path(data, match)
-                if path:
-                    paths.append({
-                        "file": str(paramdef),
-                        "definition_path": "/".join(path),
-                        "similarity_score": score / 100.0
-                    })
-    # Sort results by similarity score (highest first), then by definition path        
-    return sorted(paths, key=lambda x: (-x.get("similarity_score", 0), x.get("definition_path", "")))
+    paramdefs = get_all_paramdef_files() if paramdefs is None else paramdefs
+    if source is None and paramdefs:
+        remote = _daemon_search(OP_PATH_RAPIDFUZZ, keyword, paramdefs)
+        if remote is not None:
+            return [
+                {"file": file, "definition_path": path, "similarity_score": score}
+                for file, path, score in remote
+            ]
+
+    # Sorted by similarity score (highest first), then by definition path
+    return search_definition_paths(keyword, "wratio", paramdefs=paramdefs, source=source)
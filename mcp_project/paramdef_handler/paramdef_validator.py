@@ -0,0 +1,322 @@
+"""
+@author: GUU8HC
+Parameter validation compiled from ParamDef constraints
+"""
+
+import re
+import threading
+
+from rapidfuzz import process, fuzz, utils
+
+from mcp_project.paramdef_handler.paramdef_index import (
+    CONTAINER,
+    PARAMETER,
+    REFERENCE,
+    iter_children,
+    get_paramdef_index,
+)
+from mcp_project.utils.metrics import increment
+from mcp_project.paramdef_handler.paramdef_settings import (
+    VALIDATOR_SUGGESTIONS,
+    VALIDATOR_SUGGESTION_CUTOFF,
+)
+
+_C_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+_TRUE = {"true", "1", "on", "yes"}
+_FALSE = {"false", "0", "off", "no"}
+
+
+def suggest(name: str, choices: list, limit: int = VALIDATOR_SUGGESTIONS) -> list:
+    """Closest `choices` for a mistyped `name`, best first."""
+    matches = process.extract(
+        name,
+        choices,
+        scorer=fuzz.WRatio,
+        processor=utils.default_process,
+        limit=limit,
+        score_cutoff=VALIDATOR_SUGGESTION_CUTOFF
+    )
+    return [match for match, _, _ in matches]
+
+
+def _parse_bound(text: str, number_type):
+    """Parse a MIN/MAX string from the ParamDef; unbounded values become None."""
+    if not text:
+        return None
+    lowered = text.strip().lower()
+    if lowered in ("inf", "+inf", "-inf", "infinity"):
+        return None
+    try:
+        return number_type(text, 0) if number_type is int else number_type(text)
+    except ValueError:
+        try:
+            return number_type(float(text))
+        except ValueError:
+            return None
+
+
+def _parse_multiplicity(text: str) -> tuple:
+    """'0..*' -> (0, None), '1' -> (1, 1), '0..1' -> (0, 1)"""
+    if not text:
+        return 1, 1
+    low, _, up = text.partition("..")
+    if not up:
+        up = low
+    return int(low), (None if up == "*" else int(up))
+
+
+def _coerce_boolean(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    raise ValueError("expected a boolean")
+
+
+def _coerce_integer(value):
+    if isinstance(value, bool):
+        raise ValueError("expected an integer")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip(), 0)
+        except ValueError:
+            pass
+    raise ValueError("expected an integer")
+
+
+def _coerce_float(value):
+    if isinstance(value, bool):
+        raise ValueError("expected a number")
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    raise ValueError("expected a number")
+
+
+def _coerce_string(value):
+    if isinstance(value, str):
+        return value
+    raise ValueError("expected a string")
+
+
+def _coerce_function_name(value):
+    if isinstance(value, str) and _C_IDENTIFIER.match(value):
+        return value
+    raise ValueError("expected a C function name")
+
+
+class ParameterValidator:
+    """
+    Validator for one parameter definition.
+
+    All constraints are parsed once at construction: enumeration literals
+    become a dict keyed by upper-cased literal, MIN/MAX become numbers and
+    the type is mapped to a coercer function.
+    """
+    __slots__ = ("name", "param_type", "coerce", "min", "max", "literals", "lower", "upper", "has_default")
+
+    def __init__(self, name: str, definition: dict):
+        self.name = name
+        self.param_type = definition.get("param_type") or definition.get("ref_type")
+        self.lower, self.upper = _parse_multiplicity(definition.get("multiplicity"))
+        self.has_default = "defaultValue" in definition
+        self.min = self.max = None
+        self.literals = None
+
+        if self.param_type == "BOOLEAN":
+            self.coerce = _coerce_boolean
+        elif self.param_type == "INTEGER":
+            self.coerce = _coerce_integer
+            self.min = _parse_bound(definition.get("minValue"), int)
+            self.max = _parse_bound(definition.get("maxValue"), int)
+        elif self.param_type == "FLOAT":
+            self.coerce = _coerce_float
+            self.min = _parse_bound(definition.get("minValue"), float)
+            self.max = _parse_bound(definition.get("maxValue"), float)
+        elif self.param_type == "ENUMERATION":
+            self.coerce = _coerce_string
+            self.literals = {lit.upper(): lit for lit in definition.get("literals", [])}
+        elif self.param_type == "FUNCTION_NAME":
+            self.coerce = _coerce_function_name
+        elif self.param_type == "STRING" or definition.get("type") == REFERENCE:
+            self.coerce = _coerce_string
+        else:
+            self.coerce = None
+
+    def _validate_one(self, value):
+        """Return (coerced_value, error_dict_or_None)."""
+        if self.coerce is None:
+            return value, None
+        try:
+            coerced = self.coerce(value)
+        except ValueError as e:
+            return value, {"error": f"Invalid {self.param_type} value: {e}"}
+
+        if self.literals is not None:
+            literal = self.literals.get(coerced.upper())
+            if literal is None:
+                return value, {
+                    "error": "Unknown enumeration literal",
+                    "suggestions": suggest(coerced, list(self.literals.values()))
+                }
+            return literal, None
+
+        if self.min is not None and coerced < self.min:
+            return value, {"error": f"Value below minimum {self.min}"}
+        if self.max is not None and coerced > self.max:
+            return value, {"error": f"Value above maximum {self.max}"}
+        return coerced, None
+
+    def validate(self, value):
+        """Validate a value (or a list of values for multi-instance parameters)."""
+        if isinstance(value, list):
+            if self.upper is not None and len(value) > self.upper:
+                return value, {"error": f"At most {self.upper} value(s) allowed, got {len(value)}"}
+            if len(value) < self.lower:
+                return value, {"error": f"At least {self.lower} value(s) required, got {len(value)}"}
+            coerced = []
+            for item in value:
+                item_value, err = self._validate_one(item)
+                if err:
+                    return value, err
+                coerced.append(item_value)
+            return coerced, None
+        return self._validate_one(value)
+
+
+class ContainerValidator:
+    """Validators for every parameter and reference of one container definition."""
+    def __init__(self, definition_path: str, node: dict):
+        self.definition_path = definition_path
+        self.parameters = {}
+        for name, child in iter_children(node):
+            if child.get("type") in (PARAMETER, REFERENCE):
+                self.parameters[name.lower()] = ParameterValidator(name, child)
+        self._names = [v.name for v in self.parameters.values()]
+        # Lower multiplicity >= 1 and no default value to fall back on
+        self.required = [v for v in self.parameters.values() if v.lower >= 1 and not v.has_default]
+
+    def validate(self, parameters: dict) -> tuple:
+        """
+        Return (canonical_parameters, errors) for a parameters dict. Required
+        parameters (lower multiplicity >= 1, no default value) that are not
+        supplied are reported as missing.
+        """
+        canonical, errors = {}, []
+        for name, value in parameters.items():
+            validator = self.parameters.get(name.lower()) if isinstance(name, str) else None
+            if validator is None:
+                errors.append({
+                    "parameter": name,
+                    "error": "Unknown parameter",
+                    "suggestions": suggest(str(name), self._names)
+                })
+                continue
+            coerced, err = validator.validate(value)
+            if err:
+                err = {"parameter": validator.name, "value": value, **err}
+                errors.append(err)
+                continue
+            canonical[validator.name] = coerced
+        supplied = {name.lower() for name in parameters if isinstance(name, str)}
+        for validator in self.required:
+            if validator.name.lower() not in supplied:
+                errors.append({
+                    "parameter": validator.name,
+                    "error": "Missing required parameter",
+                })
+        return canonical, errors
+
+
+class ParamDefValidator:
+    """
+    Validate ECUC parameters against a `ParamDefIndex`.
+
+    Container validators are compiled on first use and cached per
+    canonical definition path, so repeated validations only pay for the
+    per-value checks.
+    """
+    def __init__(self, index=None):
+        self._index = index if index is not None else get_paramdef_index()
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    @property
+    def index(self):
+        return self._index
+
+    def container_validator(self, definition_path: str):
+        """Compiled validator for a container path, or None if it is not a container."""
+        resolved = self._index.resolve(definition_path)
+        if resolved is None or resolved["node"].get("type") != CONTAINER:
+            return None
+        key = resolved["definition_path"]
+        validator = self._cache.get(key)
+        if validator is not None:
+            increment("validator_cache_hits")
+        else:
+            increment("validator_cache_misses")
+            with self._lock:
+                validator = self._cache.get(key)
+                if validator is None:
+                    validator = ContainerValidator(key, resolved["node"])
+                    self._cache[key] = validator
+        return validator
+
+    def validate(self, definition_path: str, parameters: dict) -> dict:
+        """
+        Validate `parameters` for the container at `definition_path`.
+
+        Returns {'definition_path', 'parameters', 'errors'} where
+        `definition_path` and `parameters` use canonical ParamDef names and
+        coerced values; `errors` is empty when everything is valid.
+        """
+        validator = self.container_validator(definition_path)
+        if validator is None:
+            resolved = self._index.resolve(definition_path)
+            if resolved is None:
+                error = {"error": "Unknown definition path"}
+            else:
+                error = {"error": f"Definition is a {resolved['node'].get('type')}, not a CONTAINER"}
+            return {
+                "definition_path": definition_path,
+                "parameters": parameters,
+                "errors": [{"path": definition_path, **error}]
+            }
+        canonical, errors = validator.validate(parameters)
+        for err in errors:
+            err["path"] = validator.definition_path
+        return {
+            "definition_path": validator.definition_path,
+            "parameters": canonical,
+            "errors": errors
+        }
+
+
+_default_validator = None
+_default_validator_lock = threading.Lock()
+
+
+def get_paramdef_validator() -> ParamDefValidator:
+    """Process-wide validator over the workspace ParamDef index, rebuilt when the index is."""
+    global _default_validator
+    index = get_paramdef_index()
+    if _default_validator is None or _default_validator.index is not index:
+        with _default_validator_lock:
+            if _default_validator is None or _default_validator.index is not index:
+                _default_validator = ParamDefValidator(index)
+    return _default_validator
@@ -0,0 +1,106 @@
+"""
+@author: GUU8HC
+Reverse lookup from enumeration literals and default values to parameters
+"""
+
+import threading
+
+from rapidfuzz import process, fuzz, utils
+
+from mcp_project.paramdef_handler.paramdef_index import value_key, get_paramdef_index
+from mcp_project.paramdef_handler.paramdef_settings import (
+    VALUE_LOOKUP_CUTOFF,
+    VALUE_LOOKUP_MAX_RESULTS,
+)
+from mcp_project.utils.metrics import span, increment
+
+
+class ValueLookup:
+    """
+    Find the parameters accepting given values through the value index of a
+    `ParamDefIndex`, e.g. IMMEDIATE and DEFERRED -> ComIPduSignalProcessing.
+
+    Each value is matched fuzzily against every indexed literal and default
+    value, so typos and case differences still find their parameter.
+    """
+    def __init__(self, index=None):
+        self._index = index if index is not None else get_paramdef_index()
+        self._keys = None
+        self._lock = threading.Lock()
+
+    @property
+    def index(self):
+        return self._index
+
+    def _ensure_built(self):
+        if self._keys is not None:
+            return
+        with self._lock:
+            if self._keys is None:
+                self._keys = sorted(self._index.values())
+
+    def match_value(self, value: str, limit: int = VALUE_LOOKUP_MAX_RESULTS,
+                    cutoff: float = VALUE_LOOKUP_CUTOFF) -> list:
+        """Indexed values close to `value`, best first, each with the parameters using it."""
+        self._ensure_built()
+        with span("phase.fuzzy_scoring"):
+            matches = process.extract(
+                value_key(value),
+                self._keys,
+                scorer=fuzz.QRatio,
+                processor=utils.default_process,
+                limit=limit,
+                score_cutoff=cutoff * 100
+            )
+        return [
+            {"similarity_score": score / 100.0, "parameters": self._index.parameters_with_value(key)}
+            for key, score, _ in sorted(matches, key=lambda m: (-m[1], m[0]))
+        ]
+
+    def find(self, values, limit: int = VALUE_LOOKUP_MAX_RESULTS, cutoff: float = VALUE_LOOKUP_CUTOFF) -> dict:
+        """
+        Parameters accepting `values` (one value or a list), ranked by the
+        number of values they accept, then by mean similarity. Each carries
+        the ParamDef spelling of every matched value, so it can be used in a
+        parameter dict as is.
+        """
+        values = [values] if isinstance(values, str) else list(values)
+        increment("value_lookups")
+        ranked = {}
+        for value in values:
+            for match in self.match_value(value, limit, cutoff):
+                for entry in match["parameters"]:
+                    found = ranked.setdefault(entry["definition_path"], {})
+                    if value not in found or found[value]["similarity_score"] < match["similarity_score"]:
+                        found[value] = {
+                            "value": entry["value"],
+                            "kind": entry["kind"],
+                            "similarity_score": match["similarity_score"],
+                        }
+
+        parameters = [
+            {
+                "definition_path": path,
+                "name": path.rsplit("/", 1)[-1],
+                "score": sum(m["similarity_score"] for m in found.values()) / len(values),
+                "matched_values": found,
+            }
+            for path, found in ranked.items()
+        ]
+        parameters.sort(key=lambda p: (-len(p["matched_values"]), -p["score"], p["definition_path"]))
+        return {"values": values, "parameters": parameters[:limit]}
+
+
+_default_lookup = None
+_default_lookup_lock = threading.Lock()
+
+
+def get_value_lookup() -> ValueLookup:
+    """Process-wide value lookup over the workspace ParamDef index, rebuilt when the index is."""
+    global _default_lookup
+    index = get_paramdef_index()
+    if _default_lookup is None or _default_lookup.index is not index:
+        with _default_lookup_lock:
+            if _default_lookup is None or _default_lookup.index is not index:
+                _default_lookup = ValueLookup(index)
+    return _default_lookup
@@ -0,0 +1,87 @@
+"""
+@author GUU8HC
+Cross-process file lock
+"""
+
+import os
+import time
+import threading
+from pathlib import Path
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on a sidecar lock file.
+
+    Used as a context manager around read-modify-write sequences so that
+    concurrent tool calls (threads or processes) cannot interleave writes.
+    The lock is re-entrant for the owning thread; other threads sharing the
+    same instance block on an in-process lock before touching the file.
+    """
+    def __init__(self, lock_path, timeout: float = 10.0, poll_interval: float = 0.01):
+        self._lock_path = Path(lock_path)
+        self._timeout = timeout
+        self._poll_interval = poll_interval
+        self._fd = None
+        self._depth = 0
+        self._thread_lock = threading.RLock()
+
+    def _try_lock(self, fd) -> bool:
+        try:
+            if os.name == "nt":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self):
+        if not self._thread_lock.acquire(timeout=self._timeout):
+            raise TimeoutError(f"Could not acquire lock '{self._lock_path}' within {self._timeout}s")
+        if self._depth:
+            self._depth += 1
+            return self
+
+        self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self._timeout
+        while not self._try_lock(fd):
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                self._thread_lock.release()
+                raise TimeoutError(f"Could not acquire lock '{self._lock_path}' within {self._timeout}s")
+            time.sleep(self._poll_interval)
+
+        self._fd = fd
+        self._depth = 1
+        return self
+
+    def release(self):
+        if not self._depth:
+            return
+        self._depth -= 1
+        if self._depth:
+            self._thread_lock.release()
+            return
+        try:
+            if os.name == "nt":
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+            self._thread_lock.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
@@ -3,28 +3,34 @@
 Utilities
 """
 
+import os
 import json
+import hashlib
 
-from rapidfuzz import process, fuzz
 from datetime import datetime
+from pathlib import Path
+
+from mcp_project.utils.logging_utils import get_logger, configure_logging
+
+logger = get_logger(__name__)
 
 def info(message):
     """
-    print with [INFO] prefix in cyan
+    Log message at INFO level (modules should prefer their own logger)
     """
-    print(f"\033[96m[INFO]  {message}\033[0m")
+    logger.info(message, stacklevel=2)
 
 def debug(message):
     """
-    print with [DEBUG] prefix in dark yellow
+    Log message at DEBUG level (modules should prefer their own logger)
     """
-    print(f"\033[93m[DEBUG] {message}\033[0m")
+    logger.debug(message, stacklevel=2)
 
 def error(message):
     """
-    print with [ERROR] prefix in red
+    Log message at ERROR level (modules should prefer their own logger)
     """
-    print(f"\033[91m[ERROR] {message}\033[0m")
+    logger.error(message, stacklevel=2)
 
 def export2json(filename, data, indent: int = 4, use_tabs: bool = False):
     """
@@ -58,7 +64,7 @@ def export2json(filename, data, indent: int = 4, use_tabs: bool = False):
 
                 s = re.sub(r'(?m)^( +)', _spaces_to_tabs, s)
                 f.write(s)
-    info(f"Exported successfully to {filename}")
+    logger.info("Exported successfully to %s", filename)
 
 def get_keys(data: dict) -> set:
     """
@@ -74,6 +80,21 @@ def get_keys(data: dict) -> set:
             keys.update(get_keys(item))
     return keys
 
+def deep_merge(a: dict, b: dict) -> dict:
+    """
+    Merge dict b into a recursively and return the result (a mutated).
+
+    For keys present in both dicts:
+    - if both values are dicts, merge recursively
+    - otherwise, b's value overwrites a's
+    """
+    for k, v in b.items():
+        if k in a and isinstance(a[k], dict) and isinstance(v, dict):
+            deep_merge(a[k], v)
+        else:
+            a[k] = v
+    return a
+
 def load_json(file_path: str):
     """
     Load JSON content from a file.
@@ -83,6 +104,39 @@ def load_json(file_path: str):
         data = json.load(f)
     return data
 
+def unique_output_path(directory, prefix: str, suffix: str = ".json") -> Path:
+    """
+    Reserve a new timestamped file `<directory>/<prefix><timestamp><suffix>`.
+
+    The timestamp has microsecond resolution and the file is created
+    exclusively, so concurrent callers never receive the same path.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    counter = 0
+    while True:
+        name = f"{prefix}{stamp}{suffix}" if counter == 0 else f"{prefix}{stamp}_{counter}{suffix}"
+        path = directory / name
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return path
+        except FileExistsError:
+            counter += 1
+
+def fingerprint_files(files, salt: str = "") -> str:
+    """
+    Hash of the resolved paths, sizes and modification times of `files`.
+
+    Used as a cache key: it changes whenever a file is added, removed or
+    modified. Bump `salt` when the cached format changes.
+    """
+    digest = hashlib.sha1(salt.encode())
+    for file in sorted(str(Path(f).resolve()) for f in files):
+        stat = Path(file).stat()
+        digest.update(f"{file}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
 def get_precise_time():
     """
     Get the precise time up to microsecond precision
@@ -109,4 +163,5 @@ def test_utils():
     error("This is an error message.")
 
 if __name__ == "__main__":
+    configure_logging(level="DEBUG")
     test_utils()
\ No newline at end of file
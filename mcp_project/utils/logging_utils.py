@@ -0,0 +1,106 @@
+"""
+@author guu8hc
+Structured logging on top of the standard `logging` module
+"""
+
+import os
+import sys
+import json
+import logging
+from datetime import datetime, timezone
+
+from mcp_project.mcp_settings import LOG_LEVEL, LOG_FORMAT, LOG_FILE
+
+ROOT_LOGGER = "paramdef_search"
+
+_COLORS = {
+    logging.DEBUG: "\033[93m",
+    logging.INFO: "\033[96m",
+    logging.WARNING: "\033[95m",
+    logging.ERROR: "\033[91m",
+    logging.CRITICAL: "\033[91m",
+}
+_RESET = "\033[0m"
+
+# Attributes every LogRecord has; anything else was passed via `extra=`
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Logger below the package root logger.
+
+    Modules are imported both as `mcp_project.x.y` and `x.y`; both map to
+    `paramdef_search.x.y` so they share one configuration.
+    """
+    if name.startswith("mcp_project."):
+        name = name[len("mcp_project."):]
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+class TextFormatter(logging.Formatter):
+    """`[LEVEL] logger: message`, colored when writing to a terminal."""
+    def __init__(self, color: bool = False):
+        super().__init__()
+        self._color = color
+
+    def format(self, record):
+        name = record.name[len(ROOT_LOGGER) + 1:] if record.name.startswith(ROOT_LOGGER + ".") else record.name
+        line = f"[{record.levelname:<5}] {name}: {record.getMessage()}"
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        if self._color:
+            return f"{_COLORS.get(record.levelno, '')}{line}{_RESET}"
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any fields passed via `extra=`."""
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(level: str = None, fmt: str = None, file: str = None) -> logging.Logger:
+    """
+    Configure the package root logger once per process.
+
+    Output goes to stderr (never stdout, which carries the MCP STDIO
+    protocol) or to `file`. Arguments default to the PARAMDEF_LOG_LEVEL,
+    PARAMDEF_LOG_FORMAT and PARAMDEF_LOG_FILE environment variables, then to
+    LOG_LEVEL, LOG_FORMAT and LOG_FILE from mcp_settings.
+    """
+    level = (level or os.environ.get("PARAMDEF_LOG_LEVEL") or LOG_LEVEL).upper()
+    fmt = (fmt or os.environ.get("PARAMDEF_LOG_FORMAT") or LOG_FORMAT).lower()
+    file = file or os.environ.get("PARAMDEF_LOG_FILE") or LOG_FILE
+
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+    if file:
+        os.makedirs(os.path.dirname(os.path.abspath(file)), exist_ok=True)
+        handler = logging.FileHandler(file, encoding="utf-8")
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+
+    if fmt == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(TextFormatter(color=not file and sys.stderr.isatty()))
+
+    root.addHandler(handler)
+    root.setLevel(level)
+    root.propagate = False
+    return root
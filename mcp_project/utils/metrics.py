@@ -0,0 +1,182 @@
+"""
+@author guu8hc
+Lightweight metrics: counters, latency histograms and timing spans
+"""
+
+import re
+import threading
+import functools
+from time import perf_counter
+from pathlib import Path
+
+# Values below 2**SUB_BUCKET_BITS are recorded exactly; above, each power
+# of two is split into 2**(SUB_BUCKET_BITS - 1) linear sub-buckets, which
+# bounds the relative error to about 1.5% (HDR histogram layout)
+SUB_BUCKET_BITS = 7
+PERCENTILES = (50.0, 90.0, 95.0, 99.0, 99.9)
+
+
+class Histogram:
+    """
+    Log-linear latency histogram over integer microseconds.
+
+    Recording is O(1) and memory grows with the number of distinct
+    buckets (a few hundred at most), not with the number of samples.
+    """
+    def __init__(self):
+        self._buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @staticmethod
+    def _bucket(value: int) -> tuple:
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        if shift <= 0:
+            return 0, value
+        return shift, value >> shift
+
+    def record(self, value_us: float):
+        value = max(0, int(value_us))
+        key = self._bucket(value)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, p: float) -> float:
+        """Value at percentile `p` (0-100), reported as the bucket midpoint."""
+        if not self.count:
+            return 0.0
+        target = max(1, int(round(self.count * p / 100.0)))
+        seen = 0
+        for shift, mantissa in sorted(self._buckets):
+            seen += self._buckets[(shift, mantissa)]
+            if seen >= target:
+                low = mantissa << shift
+                high = ((mantissa + 1) << shift) - 1
+                return float(min((low + high) / 2.0, self.max))
+        return float(self.max)
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum_us": self.total,
+            "min_us": self.min or 0,
+            "max_us": self.max or 0,
+            "mean_us": self.total / self.count if self.count else 0.0,
+            **{f"p{p:g}_us": self.percentile(p) for p in PERCENTILES},
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe collection of named counters, gauges and histograms."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+
+    def increment(self, name: str, n: int = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def set_gauge(self, name: str, value: float):
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, value_us: float):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.record(value_us)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "counters": dict(sorted(self._counters.items())),
+                "gauges": dict(sorted(self._gauges.items())),
+                "histograms": {name: h.snapshot() for name, h in sorted(self._histograms.items())},
+            }
+
+    def to_prometheus(self, prefix: str = "paramdef") -> str:
+        """Render counters, gauges and histograms in the Prometheus text format."""
+        def metric_name(name):
+            return f"{prefix}_" + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+        lines = []
+        snapshot = self.snapshot()
+        for name, value in snapshot["counters"].items():
+            metric = metric_name(name) + "_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        for name, value in snapshot["gauges"].items():
+            metric = metric_name(name)
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric} {value}")
+        for name, h in snapshot["histograms"].items():
+            metric = metric_name(name) + "_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for p in PERCENTILES:
+                lines.append(f'{metric}{{quantile="{p / 100:g}"}} {h[f"p{p:g}_us"] / 1e6:.6f}')
+            lines.append(f"{metric}_sum {h['sum_us'] / 1e6:.6f}")
+            lines.append(f"{metric}_count {h['count']}")
+        return "\n".join(lines) + "\n"
+
+    def dump_prometheus(self, file_path) -> Path:
+        """Write `to_prometheus()` atomically to `file_path`."""
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(self.to_prometheus())
+        tmp_path.replace(path)
+        return path
+
+
+METRICS = MetricsRegistry()
+
+
+class span:
+    """
+    Time a block into the histogram `name`:
+
+        with span("phase.parse"):
+            ...
+    """
+    __slots__ = ("_name", "_start")
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        METRICS.observe(self._name, (perf_counter() - self._start) * 1e6)
+        if exc_type is not None:
+            METRICS.increment(f"{self._name}.errors")
+
+
+def increment(name: str, n: int = 1):
+    METRICS.increment(name, n)
+
+
+def timed(name: str):
+    """Decorator recording each call of the function into histogram `name`."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,66 @@
+"""
+@author guu8hc
+Case-folded prefix trie
+"""
+
+_VALUES = "\0"
+
+
+class PrefixTrie:
+    """
+    Map case-folded string keys to sets of values with prefix lookup.
+
+    `find_prefix(prefix)` walks len(prefix) nodes and then visits only the
+    subtree below it, so its cost is proportional to the number of keys
+    sharing the prefix rather than to the total number of keys.
+    """
+    def __init__(self):
+        self._root = {}
+        self._size = 0
+
+    def insert(self, key: str, value=None):
+        node = self._root
+        for ch in key.casefold():
+            node = node.setdefault(ch, {})
+        values = node.setdefault(_VALUES, {})
+        if not values:
+            self._size += 1
+        values[key if value is None else value] = None
+
+    def _walk(self, prefix: str):
+        node = self._root
+        for ch in prefix.casefold():
+            node = node.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def get(self, key: str) -> list:
+        """Values stored under exactly `key` (case-insensitive)."""
+        node = self._walk(key)
+        if node is None or _VALUES not in node:
+            return []
+        return list(node[_VALUES])
+
+    def find_prefix(self, prefix: str) -> list:
+        """Values of every key starting with `prefix` (case-insensitive)."""
+        node = self._walk(prefix)
+        if node is None:
+            return []
+        out = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for ch, child in current.items():
+                if ch == _VALUES:
+                    out.extend(child)
+                else:
+                    stack.append(child)
+        return out
+
+    def __contains__(self, key: str) -> bool:
+        node = self._walk(key)
+        return node is not None and _VALUES in node
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,141 @@
+"""
+@author guu8hc
+Opt-in per-call profiling for MCP tools
+"""
+
+import io
+import os
+import sys
+import cProfile
+import threading
+import functools
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+CPROFILE = "cprofile"
+SAMPLE = "sample"
+
+# Tools profiled on every call, from the environment: "all" or "tool_a,tool_b"
+_always = frozenset(t.strip() for t in os.environ.get("PARAMDEF_PROFILE", "").split(",") if t.strip())
+_mode = os.environ.get("PARAMDEF_PROFILE_MODE", CPROFILE).lower()
+_output_dir = Path(os.environ.get("PARAMDEF_PROFILE_DIR", "_out/profiles"))
+_sample_interval = float(os.environ.get("PARAMDEF_PROFILE_INTERVAL", "0.001"))
+
+# Tools armed for exactly one profiled call (see `profile_next_call`)
+_armed = set()
+_armed_lock = threading.Lock()
+
+# cProfile cannot run twice at the same time in one interpreter
+_profiler_lock = threading.Lock()
+
+# Fast path flag: False unless something requested profiling
+_active = bool(_always)
+
+
+def profile_next_call(tool_name: str):
+    """Arm profiling for the next call of `tool_name` ("all" for any tool)."""
+    global _active
+    with _armed_lock:
+        _armed.add(tool_name)
+        _active = True
+
+
+def _should_profile(name: str) -> bool:
+    global _active
+    if "all" in _always or name in _always:
+        return True
+    with _armed_lock:
+        for key in (name, "all"):
+            if key in _armed:
+                _armed.discard(key)
+                _active = bool(_always or _armed)
+                return True
+    return False
+
+
+def _artifact_path(name: str, suffix: str) -> Path:
+    _output_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return _output_dir / f"{name}_{stamp}{suffix}"
+
+
+def _run_cprofile(name: str, fn, args, kwargs):
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn, *args, **kwargs)
+    path = _artifact_path(name, ".pstats")
+    profiler.dump_stats(str(path))
+
+    # Human-readable summary next to the binary stats
+    import pstats
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(40)
+    path.with_suffix(".txt").write_text(summary.getvalue())
+    return result, path
+
+
+def _collapse(frame) -> str:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(stack))
+
+
+def _run_sampling(name: str, fn, args, kwargs):
+    """Sample the calling thread's stack from a helper thread (collapsed stacks)."""
+    target = threading.get_ident()
+    samples = Counter()
+    done = threading.Event()
+
+    def sampler():
+        while not done.wait(_sample_interval):
+            frame = sys._current_frames().get(target)
+            if frame is not None:
+                samples[_collapse(frame)] += 1
+
+    thread = threading.Thread(target=sampler, name=f"profile-{name}", daemon=True)
+    thread.start()
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        done.set()
+        thread.join()
+
+    path = _artifact_path(name, ".collapsed")
+    path.write_text("".join(f"{stack} {count}\n" for stack, count in samples.most_common()))
+    return result, path
+
+
+def profiled(name: str):
+    """
+    Decorator that profiles calls of a tool when requested.
+
+    Profiling is requested with the PARAMDEF_PROFILE environment variable
+    ("all" or a comma separated list of tool names) or per call with
+    `profile_next_call`. A profiled call returns
+    {"result": <tool result>, "profile": <artifact path>}; artifacts go to
+    `_out/profiles/` as pstats (PARAMDEF_PROFILE_MODE=cprofile, default) or
+    collapsed stacks for flame graphs (PARAMDEF_PROFILE_MODE=sample).
+    When nothing is requested the wrapper only checks one module flag.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _active or not _should_profile(name):
+                return fn(*args, **kwargs)
+
+            if _mode == SAMPLE:
+                result, path = _run_sampling(name, fn, args, kwargs)
+            elif _profiler_lock.acquire(blocking=False):
+                try:
+                    result, path = _run_cprofile(name, fn, args, kwargs)
+                finally:
+                    _profiler_lock.release()
+            else:
+                # Another call is being profiled; fall back to sampling
+                result, path = _run_sampling(name, fn, args, kwargs)
+            return {"result": result, "profile": str(path)}
+        return wrapper
+    return decorator
@@ -0,0 +1,157 @@
+"""
+@author guu8hc
+Admission control for CPU-heavy MCP tools
+"""
+
+import heapq
+import itertools
+import threading
+import functools
+from time import perf_counter
+
+from mcp_project.utils.metrics import METRICS
+from mcp_project.mcp_settings import (
+    SCHEDULER_MAX_CONCURRENCY,
+    SCHEDULER_MAX_QUEUE,
+    SCHEDULER_QUEUE_TIMEOUT,
+)
+
+# Lower value runs first
+CHEAP = 0
+HEAVY = 1
+
+
+class SchedulerOverloaded(RuntimeError):
+    """Raised when a request is rejected instead of queued."""
+
+
+class RequestScheduler:
+    """
+    Bounded concurrency with a priority queue in front of it.
+
+    At most `max_concurrency` requests run at once; others wait in priority
+    order (FIFO within one priority). A request is rejected immediately when
+    `max_queue` requests are already waiting, and after `queue_timeout`
+    seconds without getting a slot.
+
+    Sync tools run on the server's thread pool, so waiting blocks a worker
+    thread, not the event loop.
+    """
+    def __init__(self, max_concurrency: int = SCHEDULER_MAX_CONCURRENCY,
+                 max_queue: int = SCHEDULER_MAX_QUEUE,
+                 queue_timeout: float = SCHEDULER_QUEUE_TIMEOUT,
+                 metrics=METRICS):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._metrics = metrics
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._seq = itertools.count()
+        self._running = 0
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiting)
+
+    def _publish(self):
+        self._metrics.set_gauge("scheduler.running", self._running)
+        self._metrics.set_gauge("scheduler.queue_depth", len(self._waiting))
+
+    def acquire(self, priority: int = HEAVY):
+        start = perf_counter()
+        with self._cond:
+            if self._running < self.max_concurrency and not self._waiting:
+                self._running += 1
+                self._metrics.increment("scheduler.admitted")
+                self._publish()
+                return
+
+            if len(self._waiting) >= self.max_queue:
+                self._metrics.increment("scheduler.rejected")
+                raise SchedulerOverloaded(
+                    f"Server overloaded: {self._running} running, {len(self._waiting)} queued; retry later"
+                )
+
+            ticket = (priority, next(self._seq))
+            heapq.heappush(self._waiting, ticket)
+            self._metrics.increment("scheduler.queued")
+            self._publish()
+
+            admitted = self._cond.wait_for(
+                lambda: self._waiting[0] == ticket and self._running < self.max_concurrency,
+                timeout=self.queue_timeout
+            )
+            if not admitted:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._metrics.increment("scheduler.timeouts")
+                self._publish()
+                # The head of the queue may have changed
+                self._cond.notify_all()
+                raise SchedulerOverloaded(
+                    f"Request waited {self.queue_timeout:g}s without a free slot; retry later"
+                )
+
+            heapq.heappop(self._waiting)
+            self._running += 1
+            self._metrics.increment("scheduler.admitted")
+            self._metrics.observe("scheduler.queue_wait", (perf_counter() - start) * 1e6)
+            self._publish()
+            # Let the next waiter check whether another slot is free
+            self._cond.notify_all()
+
+    def release(self):
+        with self._cond:
+            self._running -= 1
+            self._publish()
+            self._cond.notify_all()
+
+    def slot(self, priority: int = HEAVY):
+        """Context manager holding one slot for the duration of a request."""
+        return _Slot(self, priority)
+
+
+class _Slot:
+    __slots__ = ("_scheduler", "_priority")
+
+    def __init__(self, scheduler: RequestScheduler, priority: int):
+        self._scheduler = scheduler
+        self._priority = priority
+
+    def __enter__(self):
+        self._scheduler.acquire(self._priority)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._scheduler.release()
+
+
+SCHEDULER = RequestScheduler()
+
+
+def scheduled(priority: int = HEAVY, scheduler: RequestScheduler = None, cold: int = None):
+    """
+    Decorator running a tool under the request scheduler.
+
+    Use CHEAP for index lookups and HEAVY for tools that parse or scan
+    whole modules. `cold`, if given, is the priority of calls until one
+    has returned: lookups whose first call builds their index over the
+    whole corpus use `scheduled(CHEAP, cold=HEAVY)`.
+    """
+    def decorator(fn):
+        warm = cold is None
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            nonlocal warm
+            with (scheduler or SCHEDULER).slot(priority if warm else cold):
+                result = fn(*args, **kwargs)
+            warm = True
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,66 @@
+"""
+@author guu8hc
+Opt-in recording of MCP tool calls to a JSONL file
+"""
+
+import os
+import json
+import time
+import threading
+from pathlib import Path
+
+from fastmcp.server.middleware import Middleware
+
+from mcp_project.mcp_settings import RECORD_FILE
+
+
+def record_file():
+    """Recording target: PARAMDEF_RECORD_FILE or RECORD_FILE (None: not recording)."""
+    return os.environ.get("PARAMDEF_RECORD_FILE") or RECORD_FILE
+
+
+class SessionRecorder(Middleware):
+    """
+    FastMCP middleware appending one JSON line per tool call to `path`:
+
+        {"start": <epoch seconds>, "tool": ..., "arguments": {...},
+         "duration_ms": ..., "error": <exception type or null>}
+
+    Lines are written when a call finishes, so concurrent calls may appear
+    out of start order; `read_session` sorts them.
+    """
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def write(self, entry: dict):
+        line = json.dumps(entry, default=str, separators=(",", ":"))
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    async def on_call_tool(self, context, call_next):
+        start = time.time()
+        started = time.perf_counter()
+        error = None
+        try:
+            return await call_next(context)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.write({
+                "start": start,
+                "tool": context.message.name,
+                "arguments": context.message.arguments or {},
+                "duration_ms": (time.perf_counter() - started) * 1000,
+                "error": error,
+            })
+
+
+def read_session(path) -> list:
+    """Recorded calls of a session file, in start order."""
+    with open(path, "r", encoding="utf-8") as f:
+        calls = [json.loads(line) for line in f if line.strip()]
+    return sorted(calls, key=lambda call: call["start"])
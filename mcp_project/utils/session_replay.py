@@ -0,0 +1,231 @@
+"""
+@author guu8hc
+Replay of recorded MCP tool sessions against an in-process server
+
+    python -m mcp_project.utils.session_replay <session.jsonl>
+        [--concurrency N] [--speedup X] [--tool NAME]... [--json] [--compare before.json]
+        [--output-dir DIR]
+
+Sessions are recorded by running the server with PARAMDEF_RECORD_FILE set
+(see `session_recorder`). Calls are issued at their recorded offsets divided
+by --speedup (0: as fast as possible), with at most --concurrency calls in
+flight, through a `fastmcp.Client` connected to `mcp_server.app` in this
+process. The report holds the throughput and the latency distribution per
+tool and overall; --compare prints the change against an earlier --json
+report, e.g. one saved before a change.
+
+Replayed calls never touch the real ECUC configuration: the server's ECUC
+store and output directory point to a temporary directory (or --output-dir)
+and calls are not recorded again.
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+from contextlib import contextmanager
+
+from mcp_project.utils.session_recorder import SessionRecorder, read_session
+from mcp_project.utils.logging_utils import configure_logging
+
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+def _percentile(values: list, p: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered))) - 1))]
+
+
+def _distribution(latencies: list) -> dict:
+    if not latencies:
+        return {"mean_ms": 0.0, **{f"p{p}_ms": 0.0 for p in LATENCY_PERCENTILES}, "max_ms": 0.0}
+    return {
+        "mean_ms": sum(latencies) / len(latencies),
+        **{f"p{p}_ms": _percentile(latencies, p) for p in LATENCY_PERCENTILES},
+        "max_ms": max(latencies),
+    }
+
+
+def load_server():
+    """The `mcp_server` module; it imports its settings from the mcp_project directory."""
+    project_dir = str(Path(__file__).resolve().parents[1])
+    if project_dir not in sys.path:
+        sys.path.insert(0, project_dir)
+    import mcp_server
+    return mcp_server
+
+
+@contextmanager
+def isolated_server(output_dir=None):
+    """
+    Yield `mcp_server.app` with its ECUC store and output directory moved to
+    `output_dir` (default: a temporary directory, removed afterwards) and
+    without the session recorder, restoring both on exit.
+    """
+    from mcp_project.ecuc_creator.ecuc_store import ECUCConfigStore
+
+    record_file = os.environ.pop("PARAMDEF_RECORD_FILE", None)
+    server = load_server()
+    saved = (server.ecuc_store, server.ECUC_OUTPUT_DIR, list(server.app.middleware))
+    with tempfile.TemporaryDirectory(prefix="session_replay_") as tmp_dir:
+        out_dir = Path(output_dir or tmp_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        server.ecuc_store = ECUCConfigStore(out_dir / Path(server.ECUC_CONFIG_FILE).name)
+        server.ECUC_OUTPUT_DIR = str(out_dir)
+        server.app.middleware[:] = [m for m in saved[2] if not isinstance(m, SessionRecorder)]
+        try:
+            yield server.app
+        finally:
+            server.ecuc_store, server.ECUC_OUTPUT_DIR, server.app.middleware[:] = saved
+            if record_file is not None:
+                os.environ["PARAMDEF_RECORD_FILE"] = record_file
+
+
+async def _replay(app, calls: list, concurrency: int, speedup: float) -> tuple:
+    import fastmcp
+
+    slots = asyncio.Semaphore(max(1, concurrency))
+    first = calls[0]["start"] if calls else 0.0
+    results = []
+
+    async with fastmcp.Client(app) as client:
+        began = time.perf_counter()
+
+        async def issue(call):
+            if speedup > 0:
+                delay = (call["start"] - first) / speedup - (time.perf_counter() - began)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            async with slots:
+                started = time.perf_counter()
+                try:
+                    result = await client.call_tool(call["tool"], call.get("arguments") or {}, raise_on_error=False)
+                    error = bool(result.is_error)
+                except Exception:
+                    error = True
+                results.append((call["tool"], (time.perf_counter() - started) * 1000, error))
+
+        await asyncio.gather(*(issue(call) for call in calls))
+        wall_s = time.perf_counter() - began
+    return results, wall_s
+
+
+def replay_session(calls: list, app=None, concurrency: int = 1, speedup: float = 1.0, output_dir=None) -> dict:
+    """
+    Replay recorded `calls` (see `read_session`) against `app` (default:
+    `mcp_server.app` from `isolated_server(output_dir)`) and report:
+
+        {"calls", "errors", "wall_s", "throughput_per_s", "latency": {...}, "recorded": {...},
+         "tools": {name: {"calls", "errors", "latency": {...}, "recorded": {...}}}}
+
+    where each latency distribution holds mean, p50, p95, p99 and max in
+    milliseconds, next to the "recorded" distribution captured at record time.
+    """
+    if app is None:
+        with isolated_server(output_dir) as server_app:
+            results, wall_s = asyncio.run(_replay(server_app, calls, concurrency, speedup))
+    else:
+        results, wall_s = asyncio.run(_replay(app, calls, concurrency, speedup))
+
+    tools = {}
+    for tool, latency, error in results:
+        entry = tools.setdefault(tool, {"calls": 0, "errors": 0, "latencies": []})
+        entry["calls"] += 1
+        entry["errors"] += error
+        entry["latencies"].append(latency)
+    recorded = {}
+    for call in calls:
+        recorded.setdefault(call["tool"], []).append(call["duration_ms"])
+
+    return {
+        "calls": len(results),
+        "errors": sum(error for _, _, error in results),
+        "concurrency": concurrency,
+        "speedup": speedup,
+        "wall_s": wall_s,
+        "throughput_per_s": len(results) / wall_s if wall_s else 0.0,
+        "latency": _distribution([latency for _, latency, _ in results]),
+        "recorded": _distribution([call["duration_ms"] for call in calls]),
+        "tools": {
+            tool: {
+                "calls": entry["calls"],
+                "errors": entry["errors"],
+                "latency": _distribution(entry.pop("latencies")),
+                "recorded": _distribution(recorded.get(tool, [])),
+            }
+            for tool, entry in sorted(tools.items())
+        },
+    }
+
+
+def compare_reports(before: dict, after: dict) -> dict:
+    """Ratios after/before of the throughput and of the p50/p95 latencies, overall and per tool."""
+    def ratio(new, old):
+        return new / old if old else None
+
+    def latency_ratios(new, old):
+        return {f"p{p}_ms": ratio(new[f"p{p}_ms"], old[f"p{p}_ms"]) for p in (50, 95)}
+
+    return {
+        "throughput_per_s": ratio(after["throughput_per_s"], before["throughput_per_s"]),
+        "latency": latency_ratios(after["latency"], before["latency"]),
+        "tools": {
+            tool: latency_ratios(metrics["latency"], before["tools"][tool]["latency"])
+            for tool, metrics in after["tools"].items()
+            if tool in before["tools"]
+        },
+    }
+
+
+def format_report(report: dict) -> str:
+    columns = ("calls", "errors") + tuple(f"p{p}_ms" for p in LATENCY_PERCENTILES) + ("max_ms", "rec_p50_ms")
+    width = max([len("tool")] + [len(tool) for tool in report["tools"]]) + 2
+    lines = [
+        f"{report['calls']} calls ({report['errors']} errors) in {report['wall_s']:.3f} s: "
+        f"{report['throughput_per_s']:.1f} calls/s at concurrency {report['concurrency']}, "
+        f"speed-up {report['speedup']:g}",
+        f"{'tool':<{width}}" + "".join(f"{c:>12}" for c in columns),
+    ]
+    for tool, metrics in list(report["tools"].items()) + [("all", report)]:
+        latency = metrics["latency"]
+        values = [latency[f"p{p}_ms"] for p in LATENCY_PERCENTILES] + [latency["max_ms"], metrics["recorded"]["p50_ms"]]
+        lines.append(
+            f"{tool:<{width}}{metrics['calls']:>12}{metrics['errors']:>12}" + "".join(f"{v:>12.3f}" for v in values)
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded MCP tool session")
+    parser.add_argument("session", help="JSONL file written with PARAMDEF_RECORD_FILE")
+    parser.add_argument("--concurrency", type=int, default=1, help="Calls in flight at once")
+    parser.add_argument("--speedup", type=float, default=1.0,
+                        help="Divide the recorded gaps between calls by this factor (0: no gaps)")
+    parser.add_argument("--tool", action="append", help="Replay only calls of this tool")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--compare", help="Earlier --json report to compare with")
+    parser.add_argument("--output-dir", help="Keep the ECUC output of the replayed calls here (default: discarded)")
+    args = parser.parse_args()
+
+    configure_logging()
+    calls = read_session(args.session)
+    if args.tool:
+        calls = [call for call in calls if call["tool"] in args.tool]
+    if not calls:
+        parser.error(f"No tool calls to replay in '{args.session}'")
+
+    report = replay_session(calls, concurrency=args.concurrency, speedup=args.speedup, output_dir=args.output_dir)
+    print(json.dumps(report, indent=4) if args.json else format_report(report))
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            comparison = compare_reports(json.load(f), report)
+        print(json.dumps(comparison, indent=4), file=sys.stderr if args.json else sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+@author guu8hc
+Symmetric-delete spelling index (SymSpell)
+"""
+
+from itertools import combinations
+
+from rapidfuzz.distance import OSA
+
+
+class SymSpellIndex:
+    """
+    Find the terms within a small edit distance of a word.
+
+    Every term is stored under all strings obtained by deleting up to
+    `max_distance` characters from its first `prefix_length` characters.
+    A lookup generates the same deletes for the word, collects the terms
+    sharing one of them and verifies each candidate with the optimal string
+    alignment distance (Levenshtein plus adjacent transpositions). The cost
+    of a lookup depends on the word length, not on the number of terms.
+
+    Terms are case-folded; the values stored with a term (e.g. the
+    definition paths of a short-name) are returned with it.
+    """
+    def __init__(self, max_distance: int = 2, prefix_length: int = 7):
+        if prefix_length <= max_distance:
+            raise ValueError("prefix_length must be larger than max_distance")
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._deletes = {}
+        self._terms = {}
+
+    def _delete_variants(self, word: str) -> set:
+        prefix = word[:self.prefix_length]
+        variants = {prefix}
+        for n in range(1, min(self.max_distance, len(prefix)) + 1):
+            for positions in combinations(range(len(prefix)), n):
+                variants.add("".join(ch for i, ch in enumerate(prefix) if i not in positions))
+        return variants
+
+    def add(self, term: str, value=None):
+        folded = term.casefold()
+        values = self._terms.get(folded)
+        if values is None:
+            values = self._terms[folded] = {}
+            for variant in self._delete_variants(folded):
+                self._deletes.setdefault(variant, []).append(folded)
+        values[term if value is None else value] = None
+
+    def lookup(self, word: str, max_distance: int = None, limit: int = None) -> list:
+        """
+        (term, distance, values) of every term within `max_distance` of
+        `word`, closest first, ties by term.
+        """
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        folded = word.casefold()
+        candidates = set()
+        for variant in self._delete_variants(folded):
+            candidates.update(self._deletes.get(variant, ()))
+
+        found = []
+        for term in candidates:
+            if abs(len(term) - len(folded)) > max_distance:
+                continue
+            distance = OSA.distance(folded, term, score_cutoff=max_distance)
+            if distance <= max_distance:
+                found.append((distance, term))
+        found.sort()
+        if limit is not None:
+            found = found[:limit]
+        return [(term, distance, list(self._terms[term])) for distance, term in found]
+
+    def __contains__(self, term: str) -> bool:
+        return term.casefold() in self._terms
+
+    def __len__(self) -> int:
+        return len(self._terms)
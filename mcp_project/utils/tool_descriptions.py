@@ -0,0 +1,59 @@
+"""
+@author guu8hc
+Precompiled registry of MCP tool descriptions
+"""
+
+import json
+from pathlib import Path
+
+from mcp_project.mcp_settings import DESCRIPTION
+
+DESCRIPTIONS_DIR = Path(__file__).resolve().parent.parent / "mcp_function_descriptions"
+REGISTRY_FILE = DESCRIPTIONS_DIR / "_registry.json"
+
+_registry = None
+
+
+def compile_registry(directory=DESCRIPTIONS_DIR) -> dict:
+    """Collect every `<tool>.json` description file into {tool: content}."""
+    registry = {}
+    for path in sorted(Path(directory).glob("*.json")):
+        if path.name.startswith("_"):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            registry[path.stem] = json.load(f)
+    return registry
+
+
+def write_registry(directory=DESCRIPTIONS_DIR, registry_file=REGISTRY_FILE) -> Path:
+    """Regenerate the bundled registry after editing a description file."""
+    registry_file = Path(registry_file)
+    registry_file.write_text(json.dumps(compile_registry(directory), indent=4, sort_keys=True) + "\n", encoding="utf-8")
+    return registry_file
+
+
+def load_registry() -> dict:
+    """
+    The registry, read once per process.
+
+    The bundled `_registry.json` is a single file read; if it is missing
+    (e.g. a source checkout without it) the description files are compiled
+    in memory instead.
+    """
+    global _registry
+    if _registry is None:
+        try:
+            with open(REGISTRY_FILE, "r", encoding="utf-8") as f:
+                _registry = json.load(f)
+        except FileNotFoundError:
+            _registry = compile_registry()
+    return _registry
+
+
+def tool_description(tool_name: str, key: str = DESCRIPTION) -> str:
+    """Description of `tool_name` from the registry."""
+    return load_registry()[tool_name][key]
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_registry()}")
@@ -0,0 +1,312 @@
+"""
+Shared fixtures: synthetic ParamDef ARXML files
+@author: m4tice
+"""
+
+import pytest
+from xml.sax.saxutils import escape
+
+PARAM_TAGS = {
+    "BOOLEAN": "ECUC-BOOLEAN-PARAM-DEF",
+    "INTEGER": "ECUC-INTEGER-PARAM-DEF",
+    "FLOAT": "ECUC-FLOAT-PARAM-DEF",
+    "STRING": "ECUC-STRING-PARAM-DEF",
+    "ENUMERATION": "ECUC-ENUMERATION-PARAM-DEF",
+    "FUNCTION_NAME": "ECUC-FUNCTION-NAME-DEF",
+}
+
+
+def _multiplicity(spec):
+    lower = spec.get("lower", "1")
+    upper = spec.get("upper", "1")
+    out = f"<LOWER-MULTIPLICITY>{lower}</LOWER-MULTIPLICITY>"
+    if upper == "*":
+        out += "<UPPER-MULTIPLICITY-INFINITE>true</UPPER-MULTIPLICITY-INFINITE>"
+    else:
+        out += f"<UPPER-MULTIPLICITY>{upper}</UPPER-MULTIPLICITY>"
+    return out
+
+
+def _parameter(spec):
+    tag = PARAM_TAGS[spec.get("type", "STRING")]
+    out = f"<{tag}><SHORT-NAME>{spec['name']}</SHORT-NAME>"
+    if "desc" in spec:
+        out += f'<DESC><L-2 L="EN">{escape(spec["desc"])}</L-2></DESC>'
+    out += _multiplicity(spec)
+    if "default" in spec:
+        out += f"<DEFAULT-VALUE>{spec['default']}</DEFAULT-VALUE>"
+    if "min" in spec:
+        out += f"<MIN>{spec['min']}</MIN>"
+    if "max" in spec:
+        out += f"<MAX>{spec['max']}</MAX>"
+    if spec.get("literals"):
+        out += "<LITERALS>"
+        for lit in spec["literals"]:
+            out += f"<ECUC-ENUMERATION-LITERAL-DEF><SHORT-NAME>{lit}</SHORT-NAME></ECUC-ENUMERATION-LITERAL-DEF>"
+        out += "</LITERALS>"
+    return out + f"</{tag}>"
+
+
+REFERENCE_TAGS = {
+    "REFERENCE": "ECUC-REFERENCE-DEF",
+    "CHOICE": "ECUC-CHOICE-REFERENCE-DEF",
+    "FOREIGN": "ECUC-FOREIGN-REFERENCE-DEF",
+}
+
+
+def _reference(spec):
+    kind = spec.get("kind", "REFERENCE")
+    tag = REFERENCE_TAGS[kind]
+    out = f"<{tag}><SHORT-NAME>{spec['name']}</SHORT-NAME>" + _multiplicity(spec)
+    destinations = "".join(
+        f'<DESTINATION-REF DEST="ECUC-PARAM-CONF-CONTAINER-DEF">{d}</DESTINATION-REF>'
+        for d in spec.get("destinations", [])
+    )
+    if kind == "CHOICE":
+        out += f"<DESTINATION-REFS>{destinations}</DESTINATION-REFS>"
+    elif kind == "FOREIGN":
+        out += f"<DESTINATION-TYPE>{spec['destination_type']}</DESTINATION-TYPE>"
+    else:
+        out += destinations
+    return out + f"</{tag}>"
+
+
+def _container(spec):
+    tag = "ECUC-CHOICE-CONTAINER-DEF" if spec.get("choices") else "ECUC-PARAM-CONF-CONTAINER-DEF"
+    out = f"<{tag}><SHORT-NAME>{spec['name']}</SHORT-NAME>"
+    if "desc" in spec:
+        out += f'<DESC><L-2 L="EN">{escape(spec["desc"])}</L-2></DESC>'
+    out += _multiplicity(spec)
+    if spec.get("parameters"):
+        out += "<PARAMETERS>" + "".join(_parameter(p) for p in spec["parameters"]) + "</PARAMETERS>"
+    if spec.get("references"):
+        out += "<REFERENCES>" + "".join(_reference(r) for r in spec["references"]) + "</REFERENCES>"
+    if spec.get("sub_containers"):
+        out += "<SUB-CONTAINERS>" + "".join(_container(c) for c in spec["sub_containers"]) + "</SUB-CONTAINERS>"
+    if spec.get("choices"):
+        out += "<CHOICES>" + "".join(_container(c) for c in spec["choices"]) + "</CHOICES>"
+    return out + f"</{tag}>"
+
+
+def build_paramdef_arxml(module: dict) -> str:
+    """
+    Render a module spec into a minimal AUTOSAR R4 ParamDef ARXML document.
+
+    A spec is a dict with `name`, optional `desc` and a list of `containers`;
+    containers carry `parameters`, `references`, `sub_containers` and
+    `choices`, parameters carry `type`, `literals`, `min`, `max`, `default`,
+    `lower` and `upper`, references carry `kind` (REFERENCE, CHOICE or
+    FOREIGN), `destinations` and `destination_type`.
+    """
+    containers = "".join(_container(c) for c in module.get("containers", []))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<AUTOSAR xmlns="http://autosar.org/schema/r4.0"><AR-PACKAGES><AR-PACKAGE>'
+        "<SHORT-NAME>AUTOSAR</SHORT-NAME><ELEMENTS>"
+        f"<ECUC-MODULE-DEF><SHORT-NAME>{module['name']}</SHORT-NAME>"
+        f'<DESC><L-2 L="EN">{escape(module.get("desc", ""))}</L-2></DESC>'
+        f"<CONTAINERS>{containers}</CONTAINERS>"
+        "</ECUC-MODULE-DEF></ELEMENTS></AR-PACKAGE></AR-PACKAGES></AUTOSAR>"
+    )
+
+
+PDU_REF = "/AUTOSAR/EcucDefs/EcuC/EcucConfigSet/EcucPduCollection/Pdu"
+
+COM_SPEC = {
+    "name": "Com",
+    "desc": "Configuration of the Com module.",
+    "containers": [
+        {
+            "name": "ComGeneral",
+            "parameters": [
+                {"name": "ComConfigurationUseDet", "type": "BOOLEAN", "default": "false"},
+                {"name": "ComSupportedIPduGroups", "type": "INTEGER", "min": "0", "max": "65535"},
+            ],
+        },
+        {
+            "name": "ComConfig",
+            "sub_containers": [
+                {
+                    "name": "ComIPdu",
+                    "lower": "0",
+                    "upper": "*",
+                    "parameters": [
+                        {"name": "ComIPduDirection", "type": "ENUMERATION", "literals": ["RECEIVE", "SEND"]},
+                        {"name": "ComIPduSignalProcessing", "type": "ENUMERATION",
+                         "literals": ["DEFERRED", "IMMEDIATE"]},
+                        {"name": "ComIPduHandleId", "type": "INTEGER", "lower": "0", "min": "0", "max": "65535"},
+                        {"name": "ComIPduCallout", "type": "FUNCTION_NAME", "lower": "0"},
+                    ],
+                    "references": [
+                        {"name": "ComPduIdRef", "destinations": [PDU_REF]},
+                        {"name": "ComIPduSignalRef", "lower": "0", "upper": "*",
+                         "destinations": ["/AUTOSAR/EcucDefs/Com/ComConfig/ComSignal"]},
+                    ],
+                },
+                {
+                    "name": "ComSignal",
+                    "lower": "0",
+                    "upper": "*",
+                    "parameters": [
+                        {"name": "ComBitPosition", "type": "INTEGER", "min": "0", "max": "4095"},
+                        {"name": "ComBitSize", "type": "INTEGER", "lower": "0", "min": "0", "max": "64"},
+                        {"name": "ComTimeout", "type": "FLOAT", "lower": "0", "min": "0", "max": "3600"},
+                        {"name": "ComTransferProperty", "type": "ENUMERATION", "lower": "0",
+                         "literals": ["PENDING", "TRIGGERED", "TRIGGERED_ON_CHANGE"]},
+                    ],
+                    "references": [
+                        {"name": "ComSystemTemplateSystemSignalRef", "kind": "FOREIGN", "lower": "0",
+                         "destination_type": "I-SIGNAL-TO-I-PDU-MAPPING"},
+                    ],
+                },
+            ],
+        },
+    ],
+}
+
+PDUR_SPEC = {
+    "name": "PduR",
+    "desc": "Configuration of the PduR module.",
+    "containers": [
+        {
+            "name": "PduRGeneral",
+            "parameters": [
+                {"name": "PduRDevErrorDetect", "type": "BOOLEAN", "default": "true"},
+                {"name": "PduRVersionInfoApi", "type": "BOOLEAN", "default": "false"},
+            ],
+        },
+        {
+            "name": "PduRRoutingTables",
+            "sub_containers": [
+                {
+                    "name": "PduRRoutingPath",
+                    "lower": "0",
+                    "upper": "*",
+                    "parameters": [
+                        {"name": "PduRQueueDepth", "type": "INTEGER", "lower": "0", "min": "1", "max": "255"},
+                    ],
+                    "references": [
+                        {"name": "PduRSrcPduRef", "destinations": [PDU_REF]},
+                        {"name": "PduRDestPduRef", "kind": "CHOICE",
+                         "destinations": [PDU_REF, "/AUTOSAR/EcucDefs/Com/ComConfig/ComIPdu"]},
+                    ],
+                },
+            ],
+        },
+    ],
+}
+
+CANIF_SPEC = {
+    "name": "CanIf",
+    "desc": "Configuration of the CanIf module.",
+    "containers": [
+        {
+            "name": "CanIfPublicCfg",
+            "parameters": [
+                {"name": "CanIfPublicDevErrorDetect", "type": "BOOLEAN", "default": "true"},
+                {"name": "CanIfPublicTxBuffering", "type": "BOOLEAN", "default": "false"},
+            ],
+        },
+        {
+            "name": "CanIfInitCfg",
+            "sub_containers": [
+                {
+                    "name": "CanIfRxPduCfg",
+                    "lower": "0",
+                    "upper": "*",
+                    "parameters": [
+                        {"name": "CanIfRxPduCanId", "type": "INTEGER", "lower": "0", "min": "0", "max": "536870911"},
+                        {"name": "CanIfRxPduDlc", "type": "INTEGER", "lower": "0", "min": "0", "max": "64"},
+                    ],
+                    "references": [
+                        {"name": "CanIfRxPduRef", "destinations": [PDU_REF]},
+                    ],
+                },
+            ],
+        },
+    ],
+}
+
+ECUC_SPEC = {
+    "name": "EcuC",
+    "desc": "Configuration of the EcuC module.",
+    "containers": [
+        {
+            "name": "EcucConfigSet",
+            "sub_containers": [
+                {
+                    "name": "EcucPduCollection",
+                    "sub_containers": [
+                        {
+                            "name": "Pdu",
+                            "lower": "0",
+                            "upper": "*",
+                            "parameters": [
+                                {"name": "PduLength", "type": "INTEGER", "lower": "0", "min": "0", "max": "4294967295"},
+                            ],
+                        },
+                    ],
+                },
+            ],
+        },
+    ],
+}
+
+MODULE_SPECS = [COM_SPEC, PDUR_SPEC, CANIF_SPEC, ECUC_SPEC]
+
+
+def write_paramdef_files(directory, specs=MODULE_SPECS) -> list:
+    """Write one `<Module>_EcucParamDef.arxml` per spec into `directory`."""
+    files = []
+    for spec in specs:
+        path = directory / f"{spec['name']}_EcucParamDef.arxml"
+        path.write_text(build_paramdef_arxml(spec), encoding="utf-8")
+        files.append(path)
+    return files
+
+
+@pytest.fixture
+def paramdef_files(tmp_path):
+    """Synthetic Com, PduR, CanIf and EcuC ParamDef files in a temporary directory."""
+    directory = tmp_path / "paramdefs"
+    directory.mkdir()
+    return write_paramdef_files(directory)
+
+
+@pytest.fixture
+def close_matches_reference():
+    """
+    Plain RapidFuzz top-n search over one key list, sorted by (-score, key):
+    the reference the matcher's pruned and parallel scoring must reproduce.
+    """
+    from rapidfuzz import process, fuzz
+
+    def close_matches(keyword: str, keys: list, n: int, cutoff: float) -> list:
+        matches = process.extract(keyword, keys, scorer=fuzz.WRatio, limit=n, score_cutoff=int(cutoff * 100))
+        return sorted(matches, key=lambda x: (-x[1], x[0]))
+
+    return close_matches
+
+
+@pytest.fixture
+def paramdef_index(paramdef_files):
+    """A `ParamDefIndex` built over the synthetic ParamDef files."""
+    from mcp_project.paramdef_handler.paramdef_index import ParamDefIndex
+    return ParamDefIndex(paramdef_files)
+
+
+@pytest.fixture(autouse=True)
+def no_search_daemon(monkeypatch):
+    """Keep a search daemon running on the developer machine out of the tests."""
+    monkeypatch.setenv("PARAMDEF_DAEMON_SOCKET", "")
+
+
+@pytest.fixture(autouse=True)
+def fresh_module_cache(monkeypatch):
+    """Give each test an empty in-memory module cache without on-disk snapshots, and no cached keys or hashes."""
+    from mcp_project.paramdef_handler import paramdef_module_cache, paramdef_utils, paramdef_diff
+    from mcp_project.paramdef_handler.paramdef_module_cache import ModuleCache, module_cache_budget
+
+    monkeypatch.setattr(paramdef_module_cache, "_default_cache", ModuleCache(module_cache_budget()))
+    monkeypatch.setattr(paramdef_utils, "_file_keys_cache", {})
+    monkeypatch.setattr(paramdef_diff, "_hashed_cache", {})
@@ -0,0 +1,88 @@
+"""
+@author: m4tice
+"""
+
+import json
+import pathlib
+
+
+def test_paramdef_index_resolves_case_insensitively(paramdef_index):
+    resolved = paramdef_index.resolve("com/comconfig/comipdu")
+    assert resolved["definition_path"] == "Com/ComConfig/ComIPdu"
+    assert resolved["node"]["type"] == "CONTAINER"
+    assert paramdef_index.resolve("Com/NoSuchContainer") is None
+    assert sorted(paramdef_index.modules()) == ["CanIf", "Com", "EcuC", "PduR"]
+
+
+def test_bulk_creation_writes_single_file(tmp_path, paramdef_index):
+    from mcp_project.ecuc_creator.ecuc_bulk import create_ecuc_containers_bulk
+
+    entries = [
+        {
+            "path": "com/comconfig/comipdu",
+            "names": {"ComIPdu": f"PDU_{i}", "ComConfig": "ComConfig_0"},
+            "parameters": {
+                "comipdudirection": "RECEIVE",
+                "ComIPduSignalProcessing": "DEFERRED",
+                "ComPduIdRef": "/EcuC/EcucConfigSet/EcucPduCollection/PDU_0",
+            },
+        }
+        for i in range(50)
+    ]
+    out_dir = tmp_path / "out"
+    result = create_ecuc_containers_bulk(entries, index=paramdef_index, out_dir=out_dir)
+
+    assert result["created"] == 50
+    assert result["containers_per_second"] > 0
+    assert [str(p) for p in out_dir.iterdir()] == [result["file"]]
+
+    data = json.loads(pathlib.Path(result["file"]).read_text())
+    assert len(data) == 50
+    assert data[0]["definitionPath"] == "Com/ComConfig/ComIPdu"
+    assert data[0]["parameters"] == {
+        "ComIPduDirection": "RECEIVE",
+        "ComIPduSignalProcessing": "DEFERRED",
+        "ComPduIdRef": "/EcuC/EcucConfigSet/EcucPduCollection/PDU_0",
+    }
+    assert data[0]["shortName"] == {"comipdu": "PDU_0", "comconfig": "ComConfig_0"}
+
+
+def test_bulk_creation_reports_all_errors_and_writes_nothing(tmp_path, paramdef_index):
+    from mcp_project.ecuc_creator.ecuc_bulk import create_ecuc_containers_bulk
+
+    entries = [
+        {"path": "Com/ComConfig/ComIPdu", "names": {"ComIPdu": "A"}, "parameters": {"ComIPduDirektion": "SEND"}},
+        {"path": "Com/ComConfig/NoSuchThing", "names": {}},
+        {"path": "Com/ComConfig/ComIPdu/ComIPduDirection", "names": {}},
+    ]
+    out_dir = tmp_path / "out"
+    result = create_ecuc_containers_bulk(entries, index=paramdef_index, out_dir=out_dir)
+
+    assert result["created"] == 0
+    assert sorted({e["entry"] for e in result["errors"]}) == [0, 1, 2]
+    missing = {e["parameter"] for e in result["errors"] if e["error"] == "Missing required parameter"}
+    assert missing == {"ComIPduDirection", "ComIPduSignalProcessing", "ComPduIdRef"}
+    assert not out_dir.exists()
+
+
+def test_bulk_creation_without_paramdefs_matches_single_container_tool(tmp_path):
+    from mcp_project.ecuc_creator.ecuc_bulk import create_ecuc_containers_bulk
+    from mcp_project.paramdef_handler.paramdef_index import ParamDefIndex
+
+    entries = [{"path": "/Com/ComConfig/ComIPdu", "names": {"ComIPdu": "A"}, "parameters": {"ComIPduDirection": "SEND"}}]
+    result = create_ecuc_containers_bulk(entries, index=ParamDefIndex([]), out_dir=tmp_path / "out")
+
+    assert result["created"] == 1
+    data = json.loads(pathlib.Path(result["file"]).read_text())
+    assert data[0]["definitionPath"] == "Com/ComConfig/ComIPdu"
+    assert data[0]["parameters"] == {"ComIPduDirection": "SEND"}
+
+    # Malformed entries are still rejected
+    assert create_ecuc_containers_bulk([{"names": {}}], index=ParamDefIndex([]), out_dir=tmp_path / "out")["errors"]
+
+
+def test_unique_output_path_never_collides(tmp_path):
+    from mcp_project.utils.generic_utils import unique_output_path
+
+    paths = {unique_output_path(tmp_path, "ecuc_container_") for _ in range(20)}
+    assert len(paths) == 20
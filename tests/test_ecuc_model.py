@@ -0,0 +1,43 @@
+"""
+@author: m4tice
+"""
+
+
+def _dummy_model():
+    from mcp_project.model_mngr.mcp_dummy_data import ecuc
+    from mcp_project.model_mngr.ecuc_model import ECUCModelIndex
+
+    model = ECUCModelIndex()
+    model.load_tree(ecuc)
+    return model
+
+
+def test_explore_matches_dummy_explore_tree():
+    from mcp_project.model_mngr.mcp_dummy_data import ecuc, explore_tree
+
+    model = _dummy_model()
+    for path in ["Com/ComConfig/ComIPdu", "com/comconfig", "Com", "PduR/PduRGeneral", "Com/ComConf", None]:
+        assert model.explore(path) == explore_tree(ecuc, path)
+
+
+def test_explore_unknown_path_is_empty():
+    model = _dummy_model()
+    assert model.explore("CanIf/CanIfInitCfg") == {}
+    assert model.explore("Com/ComConfig/ComSignal") == {"Com": {"ComConfig_0": {}}}
+
+
+def test_explore_uses_types_not_instance_names():
+    from mcp_project.model_mngr.ecuc_model import ECUCModelIndex, ROOT
+
+    model = ECUCModelIndex()
+    com = model.add_instance(ROOT, "Com", "Com")
+    config = model.add_instance(com, "ComConfig_0", "ComConfig")
+    for i in range(1000):
+        model.add_instance(config, f"ESP_{i}", "ComIPdu", parameters={"ComIPduDirection": "SEND"})
+    model.add_instance(config, "Sig_0", "ComSignal")
+
+    result = model.explore("com/comconfig/comipdu")
+    assert len(result["com"]["ComConfig_0"]) == 1000
+    assert "Sig_0" not in result["com"]["ComConfig_0"]
+    assert model.explore("Com/ComConfig/ComSig") == {"Com": {"ComConfig_0": {"Sig_0": {}}}}
+    assert len(model) == 1003
@@ -0,0 +1,67 @@
+"""
+@author: m4tice
+"""
+
+import json
+import threading
+
+
+def test_append_does_not_rewrite_merged_file(tmp_path):
+    from mcp_project.ecuc_creator.ecuc_store import ECUCConfigStore
+
+    store = ECUCConfigStore(tmp_path / "ecuc_config.json", compact_threshold=0)
+    store.append({"ecuc": {"Com": {"type": "Com", "ESP_10": {"type": "ComIPdu"}}}})
+    store.append({"ecuc": {"Com": {"type": "Com", "ESP_19": {"type": "ComIPdu"}}}})
+
+    assert not store.path.exists()
+    assert store.pending() == 2
+
+    merged = store.load()
+    assert set(merged["ecuc"]["Com"]) == {"type", "ESP_10", "ESP_19"}
+
+
+def test_compact_merges_log_and_clears_it(tmp_path):
+    from mcp_project.ecuc_creator.ecuc_store import ECUCConfigStore
+
+    out = tmp_path / "ecuc_config.json"
+    out.write_text(json.dumps({"ecuc": {"PduR": {"type": "PduR"}}}))
+
+    store = ECUCConfigStore(out, compact_threshold=0)
+    store.append({"ecuc": {"Com": {"type": "Com"}}})
+    merged = store.compact()
+
+    assert merged == {"ecuc": {"PduR": {"type": "PduR"}, "Com": {"type": "Com"}}}
+    assert json.loads(out.read_text()) == merged
+    assert not store.log_path.exists()
+    assert store.pending() == 0
+
+
+def test_auto_compaction_threshold(tmp_path):
+    from mcp_project.ecuc_creator.ecuc_store import ECUCConfigStore
+
+    store = ECUCConfigStore(tmp_path / "ecuc_config.json", compact_threshold=3)
+    for i in range(3):
+        store.append({"ecuc": {"Com": {f"ESP_{i}": {"type": "ComIPdu"}}}})
+
+    assert store.path.exists()
+    assert store.pending() == 0
+
+
+def test_concurrent_appends_are_not_lost(tmp_path):
+    from mcp_project.ecuc_creator.ecuc_store import ECUCConfigStore
+
+    out = tmp_path / "ecuc_config.json"
+    stores = [ECUCConfigStore(out, compact_threshold=0) for _ in range(4)]
+
+    def worker(store, offset):
+        for i in range(25):
+            store.append({"ecuc": {"Com": {f"ESP_{offset + i}": {"type": "ComIPdu"}}}})
+
+    threads = [threading.Thread(target=worker, args=(s, idx * 100)) for idx, s in enumerate(stores)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    merged = stores[0].compact()
+    assert len(merged["ecuc"]["Com"]) == 100
@@ -0,0 +1,120 @@
+"""
+@author: m4tice
+"""
+
+NS = "http://autosar.org/schema/r4.0"
+
+
+def _container(name, definition, params="", subs=""):
+    return (
+        f"<ECUC-CONTAINER-VALUE><SHORT-NAME>{name}</SHORT-NAME>"
+        f'<DEFINITION-REF DEST="ECUC-PARAM-CONF-CONTAINER-DEF">{definition}</DEFINITION-REF>'
+        + (f"<PARAMETER-VALUES>{params}</PARAMETER-VALUES>" if params else "")
+        + (f"<SUB-CONTAINERS>{subs}</SUB-CONTAINERS>" if subs else "")
+        + "</ECUC-CONTAINER-VALUE>"
+    )
+
+
+def _textual(definition, value):
+    return (
+        "<ECUC-TEXTUAL-PARAM-VALUE>"
+        f'<DEFINITION-REF DEST="ECUC-ENUMERATION-PARAM-DEF">{definition}</DEFINITION-REF>'
+        f"<VALUE>{value}</VALUE></ECUC-TEXTUAL-PARAM-VALUE>"
+    )
+
+
+def _write_values(path, n_pdus):
+    pdus = "".join(
+        _container(
+            f"PDU_{i}",
+            "/AUTOSAR/EcucDefs/Com/ComConfig/ComIPdu",
+            params=_textual("/AUTOSAR/EcucDefs/Com/ComConfig/ComIPdu/ComIPduDirection", "SEND" if i % 2 else "RECEIVE"),
+        )
+        for i in range(n_pdus)
+    )
+    config = _container("ComConfig_0", "/AUTOSAR/EcucDefs/Com/ComConfig", subs=pdus)
+    path.write_text(
+        f'<?xml version="1.0" encoding="UTF-8"?><AUTOSAR xmlns="{NS}"><AR-PACKAGES><AR-PACKAGE>'
+        "<SHORT-NAME>EcucValues</SHORT-NAME><ELEMENTS>"
+        "<ECUC-MODULE-CONFIGURATION-VALUES><SHORT-NAME>Com</SHORT-NAME>"
+        '<DEFINITION-REF DEST="ECUC-MODULE-DEF">/AUTOSAR/EcucDefs/Com</DEFINITION-REF>'
+        f"<CONTAINERS>{config}</CONTAINERS>"
+        "</ECUC-MODULE-CONFIGURATION-VALUES></ELEMENTS></AR-PACKAGE></AR-PACKAGES></AUTOSAR>",
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_load_ecuc_values_populates_index(tmp_path):
+    from mcp_project.model_mngr.ecuc_model import ECUCModelIndex
+    from mcp_project.model_mngr.ecuc_value_loader import load_ecuc_values
+
+    model = ECUCModelIndex()
+    added = load_ecuc_values(_write_values(tmp_path / "Com_EcucValues.arxml", 3), model)
+
+    assert added == 5
+    assert model.explore("Com/ComConfig/ComIPdu") == {
+        "Com": {"ComConfig_0": {"PDU_0": {}, "PDU_1": {}, "PDU_2": {}}}
+    }
+    pdu = model.find_children(model.find_children(model.find_children(0, "Com")[0], "ComConfig")[0], "ComIPdu")[1]
+    assert model.parameters(pdu) == {"ComIPduDirection": "SEND"}
+    assert model.definition(pdu) == "/AUTOSAR/EcucDefs/Com/ComConfig/ComIPdu"
+
+
+def test_load_ecuc_values_keeps_every_value_of_multi_instance_parameters(tmp_path):
+    from mcp_project.model_mngr.ecuc_model import ECUCModelIndex
+    from mcp_project.model_mngr.ecuc_value_loader import load_ecuc_values
+
+    dest = "/AUTOSAR/EcucDefs/Com/ComConfig/ComIPdu/ComIPduSignalRef"
+    refs = "".join(
+        f'<ECUC-REFERENCE-VALUE><DEFINITION-REF DEST="ECUC-REFERENCE-DEF">{dest}</DEFINITION-REF>'
+        f'<VALUE-REF DEST="ECUC-CONTAINER-VALUE">/EcucValues/Com/ComConfig_0/Signal_{i}</VALUE-REF></ECUC-REFERENCE-VALUE>'
+        for i in range(3)
+    )
+    path = _write_values(tmp_path / "Com_EcucValues.arxml", 1)
+    text = path.read_text(encoding="utf-8")
+    path.write_text(text.replace("</PARAMETER-VALUES>", f"</PARAMETER-VALUES><REFERENCE-VALUES>{refs}</REFERENCE-VALUES>"),
+                    encoding="utf-8")
+
+    model = ECUCModelIndex()
+    load_ecuc_values(path, model)
+    pdu = model.find_children(model.find_children(model.find_children(0, "Com")[0], "ComConfig")[0], "ComIPdu")[0]
+    assert model.parameters(pdu) == {
+        "ComIPduDirection": "RECEIVE",
+        "ComIPduSignalRef": [f"/EcucValues/Com/ComConfig_0/Signal_{i}" for i in range(3)],
+    }
+
+
+def test_load_ecuc_model_reuses_snapshot(tmp_path, monkeypatch):
+    from mcp_project.model_mngr import ecuc_value_loader as loader
+
+    files = [_write_values(tmp_path / "Com_EcucValues.arxml", 10)]
+    cache_dir = tmp_path / "cache"
+    first = loader.load_ecuc_model(files, cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("snapshot should have been used")
+
+    monkeypatch.setattr(loader, "load_ecuc_values", fail)
+    second = loader.load_ecuc_model(files, cache_dir=cache_dir)
+    assert second.explore("Com/ComConfig/ComIPdu") == first.explore("Com/ComConfig/ComIPdu")
+    assert len(second) == len(first) == 12
+
+
+def test_ecuc_model_is_reloaded_when_value_files_change(tmp_path, monkeypatch):
+    from mcp_project.model_mngr import ecuc_model, ecuc_value_loader as loader
+
+    files = [_write_values(tmp_path / "Com_EcucValues.arxml", 2)]
+    load = loader.load_ecuc_model
+    monkeypatch.setattr(loader, "get_all_ecuc_value_files", lambda: list(files))
+    monkeypatch.setattr(loader, "load_ecuc_model", lambda value_files: load(value_files, cache_dir=None))
+    monkeypatch.setattr(ecuc_model, "_default_model", None)
+    monkeypatch.setattr(ecuc_model, "_default_fingerprint", None)
+
+    first = ecuc_model.get_ecuc_model()
+    assert ecuc_model.get_ecuc_model() is first
+    assert len(first) == 4
+
+    _write_values(files[0], 5)
+    assert len(ecuc_model.get_ecuc_model()) == 7
@@ -0,0 +1,54 @@
+"""
+@author: m4tice
+"""
+
+import json
+import logging
+
+
+def test_json_log_file_with_extra_fields_and_level_gating(tmp_path):
+    from mcp_project.utils.logging_utils import configure_logging, get_logger
+
+    log_file = tmp_path / "server.log"
+    root = configure_logging(level="INFO", fmt="json", file=str(log_file))
+    try:
+        logger = get_logger("mcp_project.ecuc_creator.ecuc_bulk")
+        assert logger.name == "paramdef_search.ecuc_creator.ecuc_bulk"
+        assert get_logger("ecuc_creator.ecuc_bulk") is logger
+
+        logger.debug("Dropped %s", "message")
+        logger.info("Created %d containers", 3, extra={"tool": "bulk"})
+    finally:
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+            handler.close()
+
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "paramdef_search.ecuc_creator.ecuc_bulk"
+    assert entry["msg"] == "Created 3 containers"
+    assert entry["tool"] == "bulk"
+
+
+def test_disabled_level_skips_formatting():
+    from mcp_project.utils.logging_utils import configure_logging, get_logger
+
+    class Expensive:
+        formatted = False
+
+        def __str__(self):
+            Expensive.formatted = True
+            return "expensive"
+
+    root = configure_logging(level="WARNING")
+    try:
+        logger = get_logger("tests")
+        assert not logger.isEnabledFor(logging.DEBUG)
+        logger.debug("Value %s", Expensive())
+        assert not Expensive.formatted
+    finally:
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+            handler.close()
@@ -0,0 +1,49 @@
+"""
+@author: m4tice
+"""
+
+
+def test_histogram_percentiles_within_bucket_precision():
+    from mcp_project.utils.metrics import Histogram
+
+    h = Histogram()
+    for value in range(1, 10001):
+        h.record(value)
+
+    assert h.count == 10000
+    assert h.min == 1 and h.max == 10000
+    for p, expected in [(50, 5000), (90, 9000), (99, 9900)]:
+        assert abs(h.percentile(p) - expected) / expected < 0.02
+
+
+def test_registry_snapshot_and_prometheus_dump(tmp_path):
+    from mcp_project.utils.metrics import MetricsRegistry
+
+    registry = MetricsRegistry()
+    registry.increment("files_parsed", 3)
+    for value in (100, 200, 300):
+        registry.observe("tool.get_available_containers", value)
+
+    snapshot = registry.snapshot()
+    assert snapshot["counters"] == {"files_parsed": 3}
+    assert snapshot["histograms"]["tool.get_available_containers"]["count"] == 3
+
+    text = registry.dump_prometheus(tmp_path / "metrics.prom").read_text()
+    assert "paramdef_files_parsed_total 3" in text
+    assert 'paramdef_tool_get_available_containers_seconds{quantile="0.5"} 0.000200' in text
+    assert "paramdef_tool_get_available_containers_seconds_count 3" in text
+
+
+def test_search_phases_are_recorded(paramdef_files, monkeypatch):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler import paramdef_utils
+
+    monkeypatch.setattr(paramdef_utils, "get_all_paramdef_files", lambda: paramdef_files)
+    METRICS.reset()
+    assert paramdef_utils.get_definition_path_rapidfuzz("ComIPduDirection")
+
+    snapshot = METRICS.snapshot()
+    assert snapshot["counters"]["files_parsed"] == len(paramdef_files)
+    assert snapshot["counters"]["candidates_scored"] > 0
+    for phase in ("phase.parse", "phase.key_extraction", "phase.fuzzy_scoring", "phase.find_path"):
+        assert snapshot["histograms"][phase]["count"] > 0
@@ -0,0 +1,50 @@
+"""
+@author: m4tice
+"""
+
+import json
+
+
+def test_batch_conversion_writes_outputs_and_manifest(paramdef_files, tmp_path):
+    from mcp_project.paramdef_handler.paramdef_arxml2json import convert_batch
+
+    out_dir = tmp_path / "json"
+    manifest = convert_batch([paramdef_files[0].parent], out_dir, workers=2)
+
+    assert manifest["summary"]["converted"] == len(paramdef_files)
+    assert manifest["summary"]["failed"] == 0
+    entry = manifest["files"][str(paramdef_files[0].resolve())]
+    assert entry["modules"] == ["Com"]
+    assert len(entry["sha256"]) == 64
+    assert "Com" in json.loads((out_dir / entry["output"]).read_text())
+    assert json.loads((out_dir / "manifest.json").read_text())["files"] == manifest["files"]
+
+
+def test_batch_conversion_skips_unchanged_inputs(paramdef_files, tmp_path):
+    from mcp_project.paramdef_handler.paramdef_arxml2json import convert_batch
+
+    out_dir = tmp_path / "json"
+    pattern = str(paramdef_files[0].parent / "*_EcucParamDef.arxml")
+    convert_batch([pattern], out_dir, workers=1)
+
+    again = convert_batch([pattern], out_dir, workers=1)
+    assert again["summary"]["converted"] == 0
+    assert again["summary"]["skipped"] == len(paramdef_files)
+
+    # Only the edited file is converted again
+    com = paramdef_files[0].read_text(encoding="utf-8")
+    paramdef_files[0].write_text(com.replace("Configuration of the Com module.", "Edited."), encoding="utf-8")
+    (paramdef_files[1].parent / "Broken_EcucParamDef.arxml").write_text("<AUTOSAR/>", encoding="utf-8")
+    third = convert_batch([pattern], out_dir, workers=2)
+    assert third["summary"] == {**third["summary"], "converted": 1, "skipped": len(paramdef_files) - 1, "failed": 1}
+    assert "error" in third["files"][str((paramdef_files[1].parent / "Broken_EcucParamDef.arxml").resolve())]
+
+
+def test_batch_conversion_reports_missing_inputs(paramdef_files, tmp_path):
+    import pytest
+    from mcp_project.paramdef_handler.paramdef_arxml2json import convert_batch
+
+    missing = tmp_path / "Missing_EcucParamDef.arxml"
+    with pytest.raises(FileNotFoundError, match="Missing_EcucParamDef.arxml"):
+        convert_batch([paramdef_files[0], missing], tmp_path / "json", workers=1)
+    assert not (tmp_path / "json").exists()
@@ -0,0 +1,73 @@
+"""
+@author: m4tice
+"""
+
+import pytest
+
+
+def test_complete_lists_children_with_types(paramdef_index):
+    from mcp_project.paramdef_handler.paramdef_completion import PathCompleter
+
+    completer = PathCompleter(paramdef_index)
+    result = completer.complete("com/comc")
+    assert result["parent"] == "Com"
+    assert [c["definition_path"] for c in result["completions"]] == ["Com/ComConfig"]
+
+    children = {c["name"]: c for c in completer.complete("Com/ComConfig/ComIPdu/")["completions"]}
+    assert children["ComIPduDirection"]["type"] == "PARAMETER"
+    assert children["ComIPduDirection"]["param_type"] == "ENUMERATION"
+    assert children["ComIPduHandleId"]["multiplicity"] == "0..1"
+    assert children["ComIPduSignalRef"]["type"] == "REFERENCE"
+    assert not children["ComIPduDirection"]["has_children"]
+    assert list(children) == sorted(children, key=str.casefold)
+
+    modules = completer.complete("")["completions"]
+    assert {c["name"] for c in modules} == {"Com", "PduR", "CanIf", "EcuC"}
+    assert all(c["type"] == "MODULE" and c["has_children"] for c in modules)
+
+    limited = completer.complete("Com/ComConfig/ComIPdu/", limit=2)
+    assert len(limited["completions"]) == 2 and limited["truncated"]
+
+
+def test_invalid_segments_are_reported_with_suggestions(paramdef_index):
+    from mcp_project.paramdef_handler.paramdef_completion import PathCompleter
+
+    completer = PathCompleter(paramdef_index)
+    result = completer.complete("Com/ComConfgi/ComI")
+    assert result["completions"] == []
+    assert result["invalid_segment"] == "ComConfgi"
+    assert result["parent"] == "Com"
+    assert "ComConfig" in result["suggestions"]
+
+    assert completer.check_path("/com/comconfig/comipdu") == {
+        "definition_path": "Com/ComConfig/ComIPdu", "valid": True
+    }
+    assert completer.check_path("Cmo")["invalid_segment"] == "Cmo"
+
+
+def test_configurator_validates_path_segments(paramdef_index):
+    from mcp_project.ecuc_creator.ecuc_configurator import ECUCConfigurator
+    from mcp_project.paramdef_handler.paramdef_completion import PathCompleter
+
+    configurator = ECUCConfigurator(PathCompleter(paramdef_index))
+    config = configurator.configure("/com/comconfig/comipdu", {"comipdu": "ESP_19"})
+    # Segments are checked case-insensitively, the output keeps the caller's spelling
+    assert config == {"ecuc": {"com": {"type": "com", "comconfig": {
+        "type": "comconfig", "ESP_19": {"type": "comipdu"}
+    }}}}
+
+    with pytest.raises(ValueError, match="ComIPud.*ComIPdu"):
+        configurator.configure("Com/ComConfig/ComIPud", {})
+
+    # Without a completer paths are taken as given
+    assert ECUCConfigurator().configure("a/b", {}) == {"ecuc": {"a": {"type": "a", "b": {"type": "b"}}}}
+
+
+def test_an_explicit_empty_index_is_kept():
+    from mcp_project.paramdef_handler.paramdef_index import ParamDefIndex
+    from mcp_project.paramdef_handler.paramdef_completion import PathCompleter
+
+    empty = ParamDefIndex([])
+    completer = PathCompleter(empty)
+    assert completer.index is empty and not empty._loaded
+    assert completer.complete("")["completions"] == []
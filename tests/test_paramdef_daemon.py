@@ -0,0 +1,80 @@
+"""
+@author: m4tice
+"""
+
+import socket
+import threading
+
+import pytest
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets unavailable")
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    from mcp_project.paramdef_handler.paramdef_daemon import start_daemon
+
+    server = start_daemon(str(tmp_path / "daemon.sock"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_daemon_answers_like_in_process_search_and_keeps_corpus(paramdef_files, daemon, monkeypatch):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler.paramdef_module_cache import get_module_cache
+    from mcp_project.paramdef_handler import paramdef_utils
+
+    monkeypatch.setattr(paramdef_utils, "get_all_paramdef_files", lambda: paramdef_files)
+    expected = {
+        "files": paramdef_utils.get_definition_files("PduRRoutingPath"),
+        "difflib": paramdef_utils.get_definition_path_difflib("ComSignal"),
+        "rapidfuzz": paramdef_utils.get_definition_path_rapidfuzz("ComIPduDirection"),
+    }
+
+    monkeypatch.setenv("PARAMDEF_DAEMON_SOCKET", daemon.socket_path)
+    get_module_cache().clear()
+    METRICS.reset()
+    for _ in range(2):
+        assert paramdef_utils.get_definition_files("PduRRoutingPath") == expected["files"]
+        assert paramdef_utils.get_definition_path_difflib("ComSignal") == expected["difflib"]
+        assert paramdef_utils.get_definition_path_rapidfuzz("ComIPduDirection") == expected["rapidfuzz"]
+
+    # Every file is converted once by the daemon, not once per query, and
+    # without going through the module cache
+    counters = METRICS.snapshot()["counters"]
+    assert counters["daemon_requests"] == 6
+    assert counters["daemon_corpus_loads"] == len(paramdef_files)
+    assert "files_parsed" not in counters
+    assert len(get_module_cache()) == 0
+    assert len(daemon.corpus) == len(paramdef_files)
+
+
+def test_client_falls_back_when_no_daemon_is_running(paramdef_files, tmp_path, monkeypatch):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler import paramdef_utils
+
+    monkeypatch.setattr(paramdef_utils, "get_all_paramdef_files", lambda: paramdef_files)
+    monkeypatch.setenv("PARAMDEF_DAEMON_SOCKET", str(tmp_path / "missing.sock"))
+    METRICS.reset()
+
+    result = paramdef_utils.get_definition_path_rapidfuzz("ComIPduDirection")
+    assert result[0]["definition_path"] == "Com/ComConfig/ComIPdu/ComIPduDirection"
+    assert "daemon_requests" not in METRICS.snapshot()["counters"]
+
+
+def test_second_daemon_on_same_socket_is_refused(daemon):
+    from mcp_project.paramdef_handler.paramdef_daemon import start_daemon
+
+    with pytest.raises(RuntimeError, match="already listening"):
+        start_daemon(daemon.socket_path)
+
+
+def test_daemon_client_is_opt_in(monkeypatch):
+    from mcp_project.paramdef_handler.paramdef_daemon import daemon_socket
+
+    monkeypatch.delenv("PARAMDEF_DAEMON_SOCKET")
+    assert daemon_socket() is None
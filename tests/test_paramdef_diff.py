@@ -0,0 +1,78 @@
+"""
+@author: m4tice
+"""
+
+
+def test_hash_ignores_definition_order():
+    from mcp_project.paramdef_handler.paramdef_diff import hash_tree
+
+    a = {"type": "CONTAINER", "X": {"type": "PARAMETER"}, "Y": {"type": "PARAMETER", "minValue": "0"}}
+    b = {"type": "CONTAINER", "Y": {"type": "PARAMETER", "minValue": "0"}, "X": {"type": "PARAMETER"}}
+    c = {"type": "CONTAINER", "X": {"type": "PARAMETER"}, "Y": {"type": "PARAMETER", "minValue": "1"}}
+    assert hash_tree(a).digest == hash_tree(b).digest
+    assert hash_tree(a).digest != hash_tree(c).digest
+
+
+def test_diff_reports_changes_by_definition_path(paramdef_files, tmp_path):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler.paramdef_diff import diff_paramdefs
+
+    old_dir = paramdef_files[0].parent
+    new_dir = tmp_path / "new"
+    new_dir.mkdir()
+    for paramdef in paramdef_files:
+        (new_dir / paramdef.name).write_text(paramdef.read_text(encoding="utf-8"), encoding="utf-8")
+
+    com = new_dir / paramdef_files[0].name
+    text = com.read_text(encoding="utf-8")
+    text = text.replace("<MAX>4095</MAX>", "<MAX>8191</MAX>")
+    text = text.replace("<SHORT-NAME>ComIPduCallout</SHORT-NAME>", "<SHORT-NAME>ComIPduTriggerCallout</SHORT-NAME>")
+    com.write_text(text, encoding="utf-8")
+    (new_dir / paramdef_files[1].name).unlink()
+
+    assert diff_paramdefs([old_dir], [old_dir])["summary"] == {"added": 0, "removed": 0, "changed": 0}
+
+    METRICS.reset()
+    diff = diff_paramdefs([old_dir], [new_dir])
+    removed_module = diff["removed"][-1]["definition_path"]
+    assert diff["removed"] == [
+        {"definition_path": "Com/ComConfig/ComIPdu/ComIPduCallout", "type": "PARAMETER"},
+        {"definition_path": removed_module, "type": "MODULE"},
+    ]
+    assert diff["added"] == [{"definition_path": "Com/ComConfig/ComIPdu/ComIPduTriggerCallout", "type": "PARAMETER"}]
+    assert diff["changed"] == [{
+        "definition_path": "Com/ComConfig/ComSignal/ComBitPosition",
+        "type": "PARAMETER",
+        "attributes": {"maxValue": {"old": "4095", "new": "8191"}},
+    }]
+    # Unchanged subtrees are not descended into
+    assert METRICS.snapshot()["counters"]["diff_subtrees_skipped"] >= len(paramdef_files) - 2
+
+
+def test_repeated_diffs_only_hash_changed_files(paramdef_files):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler.paramdef_diff import diff_paramdefs
+
+    directory = paramdef_files[0].parent
+    diff_paramdefs([directory], [paramdef_files[0]])
+
+    METRICS.reset()
+    assert diff_paramdefs([directory], [directory])["summary"] == {"added": 0, "removed": 0, "changed": 0}
+    assert METRICS.snapshot()["counters"]["diff_hash_cache_hits"] == 2 * len(paramdef_files)
+    assert "files_parsed" not in METRICS.snapshot()["counters"]
+
+    com = paramdef_files[0].read_text(encoding="utf-8")
+    paramdef_files[0].write_text(com.replace("<MAX>4095</MAX>", "<MAX>8191</MAX>"), encoding="utf-8")
+    METRICS.reset()
+    assert diff_paramdefs([directory], [directory])["summary"] == {"added": 0, "removed": 0, "changed": 0}
+    counters = METRICS.snapshot()["counters"]
+    assert counters["files_parsed"] == 1
+    assert counters["diff_hash_cache_hits"] == 2 * len(paramdef_files) - 1
+
+
+def test_diff_without_paramdef_files_fails(tmp_path):
+    import pytest
+    from mcp_project.paramdef_handler.paramdef_diff import diff_paramdefs
+
+    with pytest.raises(FileNotFoundError):
+        diff_paramdefs([tmp_path / "missing"], [tmp_path])
@@ -0,0 +1,70 @@
+"""
+@author: m4tice
+"""
+
+
+def test_workspace_index_and_derived_lookups_follow_file_changes(paramdef_files, monkeypatch):
+    from mcp_project.paramdef_handler import paramdef_utils, paramdef_index
+    from mcp_project.paramdef_handler.paramdef_index import get_paramdef_index
+    from mcp_project.paramdef_handler.paramdef_completion import get_path_completer
+    from mcp_project.paramdef_handler.paramdef_spelling import get_paramdef_speller
+    from mcp_project.paramdef_handler.paramdef_validator import get_paramdef_validator
+    from mcp_project.paramdef_handler.paramdef_values import get_value_lookup
+
+    discovered = [paramdef_files[0]]
+    monkeypatch.setattr(paramdef_utils, "get_all_paramdef_files", lambda: list(discovered))
+    monkeypatch.setattr(paramdef_index, "_default_index", None)
+    monkeypatch.setattr(paramdef_index, "_default_fingerprint", None)
+
+    first = get_paramdef_index()
+    assert first.modules() == ["Com"]
+    assert get_paramdef_index() is first
+    assert get_path_completer().complete("PduR")["completions"] == []
+
+    # A new file
+    discovered.append(paramdef_files[1])
+    second = get_paramdef_index()
+    assert second is not first
+    assert sorted(second.modules()) == ["Com", "PduR"]
+    for derived in (get_path_completer(), get_paramdef_speller(), get_paramdef_validator(), get_value_lookup()):
+        assert derived.index is second
+    assert get_path_completer().complete("PduR")["completions"]
+
+    # An edited file
+    com = paramdef_files[0].read_text(encoding="utf-8")
+    paramdef_files[0].write_text(com.replace("<SHORT-NAME>ComIPduDirection<", "<SHORT-NAME>ComIPduDir<"), encoding="utf-8")
+    third = get_paramdef_index()
+    assert third is not second
+    assert third.resolve("Com/ComConfig/ComIPdu/ComIPduDir") is not None
+    assert get_paramdef_validator().index is third
+
+
+def test_module_defined_in_two_files_keeps_the_first(paramdef_files):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler.paramdef_index import ParamDefIndex
+
+    copy = paramdef_files[0].with_name("Zz_Com_EcucParamDef.arxml")
+    copy.write_text(paramdef_files[0].read_text(encoding="utf-8"), encoding="utf-8")
+
+    METRICS.reset()
+    index = ParamDefIndex([copy, paramdef_files[0]])
+    assert index.modules() == ["Com"]
+    assert index.get_module("com")["file"] == str(paramdef_files[0])
+    assert index.resolve("Com/ComConfig")["file"] == str(paramdef_files[0])
+    assert METRICS.snapshot()["counters"]["module_collisions"] == 1
+
+
+def test_nodes_are_taken_from_the_module_cache(paramdef_index):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler.paramdef_module_cache import get_module_cache
+
+    resolved = paramdef_index.resolve("com/comconfig/comipdu")
+    assert resolved["type"] == "CONTAINER"
+    assert resolved["node"] is get_module_cache().get(resolved["file"])["Com"]["ComConfig"]["ComIPdu"]
+
+    # After eviction only the file being resolved is converted again
+    get_module_cache().clear()
+    METRICS.reset()
+    assert paramdef_index.resolve("Com/ComConfig/ComIPdu/ComIPduDirection")["node"]["type"] == "PARAMETER"
+    assert paramdef_index.get_module("pdur")["data"]["type"] == "MODULE"
+    assert METRICS.snapshot()["counters"]["files_parsed"] == 2
@@ -0,0 +1,74 @@
+"""
+@author: m4tice
+"""
+
+import random
+
+import pytest
+
+
+def test_difflib_scorer_equals_get_close_matches():
+    from difflib import get_close_matches
+    from mcp_project.paramdef_handler.paramdef_matcher import SCORERS
+
+    rng = random.Random(11)
+    for _ in range(500):
+        keys = ["".join(rng.choices("abcAB_", k=rng.randint(1, 15))) for _ in range(30)]
+        keyword = "".join(rng.choices("abcAB_", k=rng.randint(1, 12)))
+        cutoff = rng.choice([0.0, 0.5, 0.6, 0.75])
+        expected = get_close_matches(keyword, keys, n=5, cutoff=cutoff)
+        assert [key for key, _ in SCORERS["difflib"].match(keyword, keys, 5, cutoff * 100)] == expected
+
+
+def test_every_scorer_searches_the_same_corpus(paramdef_files):
+    from mcp_project.paramdef_handler.paramdef_matcher import SCORERS
+    from mcp_project.paramdef_handler.paramdef_utils import search_definition_paths
+
+    for scorer in SCORERS:
+        result = search_definition_paths("ComIPduDirection", scorer, paramdefs=paramdef_files)
+        assert result[0]["definition_path"] == "Com/ComConfig/ComIPdu/ComIPduDirection"
+        assert result[0]["similarity_score"] == pytest.approx(1.0)
+        scores = [r["similarity_score"] for r in result]
+        assert scores == sorted(scores, reverse=True)
+
+    # Per-call overrides
+    assert len(search_definition_paths("Com", "qratio", n=3, cutoff=0.0, paramdefs=paramdef_files)) == 3
+    strict = search_definition_paths("ComIPduDirection", "wratio", cutoff=0.99, paramdefs=paramdef_files)
+    assert [r["definition_path"] for r in strict] == ["Com/ComConfig/ComIPdu/ComIPduDirection"]
+
+    with pytest.raises(ValueError, match="Unknown scorer"):
+        search_definition_paths("Com", "soundex", paramdefs=paramdef_files)
+
+
+def test_benchmark_reports_accuracy_and_latency(paramdef_files):
+    from mcp_project.paramdef_handler.paramdef_benchmark import run_benchmark, format_results
+
+    queries = [
+        {"query": "ComIPduDirection", "expected": "Com/ComConfig/ComIPdu/ComIPduDirection"},
+        {"query": "PduRQueueDepth", "expected": "PduR/PduRRoutingTables/PduRRoutingPath/PduRQueueDepth"},
+        {"query": "NoSuchDefinitionAnywhere", "expected": "Com/ComGeneral"},
+    ]
+    functions = ["search_definition_paths[wratio]", "search_definition_paths[difflib]"]
+    results = run_benchmark(queries, paramdef_files, functions, repeat=1)
+
+    assert list(results) == functions
+    for result in results.values():
+        assert result["recall@1"] == pytest.approx(2 / 3)
+        assert result["mrr"] == pytest.approx(2 / 3)
+        assert 0 < result["p50_ms"] <= result["p99_ms"]
+    assert "search_definition_paths[wratio]" in format_results(results)
+
+
+@pytest.mark.parametrize("overrides, message", [
+    ({"n": 0}, "at least 1"),
+    ({"n": -1}, "at least 1"),
+    ({"cutoff": 1.5}, "between 0 and 1"),
+    ({"cutoff": -0.1}, "between 0 and 1"),
+])
+def test_invalid_overrides_are_rejected(paramdef_files, overrides, message):
+    from mcp_project.paramdef_handler.paramdef_matcher import SCORERS
+    from mcp_project.paramdef_handler.paramdef_utils import search_definition_paths
+
+    for scorer in SCORERS:
+        with pytest.raises(ValueError, match=message):
+            search_definition_paths("comipdudirection", scorer, paramdefs=paramdef_files, **overrides)
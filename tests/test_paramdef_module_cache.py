@@ -0,0 +1,102 @@
+"""
+@author: m4tice
+"""
+
+import os
+
+import pytest
+
+
+def _sizes(files):
+    from mcp_project.paramdef_handler.paramdef_arxml2json import convert_paramdef_to_json
+    from mcp_project.paramdef_handler.paramdef_module_cache import estimate_size
+
+    return [estimate_size(convert_paramdef_to_json(f)) for f in files]
+
+
+def test_hits_and_invalidation(paramdef_files):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler.paramdef_arxml2json import convert_paramdef_to_json
+    from mcp_project.paramdef_handler.paramdef_module_cache import ModuleCache
+
+    cache = ModuleCache(10 * 1024 * 1024)
+    METRICS.reset()
+    first = cache.get(paramdef_files[0])
+    assert first == convert_paramdef_to_json(paramdef_files[0])
+    assert cache.get(paramdef_files[0]) is first
+    assert cache.size == _sizes(paramdef_files[:1])[0]
+
+    # An edited file is converted again
+    stat = os.stat(paramdef_files[0])
+    os.utime(paramdef_files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.get(paramdef_files[0]) is not first
+
+    counters = METRICS.snapshot()["counters"]
+    assert counters["module_cache_hits"] == 1
+    assert counters["module_cache_misses"] == 2
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_budget_is_respected_and_evicted_files_reload_from_snapshot(paramdef_files, tmp_path, policy):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler.paramdef_module_cache import ModuleCache
+
+    budget = sum(sorted(_sizes(paramdef_files))[-2:])
+    cache = ModuleCache(budget, policy, snapshot_dir=tmp_path / "snapshots")
+    METRICS.reset()
+    for paramdef in paramdef_files * 2:
+        cache.get(paramdef)
+        assert cache.size <= budget
+
+    counters = METRICS.snapshot()["counters"]
+    assert counters["module_cache_evictions"] > 0
+    # Every ARXML is parsed once; reloads after eviction read the snapshot
+    assert counters["files_parsed"] == len(paramdef_files)
+    assert counters["module_cache_snapshot_loads"] > 0
+    assert METRICS.snapshot()["gauges"]["module_cache_bytes"] == cache.size
+
+
+def test_lfu_keeps_hot_modules_resident(paramdef_files):
+    from mcp_project.paramdef_handler.paramdef_module_cache import ModuleCache
+
+    hot, *cold = paramdef_files
+    sizes = _sizes(paramdef_files)
+    cache = ModuleCache(sizes[0] + max(sizes[1:]), "lfu")
+    for _ in range(3):
+        cache.get(hot)
+    for paramdef in cold * 2:
+        cache.get(paramdef)
+        assert hot in cache
+
+
+def test_pinned_modules_are_never_evicted(paramdef_files):
+    from mcp_project.paramdef_handler.paramdef_module_cache import ModuleCache
+
+    cache = ModuleCache(1, "lru", pinned=("Com", "PduR"))
+    for paramdef in paramdef_files:
+        cache.get(paramdef)
+    resident = [p for p in paramdef_files if p in cache]
+    assert [p.name.split("_")[0] for p in resident] == ["Com", "PduR"]
+
+    with pytest.raises(ValueError, match="eviction policy"):
+        ModuleCache(1, "fifo")
+
+
+def test_snapshots_of_changed_files_are_pruned(paramdef_files, tmp_path):
+    from mcp_project.paramdef_handler.paramdef_module_cache import ModuleCache
+
+    snapshots = tmp_path / "snapshots"
+    cache = ModuleCache(1 << 30, snapshot_dir=snapshots)
+    for paramdef in paramdef_files:
+        cache.get(paramdef)
+    before = {p.name for p in snapshots.iterdir()}
+    assert len(before) == len(paramdef_files)
+
+    com = paramdef_files[0].read_text(encoding="utf-8")
+    paramdef_files[0].write_text(com.replace("Configuration of the Com module.", "Edited."), encoding="utf-8")
+    assert cache.get(paramdef_files[0])["Com"]["description"] == "Edited."
+
+    after = {p.name for p in snapshots.iterdir()}
+    assert len(after) == len(paramdef_files)
+    assert len(after - before) == 1
@@ -0,0 +1,69 @@
+"""
+@author: m4tice
+"""
+
+import random
+import string
+
+import pytest
+
+
+def _corpus(rng, files=5, keys=400):
+    alphabet = string.ascii_letters[:8]
+    corpus = []
+    for i in range(files):
+        file_keys = sorted({"".join(rng.choices(alphabet, k=rng.randint(3, 30))) for _ in range(keys)})
+        corpus.append((f"file{i}.arxml", file_keys, lambda key: key))
+    return corpus
+
+
+@pytest.mark.parametrize("scorer", ["wratio", "token_set", "qratio", "jaro_winkler"])
+def test_parallel_scoring_equals_sequential(scorer):
+    from mcp_project.paramdef_handler.paramdef_matcher import match
+
+    rng = random.Random(13)
+    files = _corpus(rng)
+    for _ in range(20):
+        keyword = "".join(rng.choices(string.ascii_letters[:8], k=rng.randint(3, 20)))
+        for n, cutoff in ((10, None), (3, 0.0), (None, 0.8)):
+            sequential = match(keyword, files, lambda lookup, key: key, scorer, n=n, cutoff=cutoff, workers=1)
+            parallel = match(keyword, files, lambda lookup, key: key, scorer, n=n, cutoff=cutoff, workers=2)
+            assert parallel == sequential
+
+
+def test_large_corpora_switch_to_parallel_scoring(monkeypatch):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler import paramdef_matcher
+    from mcp_project.paramdef_handler.paramdef_settings import MATCHER_PARALLEL_MIN_KEYS
+
+    rng = random.Random(17)
+    alphabet = string.ascii_letters[:8]
+    keys = [f"{''.join(rng.choices(alphabet, k=rng.randint(3, 20)))}{i}" for i in range(MATCHER_PARALLEL_MIN_KEYS)]
+    half = len(keys) // 2
+    monkeypatch.setenv("PARAMDEF_MATCHER_WORKERS", "2")
+
+    # One key below the default threshold stays sequential, at the threshold it goes parallel
+    for total, parallel in ((MATCHER_PARALLEL_MIN_KEYS - 1, 0), (MATCHER_PARALLEL_MIN_KEYS, 1)):
+        files = [("a.arxml", keys[:half], lambda key: key), ("b.arxml", keys[half:total], lambda key: key)]
+        METRICS.reset()
+        result = paramdef_matcher.match("abcdef", files, lambda lookup, key: key)
+        assert METRICS.snapshot()["counters"].get("parallel_searches", 0) == parallel
+        assert result == paramdef_matcher.match("abcdef", files, lambda lookup, key: key, workers=1)
+        assert result
+
+    # difflib has no parallel implementation
+    METRICS.reset()
+    paramdef_matcher.match("abcdef", files, lambda lookup, key: key, "difflib")
+    assert "parallel_searches" not in METRICS.snapshot()["counters"]
+
+
+def test_scaling_benchmark_reports_every_thread_count(paramdef_files):
+    from mcp_project.paramdef_handler.paramdef_benchmark import scaling_benchmark, format_scaling
+
+    queries = [{"query": "ComIPduDirection", "expected": "Com/ComConfig/ComIPdu/ComIPduDirection"}]
+    results = scaling_benchmark(queries, paramdef_files, workers=(1, 2), replicate=3, repeat=1)
+
+    assert list(results) == [1, 2]
+    assert results[1]["speedup"] == pytest.approx(1.0)
+    assert results[1]["keys"] == results[2]["keys"] > 0
+    assert "speedup" in format_scaling(results)
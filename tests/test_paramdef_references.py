@@ -0,0 +1,36 @@
+"""
+@author: m4tice
+"""
+
+
+def test_converter_keeps_reference_definitions(paramdef_files):
+    from mcp_project.paramdef_handler.paramdef_arxml2json import convert_paramdef_to_json
+
+    com = convert_paramdef_to_json(paramdef_files[0])["Com"]
+    ref = com["ComConfig"]["ComIPdu"]["ComPduIdRef"]
+    assert ref["type"] == "REFERENCE"
+    assert ref["ref_type"] == "REFERENCE"
+    assert ref["destinations"] == ["/AUTOSAR/EcucDefs/EcuC/EcucConfigSet/EcucPduCollection/Pdu"]
+
+    foreign = com["ComConfig"]["ComSignal"]["ComSystemTemplateSystemSignalRef"]
+    assert foreign["ref_type"] == "FOREIGN_REFERENCE"
+    assert foreign["destinationType"] == "I-SIGNAL-TO-I-PDU-MAPPING"
+
+
+def test_reference_graph_forward_and_backward(paramdef_index):
+    forward = paramdef_index.references_from("com/comconfig/comipdu/compduidref")
+    assert forward["reference"] == "Com/ComConfig/ComIPdu/ComPduIdRef"
+    assert [t["definition_path"] for t in forward["targets"]] == ["EcuC/EcucConfigSet/EcucPduCollection/Pdu"]
+
+    choice = paramdef_index.references_from("PduR/PduRRoutingTables/PduRRoutingPath/PduRDestPduRef")
+    assert choice["ref_type"] == "CHOICE_REFERENCE"
+    assert len(choice["targets"]) == 2
+
+    referrers = {r["reference"] for r in paramdef_index.references_to("EcuC/EcucConfigSet/EcucPduCollection/Pdu")}
+    assert referrers == {
+        "Com/ComConfig/ComIPdu/ComPduIdRef",
+        "PduR/PduRRoutingTables/PduRRoutingPath/PduRSrcPduRef",
+        "PduR/PduRRoutingTables/PduRRoutingPath/PduRDestPduRef",
+        "CanIf/CanIfInitCfg/CanIfRxPduCfg/CanIfRxPduRef",
+    }
+    assert paramdef_index.references_from("Com/ComConfig/ComIPdu") is None
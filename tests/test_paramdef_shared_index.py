@@ -0,0 +1,102 @@
+"""
+@author: m4tice
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_key_paths_match_find_path(paramdef_files):
+    from mcp_project.utils.generic_utils import get_keys
+    from mcp_project.paramdef_handler.paramdef_arxml2json import convert_paramdef_to_json
+    from mcp_project.paramdef_handler.paramdef_utils import find_path
+    from mcp_project.paramdef_handler.paramdef_shared_index import key_paths
+
+    data = convert_paramdef_to_json(paramdef_files[0])
+    paths = key_paths(data)
+    assert set(paths) == get_keys(data)
+    for key, path in paths.items():
+        assert path == "/".join(find_path(data, key))
+
+
+def test_search_through_shared_index_matches_in_process_search(paramdef_files, tmp_path, monkeypatch):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler import paramdef_utils
+
+    monkeypatch.setattr(paramdef_utils, "get_all_paramdef_files", lambda: paramdef_files)
+    expected = paramdef_utils.get_definition_path_rapidfuzz("ComIPduDirection")
+    expected_difflib = paramdef_utils.get_definition_path_difflib("PduRRoutingPath")
+
+    monkeypatch.setenv("PARAMDEF_SHARED_INDEX_DIR", str(tmp_path / "shared"))
+    METRICS.reset()
+    assert paramdef_utils.get_definition_path_rapidfuzz("ComIPduDirection") == expected
+    assert paramdef_utils.get_definition_path_difflib("PduRRoutingPath") == expected_difflib
+
+    # The index is published from the module cache, without converting the files again
+    counters = METRICS.snapshot()["counters"]
+    assert "files_parsed" not in counters
+    assert counters["module_cache_hits"] >= len(paramdef_files)
+    assert counters["shared_index_builds"] == 1
+    assert len(list((tmp_path / "shared").glob("*.idx"))) == 1
+
+
+def test_other_process_attaches_without_rebuilding(paramdef_files, tmp_path):
+    from mcp_project.paramdef_handler.paramdef_shared_index import get_shared_path_index
+
+    directory = tmp_path / "shared"
+    index = get_shared_path_index(paramdef_files, directory)
+    com = index.files.index(str(paramdef_files[0]))
+    assert index.find_path(com, "ComIPduDirection") == "Com/ComConfig/ComIPdu/ComIPduDirection"
+    assert index.find_path(com, "NotAKey") is None
+
+    script = (
+        "import sys\n"
+        "from mcp_project.utils.metrics import METRICS\n"
+        "from mcp_project.paramdef_handler.paramdef_shared_index import get_shared_path_index\n"
+        "index = get_shared_path_index(sys.argv[2:], sys.argv[1])\n"
+        "print(index.find_path(0, 'ComIPduDirection'))\n"
+        "print(METRICS.snapshot()['counters'].get('shared_index_builds', 0))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    proc = subprocess.run(
+        [sys.executable, "-c", script, str(directory), *map(str, paramdef_files)],
+        env=env, capture_output=True, text=True, timeout=60
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.split() == ["Com/ComConfig/ComIPdu/ComIPduDirection", "0"]
+
+
+def test_keys_are_read_from_the_mapped_file_with_their_lengths(paramdef_files, tmp_path):
+    from mcp_project.paramdef_handler.paramdef_module_cache import get_module_cache
+    from mcp_project.paramdef_handler.paramdef_shared_index import get_shared_path_index, key_paths
+
+    index = get_shared_path_index(paramdef_files, tmp_path / "shared")
+    for file_idx, paramdef in enumerate(index.files):
+        keys = index.keys(file_idx)
+        expected = sorted(key_paths(get_module_cache().get(paramdef)))
+        assert list(keys) == expected
+        assert len(keys) == len(expected)
+        assert keys[0] == expected[0] and keys[-1] == expected[-1] and keys[1:3] == expected[1:3]
+        assert keys.lengths == {len(key) for key in expected}
+
+
+def test_replaced_index_is_closed_once_no_query_holds_it(paramdef_files, tmp_path):
+    from mcp_project.paramdef_handler.paramdef_shared_index import get_shared_path_index, shared_path_index
+
+    directory = tmp_path / "shared"
+    with shared_path_index(paramdef_files, directory) as old:
+        new = get_shared_path_index(paramdef_files[:2], directory)
+        assert new is not old
+        # Still usable by the query holding it
+        assert not old.closed
+        assert old.find_path(old.files.index(str(paramdef_files[0])), "ComIPdu") == "Com/ComConfig/ComIPdu"
+    assert old.closed
+    assert not new.closed
+
+    # An index nobody holds is closed when it is replaced
+    get_shared_path_index(paramdef_files, directory)
+    assert new.closed
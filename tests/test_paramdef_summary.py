@@ -0,0 +1,74 @@
+"""
+@author: m4tice
+"""
+
+
+def test_module_summary_counts_and_containers(paramdef_files):
+    from mcp_project.paramdef_handler.paramdef_summary import summarize_file
+
+    summary = summarize_file(paramdef_files[0])["Com"]
+
+    assert summary["counts"] == {"CONTAINER": 4, "PARAMETER": 10, "REFERENCE": 3}
+    assert summary["parameter_types"]["ENUMERATION"] == 3
+    assert summary["reference_types"] == {"FOREIGN_REFERENCE": 1, "REFERENCE": 2}
+    assert summary["max_depth"] == 3
+    assert summary["enumerations"]["Com/ComConfig/ComSignal/ComTransferProperty"] == 3
+
+    ipdu = next(c for c in summary["containers"] if c["path"] == "Com/ComConfig/ComIPdu")
+    assert ipdu == {
+        "path": "Com/ComConfig/ComIPdu",
+        "multiplicity": "0..*",
+        "parameters": 4,
+        "references": 2,
+        "sub_containers": 0,
+    }
+    assert summary["multiplicities"]["CONTAINER"] == {"0..*": 2, "1": 2}
+
+
+def test_summaries_are_persisted_and_served_without_conversion(paramdef_files, tmp_path):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler.paramdef_summary import ParamDefSummaryCache, corpus_summary
+
+    cache_dir = tmp_path / "summaries"
+    METRICS.reset()
+    first = ParamDefSummaryCache(cache_dir).summaries(paramdef_files)
+    assert sorted(first) == ["CanIf", "Com", "EcuC", "PduR"]
+    assert METRICS.snapshot()["counters"]["files_parsed"] == len(paramdef_files)
+
+    # A new process (fresh cache object) reads the persisted summaries
+    METRICS.reset()
+    second = ParamDefSummaryCache(cache_dir).summaries(paramdef_files)
+    assert second == first
+    counters = METRICS.snapshot()["counters"]
+    assert "files_parsed" not in counters
+    assert counters["summary_cache_hits"] == len(paramdef_files)
+
+    overview = corpus_summary(second)
+    assert [m["module"] for m in overview["modules"]] == ["CanIf", "Com", "EcuC", "PduR"]
+    assert overview["modules"][1]["enumerations"] == 3
+
+
+def test_summaries_reuse_loaded_modules_and_replace_stale_files(paramdef_files, tmp_path):
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler.paramdef_module_cache import get_module_cache
+    from mcp_project.paramdef_handler.paramdef_summary import ParamDefSummaryCache
+
+    for paramdef in paramdef_files:
+        get_module_cache().get(paramdef)
+
+    cache_dir = tmp_path / "summaries"
+    cache = ParamDefSummaryCache(cache_dir)
+    METRICS.reset()
+    cache.summaries(paramdef_files)
+    assert "files_parsed" not in METRICS.snapshot()["counters"]
+    before = {p.name for p in cache_dir.iterdir()}
+    assert len(before) == len(paramdef_files)
+
+    com = paramdef_files[0].read_text(encoding="utf-8")
+    paramdef_files[0].write_text(com.replace("Configuration of the Com module.", "Edited."), encoding="utf-8")
+    assert cache.summaries(paramdef_files)["Com"]["description"] == "Edited."
+
+    after = {p.name for p in cache_dir.iterdir()}
+    assert len(after) == len(paramdef_files)
+    assert len(after - before) == 1
+    assert METRICS.snapshot()["counters"]["summary_cache_pruned"] == 1
@@ -0,0 +1,66 @@
+"""
+@author: m4tice
+"""
+
+import random
+import string
+
+
+def test_max_possible_score_bounds_wratio():
+    from rapidfuzz import fuzz
+    from mcp_project.paramdef_handler.paramdef_matcher import max_possible_score
+
+    rng = random.Random(7)
+    for _ in range(5000):
+        query = "".join(rng.choices(string.ascii_letters[:6], k=rng.randint(1, 20)))
+        key = "".join(rng.choices(string.ascii_letters[:6], k=rng.randint(1, 120)))
+        assert fuzz.WRatio(query, key) <= max_possible_score(len(query), [len(key)])
+    assert max_possible_score(10, []) == 0.0
+
+
+def test_top_k_matches_equal_full_sort(paramdef_files, close_matches_reference):
+    from mcp_project.paramdef_handler import paramdef_utils
+    from mcp_project.paramdef_handler.paramdef_matcher import match
+    from mcp_project.paramdef_handler.paramdef_settings import RAPIDFUZZ_NUMBER_OF_RESULTS, RAPIDFUZZ_CUTOFF
+
+    files = list(paramdef_utils._iter_file_keys(paramdef_files))
+    for keyword in ["ComIPduDirection", "pdur", "RoutingPath", "CanIfRxPduDlc", "Bit", "zzz"]:
+        reference = []
+        for file_idx, (paramdef, keys, _) in enumerate(files):
+            close = close_matches_reference(
+                keyword, keys, n=RAPIDFUZZ_NUMBER_OF_RESULTS, cutoff=RAPIDFUZZ_CUTOFF
+            )
+            reference.extend((-score, match, file_idx, rank, paramdef) for rank, (match, score, _) in enumerate(close))
+        for k in (1, 3, 10):
+            expected = [(-s, match, paramdef) for s, match, _, _, paramdef in sorted(reference)[:k]]
+            result = match(keyword, paramdef_utils._iter_file_keys(paramdef_files), lambda lookup, m: m, n=k)
+            assert result == expected
+
+
+def test_files_that_cannot_beat_the_kth_score_are_not_scored():
+    from mcp_project.utils.metrics import METRICS
+    from mcp_project.paramdef_handler.paramdef_matcher import match
+
+    corpus = {
+        "long.arxml": ["X" * 200],
+        "exact.arxml": ["ComIPduDirection", "ComIPdu"],
+    }
+
+    files = [(paramdef, keys, lambda key: key) for paramdef, keys in corpus.items()]
+
+    METRICS.reset()
+    result = match("ComIPduDirection", files, lambda lookup, m: m, n=1)
+    assert result == [(100.0, "ComIPduDirection", "exact.arxml")]
+    assert METRICS.snapshot()["counters"]["files_pruned"] == 1
+
+
+def test_key_lengths_are_computed_once_per_file(paramdef_files):
+    from mcp_project.paramdef_handler import paramdef_utils
+    from mcp_project.paramdef_handler.paramdef_matcher import FileKeys, key_lengths
+
+    first = list(paramdef_utils._iter_file_keys(paramdef_files))
+    again = list(paramdef_utils._iter_file_keys(paramdef_files))
+    for (_, keys, _), (_, same_keys, _) in zip(first, again):
+        assert isinstance(keys, FileKeys) and same_keys is keys
+        assert key_lengths(keys) is keys.lengths == {len(key) for key in keys}
+    assert key_lengths(["ab", "abc"]) == {2, 3}
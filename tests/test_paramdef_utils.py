@@ -49,11 +49,11 @@ def test_get_definition_path_rapidfuzz():
     assert strip_result(result_3) is None
 
 # TESTS
-def test_get_close_matches_rapidfuzz():
+def test_get_close_matches_rapidfuzz(close_matches_reference):
     """
     @author: m4tice
     """
-    from mcp_project.paramdef_handler.paramdef_utils import get_close_matches_rapidfuzz
+    get_close_matches_rapidfuzz = close_matches_reference
 
 
     def test_get_close_matches_rapidfuzz_exact_match_and_types():
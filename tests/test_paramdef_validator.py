@@ -0,0 +1,79 @@
+"""
+@author: m4tice
+"""
+
+import pytest
+
+
+@pytest.fixture
+def validator(paramdef_index):
+    from mcp_project.paramdef_handler.paramdef_validator import ParamDefValidator
+    return ParamDefValidator(paramdef_index)
+
+
+def test_valid_parameters_are_canonicalized_and_coerced(validator):
+    result = validator.validate("com/comconfig/comipdu", {
+        "comipdudirection": "receive",
+        "comipdusignalprocessing": "immediate",
+        "ComPduIdRef": "/EcuC/EcucConfigSet/EcucPduCollection/Pdu_0",
+        "ComIPduHandleId": "0x10",
+        "ComIPduCallout": "Com_Callout_Esp",
+    })
+    assert result["errors"] == []
+    assert result["definition_path"] == "Com/ComConfig/ComIPdu"
+    assert result["parameters"] == {
+        "ComIPduDirection": "RECEIVE",
+        "ComIPduSignalProcessing": "IMMEDIATE",
+        "ComPduIdRef": "/EcuC/EcucConfigSet/EcucPduCollection/Pdu_0",
+        "ComIPduHandleId": 16,
+        "ComIPduCallout": "Com_Callout_Esp",
+    }
+
+
+def test_type_range_and_literal_errors(validator):
+    result = validator.validate("Com/ComConfig/ComSignal", {
+        "ComBitPosition": 5000,
+        "ComBitSize": "eight",
+        "ComTimeout": "0.5",
+        "ComTransferProperty": "TRIGERED",
+    })
+    errors = {e["parameter"]: e for e in result["errors"]}
+    assert set(errors) == {"ComBitPosition", "ComBitSize", "ComTransferProperty"}
+    assert "maximum" in errors["ComBitPosition"]["error"]
+    assert errors["ComTransferProperty"]["suggestions"][0] == "TRIGGERED"
+
+
+def test_unknown_parameter_gets_fuzzy_suggestions(validator):
+    result = validator.validate("Com/ComConfig/ComIPdu", {"ComIPduDirektion": "SEND"})
+    assert result["errors"][0]["error"] == "Unknown parameter"
+    assert result["errors"][0]["suggestions"][0] == "ComIPduDirection"
+
+
+def test_boolean_and_path_errors(validator):
+    assert validator.validate("PduR/PduRGeneral", {"PduRDevErrorDetect": "TRUE"})["parameters"] == {
+        "PduRDevErrorDetect": True
+    }
+    assert validator.validate("PduR/NoSuchContainer", {})["errors"][0]["error"] == "Unknown definition path"
+    assert "not a CONTAINER" in validator.validate("PduR/PduRGeneral/PduRDevErrorDetect", {})["errors"][0]["error"]
+
+
+def test_container_validators_are_cached(validator):
+    first = validator.container_validator("com/comconfig/comipdu")
+    assert validator.container_validator("Com/ComConfig/ComIPdu") is first
+
+
+def test_an_explicit_empty_index_is_kept_and_not_loaded(tmp_path):
+    from mcp_project.paramdef_handler.paramdef_index import ParamDefIndex
+    from mcp_project.paramdef_handler.paramdef_validator import ParamDefValidator
+
+    empty = ParamDefIndex([])
+    assert ParamDefValidator(empty).index is empty
+    assert not empty._loaded
+
+
+def test_missing_required_parameters_are_reported(validator):
+    result = validator.validate("Com/ComConfig/ComIPdu", {"ComIPduDirection": "SEND"})
+    missing = {e["parameter"] for e in result["errors"] if e["error"] == "Missing required parameter"}
+    # Optional (0..1, 0..*) parameters and parameters with a default value are not required
+    assert missing == {"ComIPduSignalProcessing", "ComPduIdRef"}
+    assert all(e["path"] == "Com/ComConfig/ComIPdu" for e in result["errors"])
@@ -0,0 +1,44 @@
+"""
+@author: m4tice
+"""
+
+
+def test_value_index_is_built_during_ingestion(paramdef_index):
+    from mcp_project.paramdef_handler.paramdef_index import value_key
+
+    entries = paramdef_index.parameters_with_value("immediate")
+    assert entries == [{
+        "definition_path": "Com/ComConfig/ComIPdu/ComIPduSignalProcessing",
+        "kind": "literal",
+        "value": "IMMEDIATE",
+    }]
+    defaults = paramdef_index.parameters_with_value("FALSE")
+    assert defaults and all(e["kind"] == "default" for e in defaults)
+    assert value_key(" 1 ", "BOOLEAN") == "true"
+    assert paramdef_index.parameters_with_value("NO_SUCH_LITERAL") == []
+
+
+def test_find_ranks_parameters_accepting_every_value(paramdef_index):
+    from mcp_project.paramdef_handler.paramdef_values import ValueLookup
+
+    lookup = ValueLookup(paramdef_index)
+    result = lookup.find(["Immediate", "DEFERED"])
+    best = result["parameters"][0]
+    assert best["name"] == "ComIPduSignalProcessing"
+    assert best["matched_values"]["Immediate"]["value"] == "IMMEDIATE"
+    assert best["matched_values"]["DEFERED"]["value"] == "DEFERRED"
+    assert 0.9 < best["score"] < 1.0
+
+    # A single value is accepted as well
+    assert lookup.find("RECEIVE")["parameters"][0]["name"] == "ComIPduDirection"
+    assert lookup.find("completely unrelated")["parameters"] == []
+
+
+def test_an_explicit_empty_index_is_kept():
+    from mcp_project.paramdef_handler.paramdef_index import ParamDefIndex
+    from mcp_project.paramdef_handler.paramdef_values import ValueLookup
+
+    empty = ParamDefIndex([])
+    lookup = ValueLookup(empty)
+    assert lookup._index is empty and not empty._loaded
+    assert lookup.find("IMMEDIATE")["parameters"] == []
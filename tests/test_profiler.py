@@ -0,0 +1,45 @@
+"""
+@author: m4tice
+"""
+
+import pstats
+
+
+def _work(n):
+    return sum(i * i for i in range(n))
+
+
+def test_unprofiled_calls_return_plain_result():
+    from mcp_project.utils.profiler import profiled
+
+    assert profiled("work")(_work)(10) == 285
+
+
+def test_profile_next_call_writes_pstats_once(tmp_path, monkeypatch):
+    from mcp_project.utils import profiler
+
+    monkeypatch.setattr(profiler, "_output_dir", tmp_path)
+    work = profiler.profiled("work")(_work)
+
+    profiler.profile_next_call("work")
+    result = work(1000)
+    assert result["result"] == _work(1000)
+    assert pstats.Stats(result["profile"]).total_calls > 0
+
+    # Armed for a single call only
+    assert work(10) == 285
+    assert profiler._active is False
+
+
+def test_sampling_mode_writes_collapsed_stacks(tmp_path, monkeypatch):
+    from mcp_project.utils import profiler
+
+    monkeypatch.setattr(profiler, "_output_dir", tmp_path)
+    monkeypatch.setattr(profiler, "_mode", profiler.SAMPLE)
+    work = profiler.profiled("work")(_work)
+
+    profiler.profile_next_call("all")
+    result = work(2_000_000)
+    lines = open(result["profile"]).read().splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("_work" in line for line in lines)
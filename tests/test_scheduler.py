@@ -0,0 +1,106 @@
+"""
+@author: m4tice
+"""
+
+import threading
+import time
+
+import pytest
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+def test_cheap_requests_run_before_queued_heavy_ones():
+    from mcp_project.utils.metrics import MetricsRegistry
+    from mcp_project.utils.scheduler import RequestScheduler, CHEAP, HEAVY
+
+    metrics = MetricsRegistry()
+    scheduler = RequestScheduler(max_concurrency=1, max_queue=10, queue_timeout=5, metrics=metrics)
+    order = []
+    gate = threading.Event()
+
+    def blocker():
+        with scheduler.slot(HEAVY):
+            gate.wait()
+
+    def request(name, priority):
+        with scheduler.slot(priority):
+            order.append(name)
+
+    threads = [threading.Thread(target=blocker)]
+    threads[0].start()
+    _wait_until(lambda: scheduler.running == 1)
+
+    for name, priority in [("heavy-1", HEAVY), ("heavy-2", HEAVY), ("cheap", CHEAP)]:
+        thread = threading.Thread(target=request, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+        _wait_until(lambda n=len(threads) - 1: scheduler.queued == n)
+
+    assert metrics.snapshot()["gauges"]["scheduler.queue_depth"] == 3
+    gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert order == ["cheap", "heavy-1", "heavy-2"]
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["scheduler.admitted"] == 4
+    assert snapshot["gauges"] == {"scheduler.queue_depth": 0, "scheduler.running": 0}
+    assert snapshot["histograms"]["scheduler.queue_wait"]["count"] == 3
+
+
+def test_full_queue_and_queue_timeout_fail_fast():
+    from mcp_project.utils.metrics import MetricsRegistry
+    from mcp_project.utils.scheduler import RequestScheduler, SchedulerOverloaded, scheduled
+
+    metrics = MetricsRegistry()
+    scheduler = RequestScheduler(max_concurrency=1, max_queue=1, queue_timeout=0.05, metrics=metrics)
+
+    @scheduled(scheduler=scheduler)
+    def tool():
+        return "done"
+
+    with scheduler.slot():
+        # One waiter fits in the queue and times out; the next is rejected at once
+        waiter_error = []
+        waiter = threading.Thread(target=lambda: waiter_error.append(pytest.raises(SchedulerOverloaded, tool)))
+        waiter.start()
+        _wait_until(lambda: scheduler.queued == 1)
+        with pytest.raises(SchedulerOverloaded, match="overloaded"):
+            tool()
+        waiter.join()
+
+    assert waiter_error
+    assert tool() == "done"
+    counters = metrics.snapshot()["counters"]
+    assert counters["scheduler.rejected"] == 1
+    assert counters["scheduler.timeouts"] == 1
+
+
+def test_cold_priority_applies_until_the_first_call_returns():
+    from mcp_project.utils.scheduler import RequestScheduler, scheduled, CHEAP, HEAVY
+
+    scheduler = RequestScheduler(max_concurrency=1)
+    priorities = []
+    slot = scheduler.slot
+    scheduler.slot = lambda priority: priorities.append(priority) or slot(priority)
+    calls = []
+
+    @scheduled(CHEAP, scheduler=scheduler, cold=HEAVY)
+    def lookup():
+        calls.append(None)
+        if len(calls) == 1:
+            raise RuntimeError("index build failed")
+        return "found"
+
+    with pytest.raises(RuntimeError):
+        lookup()
+    assert lookup() == "found"
+    assert lookup() == "found"
+    assert priorities == [HEAVY, HEAVY, CHEAP]
+    assert scheduler.running == 0
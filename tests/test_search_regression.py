@@ -0,0 +1,57 @@
+"""
+Search quality (and, with PARAMDEF_CHECK_LATENCY=1, latency) against the golden query set
+@author: m4tice
+"""
+
+import os
+import json
+from pathlib import Path
+
+import pytest
+
+DATA = Path(__file__).resolve().parent
+GOLDEN = DATA / "search_golden.json"
+BASELINE = DATA / "search_baseline.json"
+
+
+@pytest.fixture
+def search_results(paramdef_files):
+    from mcp_project.paramdef_handler.paramdef_benchmark import run_benchmark
+
+    return run_benchmark(json.loads(GOLDEN.read_text(encoding="utf-8")), paramdef_files)
+
+
+def test_golden_set_targets_existing_definitions(paramdef_index):
+    queries = json.loads(GOLDEN.read_text(encoding="utf-8"))
+    assert {q["kind"] for q in queries} >= {"exact", "cased", "misspelled", "abbreviated"}
+    for q in queries:
+        assert paramdef_index.resolve(q["expected"])["definition_path"] == q["expected"]
+
+
+def test_every_search_function_has_a_baseline(search_results):
+    assert set(json.loads(BASELINE.read_text(encoding="utf-8"))) == set(search_results)
+
+
+def test_no_quality_or_latency_regression(search_results):
+    from mcp_project.paramdef_handler.paramdef_benchmark import check_regressions, format_results
+
+    # Latency budgets depend on the machine that wrote the baseline
+    latency = os.environ.get("PARAMDEF_CHECK_LATENCY", "") not in ("", "0")
+    failures = check_regressions(search_results, json.loads(BASELINE.read_text(encoding="utf-8")), latency=latency)
+    assert not failures, "\n".join(failures) + "\n" + format_results(search_results)
+
+
+def test_check_regressions_flags_drops_and_slowdowns():
+    from mcp_project.paramdef_handler.paramdef_benchmark import check_regressions
+
+    baseline = {"search": {"recall@5": 0.9, "mrr": 0.8, "p95_ms": 5.0}}
+    ok = {"search": {"recall@1": 0.5, "recall@5": 0.89, "recall@10": 0.9, "mrr": 0.8,
+                     "p50_ms": 1.0, "p95_ms": 4.0, "p99_ms": 9.0}}
+    assert check_regressions(ok, baseline) == []
+
+    worse = dict(ok["search"], mrr=0.7, p95_ms=6.0)
+    failures = check_regressions({"search": worse}, baseline)
+    assert len(failures) == 1 and "mrr" in failures[0]
+    failures = check_regressions({"search": worse}, baseline, latency=True)
+    assert len(failures) == 2
+    assert "mrr" in failures[0] and "p95_ms" in failures[1]
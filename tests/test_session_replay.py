@@ -0,0 +1,104 @@
+"""
+@author: m4tice
+"""
+
+import asyncio
+
+import pytest
+
+fastmcp = pytest.importorskip("fastmcp")
+
+
+def _app(recorder=None):
+    app = fastmcp.FastMCP()
+    if recorder is not None:
+        app.add_middleware(recorder)
+
+    @app.tool()
+    def echo(text: str):
+        return {"text": text}
+
+    @app.tool()
+    def fail():
+        raise RuntimeError("boom")
+
+    return app
+
+
+def test_recorder_logs_every_tool_call(tmp_path):
+    from mcp_project.utils.session_recorder import SessionRecorder, read_session
+
+    path = tmp_path / "session.jsonl"
+    app = _app(SessionRecorder(path))
+
+    async def run():
+        async with fastmcp.Client(app) as client:
+            await client.call_tool("echo", {"text": "a"})
+            await client.call_tool("fail", {}, raise_on_error=False)
+            await client.call_tool("echo", {"text": "b"})
+
+    asyncio.run(run())
+    calls = read_session(path)
+    assert [(c["tool"], c["arguments"]) for c in calls] == [
+        ("echo", {"text": "a"}), ("fail", {}), ("echo", {"text": "b"})
+    ]
+    assert calls[0]["error"] is None and calls[1]["error"] is not None
+    assert all(c["duration_ms"] >= 0 for c in calls)
+
+
+def test_replay_reports_throughput_and_latencies():
+    from mcp_project.utils.session_replay import replay_session, compare_reports, format_report
+
+    calls = [
+        {"start": 100.0 + i * 0.01, "tool": "echo", "arguments": {"text": str(i)}, "duration_ms": 1.0, "error": None}
+        for i in range(20)
+    ] + [{"start": 100.5, "tool": "fail", "arguments": {}, "duration_ms": 2.0, "error": "RuntimeError"}]
+
+    report = replay_session(calls, _app(), concurrency=4, speedup=0)
+    assert report["calls"] == 21
+    assert report["errors"] == 1
+    assert report["tools"]["echo"]["calls"] == 20
+    assert report["tools"]["echo"]["recorded"]["p50_ms"] == 1.0
+    assert report["throughput_per_s"] > 0
+    latency = report["latency"]
+    assert 0 < latency["p50_ms"] <= latency["p95_ms"] <= latency["p99_ms"] <= latency["max_ms"]
+    assert "echo" in format_report(report)
+
+    # Recorded gaps are kept at speed-up 1 (0.5 s here)
+    paced = replay_session(calls, _app(), concurrency=4, speedup=1.0)
+    assert paced["wall_s"] >= 0.45
+
+    comparison = compare_reports(report, paced)
+    assert set(comparison["tools"]) == {"echo", "fail"}
+    assert comparison["throughput_per_s"] < 1
+
+
+def test_replay_does_not_touch_the_ecuc_configuration(tmp_path, monkeypatch):
+    from mcp_project.ecuc_creator.ecuc_settings import ECUC_CONFIG_FILE, ECUC_OUTPUT_DIR
+    from mcp_project.utils.session_replay import replay_session, load_server
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PARAMDEF_RECORD_FILE", str(tmp_path / "replayed.jsonl"))
+    calls = [
+        {"start": 1.0, "tool": "create_ecuc_configuration",
+         "arguments": {"path": "Com/ComConfig/ComIPdu", "names": {"comipdu": "ESP_19"}}, "duration_ms": 1.0},
+        {"start": 1.1, "tool": "create_ecuc_container_with_parameters",
+         "arguments": {"path": "Com/ComConfig/ComIPdu", "names": {"comipdu": "ESP_20"}}, "duration_ms": 1.0},
+        {"start": 1.2, "tool": "create_ecuc_containers_bulk",
+         "arguments": {"entries": [{"path": "Com/ComConfig/ComIPdu", "names": {"comipdu": "ESP_21"}}]},
+         "duration_ms": 1.0},
+        {"start": 1.3, "tool": "compact_ecuc_configuration", "arguments": {}, "duration_ms": 1.0},
+    ]
+    kept = tmp_path / "replay_out"
+    report = replay_session(calls, speedup=0, output_dir=kept)
+
+    assert report["errors"] == 0
+    assert not (tmp_path / ECUC_CONFIG_FILE).exists()
+    assert not (tmp_path / ECUC_OUTPUT_DIR).exists()
+    assert not (tmp_path / "replayed.jsonl").exists()
+    assert (kept / "ecuc_config.json").exists()
+
+    # The server is restored afterwards
+    server = load_server()
+    assert server.ECUC_OUTPUT_DIR == ECUC_OUTPUT_DIR
+    assert str(server.ecuc_store._out_path) == str(ECUC_CONFIG_FILE)
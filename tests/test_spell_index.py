@@ -0,0 +1,69 @@
+"""
+@author: m4tice
+"""
+
+import random
+
+
+def _mutate(rng, word, alphabet, edits):
+    chars = list(word)
+    for _ in range(edits):
+        op = rng.randint(0, 3)
+        pos = rng.randint(0, max(len(chars) - 1, 0))
+        if op == 0 and chars:
+            del chars[pos]
+        elif op == 1:
+            chars.insert(pos, rng.choice(alphabet))
+        elif op == 2 and chars:
+            chars[pos] = rng.choice(alphabet)
+        elif pos < len(chars) - 1:
+            chars[pos], chars[pos + 1] = chars[pos + 1], chars[pos]
+    return "".join(chars)
+
+
+def test_lookup_matches_brute_force():
+    from rapidfuzz.distance import OSA
+    from mcp_project.utils.spell_index import SymSpellIndex
+
+    rng = random.Random(3)
+    alphabet = "abc"
+    terms = sorted({"".join(rng.choices(alphabet, k=rng.randint(1, 24))) for _ in range(2000)})
+    index = SymSpellIndex(max_distance=2, prefix_length=7)
+    for term in terms:
+        index.add(term)
+
+    for _ in range(500):
+        word = _mutate(rng, rng.choice(terms), alphabet, rng.randint(0, 3))
+        expected = sorted((OSA.distance(word, t), t) for t in terms if OSA.distance(word, t) <= 2)
+        assert [(distance, term) for term, distance, _ in index.lookup(word)] == expected
+
+
+def test_correct_definition_name(paramdef_files):
+    from mcp_project.paramdef_handler.paramdef_index import ParamDefIndex
+    from mcp_project.paramdef_handler.paramdef_spelling import ParamDefSpeller
+
+    speller = ParamDefSpeller(ParamDefIndex(paramdef_files))
+
+    result = speller.correct("ComIPudDirection")
+    assert not result["exact"]
+    assert result["corrections"][0] == {
+        "name": "ComIPduDirection",
+        "distance": 1,
+        "similarity_score": result["corrections"][0]["similarity_score"],
+        "definition_paths": ["Com/ComConfig/ComIPdu/ComIPduDirection"],
+    }
+    assert result["rapidfuzz"][0]["name"] == "ComIPduDirection"
+
+    assert speller.correct("combitsize")["exact"]
+    assert speller.correct("PduRQueueDpth")["corrections"][0]["name"] == "PduRQueueDepth"
+    assert speller.correct("Xyzzy")["corrections"] == []
+
+
+def test_an_explicit_empty_index_is_kept():
+    from mcp_project.paramdef_handler.paramdef_index import ParamDefIndex
+    from mcp_project.paramdef_handler.paramdef_spelling import ParamDefSpeller
+
+    empty = ParamDefIndex([])
+    speller = ParamDefSpeller(empty)
+    assert speller._index is empty and not empty._loaded
+    assert speller.correct("Com")["corrections"] == []
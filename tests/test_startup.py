@@ -0,0 +1,69 @@
+"""
+@author: m4tice
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Modules that must only be imported when a tool first needs them
+LAZY_MODULES = {
+    "rapidfuzz",
+    "difflib",
+    "xml.etree.ElementTree",
+    "mcp_project.paramdef_handler.paramdef_utils",
+    "mcp_project.paramdef_handler.paramdef_arxml2json",
+    "mcp_project.paramdef_handler.paramdef_index",
+    "mcp_project.model_mngr.ecuc_model",
+}
+
+# Import budget for the project's own modules (fastmcp itself excluded)
+PROJECT_IMPORT_BUDGET_US = 200_000
+
+
+def _importtime(cwd) -> dict:
+    """Run `python -X importtime -c 'import mcp_server'` and return {module: (self_us, cumulative_us)}."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(REPO_ROOT / "mcp_project"), str(REPO_ROOT)])
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mcp_server"],
+        cwd=cwd, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def test_server_import_is_lazy_and_independent_of_cwd(tmp_path):
+    pytest.importorskip("fastmcp")
+
+    # Run from an unrelated directory: descriptions resolve relative to the package
+    timings = _importtime(tmp_path)
+
+    assert "mcp_server" in timings
+    assert not LAZY_MODULES & timings.keys()
+
+    project_us = sum(
+        self_us for name, (self_us, _) in timings.items()
+        if name == "mcp_server" or name.startswith("mcp_project") or name.startswith("mcp_settings")
+    )
+    assert project_us < PROJECT_IMPORT_BUDGET_US
+
+
+def test_description_registry_matches_description_files():
+    from mcp_project.utils.tool_descriptions import compile_registry, load_registry
+
+    assert load_registry() == compile_registry(), \
+        "Run `python -m mcp_project.utils.tool_descriptions` to regenerate _registry.json"